@@ -2,7 +2,7 @@
 import streamlit as st
 
 from snowflake.snowpark import Session
-from utils import render_image
+from utils import render_image, get_session
 from first_time_setup import render as render_first_time_setup, get_is_first_time_setup_dismissed
 
 # Render function
@@ -73,7 +73,7 @@ def render(session: Session):
 
 
 if __name__ == "__main__":
-    session = Session.builder.getOrCreate()
+    session = get_session()
     session.custom_package_usage_config = {"enabled": True}
 
     if not get_is_first_time_setup_dismissed(session):
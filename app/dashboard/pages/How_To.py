@@ -9,7 +9,7 @@ from snowflake.snowpark import Session
 from first_time_setup import render as render_first_time_setup, get_is_first_time_setup_dismissed
 
 # Imports from utilfunc
-from utils import save_and_render_figure, import_fonts
+from utils import save_and_render_figure, import_fonts, get_session
 # Imports from xG_timeline
 from utils import xGTimeline, shotMap, passNetwork
 
@@ -221,7 +221,7 @@ def render(session: Session):
 
 
 if __name__ == "__main__":
-    session = Session.builder.getOrCreate()
+    session = get_session()
     if not get_is_first_time_setup_dismissed(session):
         render_first_time_setup(session)
     else:
@@ -8,9 +8,11 @@ import matplotlib.pyplot as plt # Plotting library
 from snowflake.snowpark import Session
 from first_time_setup import render as render_first_time_setup, get_is_first_time_setup_dismissed
 # Import from utilsfunc
-from utils import save_and_render_figure
+from utils import save_and_render_figure, get_session
 # Import from datafunc
 from utils import dataFunc
+# Import from match_catalog
+from utils import get_match_catalog
 # Import plot classes
 from utils import xGTimeline, shotMap, passNetwork
 
@@ -23,40 +25,22 @@ def render(session: Session):
     # Page title
     st.title("Match data analysis")
 
+    # Catalog of the matches in the data folders
+    catalog = get_match_catalog()
+
     # Select box to choose competition
     competitionOption = st.radio(
         label='Choose competition',
-        options=('2022 World Cup Asian Qualifiers', 'AFF Cup 2020'),
+        options=catalog.competitions(),
         index=0
     )
 
-    if (competitionOption == '2022 World Cup Asian Qualifiers'):
-        # Select box to choose current displaying match
-        matchOption = st.selectbox(
-            label='Choose match to display visualisations',
-            options=('3 September 2021 - Saudi Arabia 3-1 Vietnam',
-                    '7 September 2021 - Vietnam 0-1 Australia',
-                    '8 October 2021 - China 3-2 Vietnam',
-                    '13 October 2021 - Oman 3-1 Vietnam',
-                    '11 November 2021 - Vietnam 0-1 Japan',
-                    '16 November 2021 - Vietnam 0-1 Saudi Arabia',
-                    '27 January 2022 - Australia 4-0 Vietnam',
-                    '1 February 2022 - Vietnam 3-1 China',
-                    '24 March 2022 - Vietnam 0-1 Oman',
-                    '29 March 2022 - Japan 1-1 Vietnam'),
-            index=0
-        )
-    elif (competitionOption == 'AFF Cup 2020'):
-        matchOption = st.selectbox(
-            label='Choose match to display visualisations',
-            options=('6 December 2021 - Laos 0-2 Vietnam',
-                    '12 December 2021 - Vietnam 3-0 Malaysia',
-                    '15 December 2021 - Indonesia 0-0 Vietnam',
-                    '19 December 2021 - Vietnam 4-0 Cambodia',
-                    '23 December 2021 - Vietnam 0-2 Thailand',
-                    '26 December 2021 - Thailand 0-0 Vietnam'),
-            index=0
-        )
+    # Select box to choose current displaying match
+    matchOption = st.selectbox(
+        label='Choose match to display visualisations',
+        options=catalog.labels(competitionOption),
+        index=0
+    )
 
     # Radio buttons to choose which visualisation to display
     vizOption = st.radio(
@@ -81,84 +65,11 @@ def render(session: Session):
     awayTeam = ""
 
     # Assign json files that belong to the chosen match
-    xgoalFile = ''
-    passnetworkFile = ''
-
-    if (competitionOption == '2022 World Cup Asian Qualifiers'):
-        directory = 'data/2022 World Cup Asian Qualifiers/'
-
-        if (matchOption == '3 September 2021 - Saudi Arabia 3-1 Vietnam'):
-            xgoalFile = 'KSA_VIE_xgoal.json'
-            passnetworkFile = 'KSA_VIE_pass.json'
-            eventsFile = 'KSA_VIE_events.json'
-        elif (matchOption == '7 September 2021 - Vietnam 0-1 Australia'):
-            xgoalFile = 'VIE_AUS_xgoal.json'
-            passnetworkFile = 'VIE_AUS_pass_matrix.json'
-            eventsFile = 'VIE_AUS_events.json'
-        elif (matchOption == '8 October 2021 - China 3-2 Vietnam'):
-            xgoalFile = 'CHN_VIE_xgoal.json'
-            passnetworkFile = 'CHN_VIE_pass_matrix.json'
-            eventsFile = 'CHN_VIE_events.json'
-        elif (matchOption == '13 October 2021 - Oman 3-1 Vietnam'):
-            xgoalFile = 'OMA_VIE_xgoal_stats.json'
-            passnetworkFile = 'OMA_VIE_pass_matrix.json'
-            eventsFile = 'OMA_VIE_events.json'
-        elif (matchOption == '11 November 2021 - Vietnam 0-1 Japan'):
-            xgoalFile = 'VIE_JPN_xgoal_stats.json'
-            passnetworkFile = 'VIE_JPN_pass_matrix.json'
-            eventsFile = 'VIE_JPN_events.json'
-        elif (matchOption == '16 November 2021 - Vietnam 0-1 Saudi Arabia'):
-            xgoalFile = 'VIE_KSA_xgoal_stats.json'
-            passnetworkFile = 'VIE_KSA_pass_matrix.json'
-            eventsFile = 'VIE_KSA_events.json'
-        elif (matchOption == '27 January 2022 - Australia 4-0 Vietnam'):
-            xgoalFile = 'AUS_VIE_xgoal_stats.json'
-            passnetworkFile = 'AUS_VIE_pass_matrix.json'
-            eventsFile = 'AUS_VIE_events.json'
-        elif (matchOption == '1 February 2022 - Vietnam 3-1 China'):
-            xgoalFile = 'VIE_CHN_xgoal_stats.json'
-            passnetworkFile = 'VIE_CHN_pass_matrix.json'
-            eventsFile = 'VIE_CHN_events.json'
-        elif (matchOption == '24 March 2022 - Vietnam 0-1 Oman'):
-            xgoalFile = 'VIE_OMA_xgoal_stats.json'
-            passnetworkFile = 'VIE_OMA_pass_matrix.json'
-            eventsFile = 'VIE_OMA_events.json'
-        elif (matchOption == '29 March 2022 - Japan 1-1 Vietnam'):
-            xgoalFile = 'JPN_VIE_xgoal_stats.json'
-            passnetworkFile = 'JPN_VIE_pass_matrix.json'
-            eventsFile = 'JPN_VIE_events.json'
-        elif (matchOption == '29 March 2022 - Japan 1-1 Vietnam'):
-            xgoalFile = 'JPN_VIE_xgoal_stats.json'
-            passnetworkFile = 'JPN_VIE_pass_matrix.json'
-            eventsFile = 'JPN_VIE_events.json'
-
-    elif (competitionOption == 'AFF Cup 2020'):
-        directory = 'data/AFF Cup 2020/'
-
-        if (matchOption == '6 December 2021 - Laos 0-2 Vietnam'):
-            xgoalFile = 'LAO_VIE_xgoal_stats.json'
-            passnetworkFile = 'LAO_VIE_pass_matrix.json'
-            eventsFile = 'LAO_VIE_events.json'
-        elif (matchOption == '12 December 2021 - Vietnam 3-0 Malaysia'):
-            xgoalFile = 'VIE_MAS_xgoal_stats.json'
-            passnetworkFile = 'VIE_MAS_pass_matrix.json'
-            eventsFile = 'VIE_MAS_events.json'
-        elif (matchOption == '15 December 2021 - Indonesia 0-0 Vietnam'):
-            xgoalFile = 'IDN_VIE_xgoal_stats.json'
-            passnetworkFile = 'IDN_VIE_pass_matrix.json'
-            eventsFile = 'IDN_VIE_events.json'
-        elif (matchOption == '19 December 2021 - Vietnam 4-0 Cambodia'):
-            xgoalFile = 'VIE_CAM_xgoal_stats.json'
-            passnetworkFile = 'VIE_CAM_pass_matrix.json'
-            eventsFile = 'VIE_CAM_events.json'
-        elif (matchOption == '23 December 2021 - Vietnam 0-2 Thailand'):
-            xgoalFile = 'VIE_THA_xgoal_stats.json'
-            passnetworkFile = 'VIE_THA_pass_matrix.json'
-            eventsFile = 'VIE_THA_events.json'
-        elif (matchOption == '26 December 2021 - Thailand 0-0 Vietnam'):
-            xgoalFile = 'THA_VIE_xgoal_stats.json'
-            passnetworkFile = 'THA_VIE_pass_matrix.json'
-            eventsFile = 'THA_VIE_events.json'
+    match = catalog.find(competitionOption, matchOption)
+    directory = match['directory']
+    xgoalFile = match['files']['xgoal_stats']
+    passnetworkFile = match['files']['pass_matrix']
+    eventsFile = match['files']['events']
 
     # Create an instance of the plot classes
     xG_timeline = xGTimeline(directory, eventsFile, xgoalFile)
@@ -268,7 +179,7 @@ def render(session: Session):
         )
 
 if __name__ == "__main__":
-    session = Session.builder.getOrCreate()
+    session = get_session()
     if not get_is_first_time_setup_dismissed(session):
         render_first_time_setup(session)
     else:
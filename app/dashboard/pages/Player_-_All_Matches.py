@@ -5,7 +5,7 @@ import matplotlib as mpl
 import matplotlib.font_manager as fm
 
 from mplsoccer import Pitch, VerticalPitch
-from utils import save_and_render_figure
+from utils import save_and_render_figure, get_match_catalog, get_event_index
 
 mpl.rcParams['figure.dpi'] = 300
 
@@ -14,40 +14,22 @@ mpl.rcParams['figure.dpi'] = 300
 # Page title
 st.title("Player's overall data")
 
-wcDirectory = 'data/2022 World Cup Asian Qualifiers/'
-affDirectory = 'data/AFF Cup 2020/'
+# Catalog of the matches in the data folders
+catalog = get_match_catalog()
 
-wcStatsList = ['AUS_VIE_stats.json', 'CHN_VIE_stats.json',
-               'JPN_VIE_stats.json', 'KSA_VIE_stats.json',
-               'OMA_VIE_stats.json', 'VIE_AUS_stats.json',
-               'VIE_CHN_stats.json', 'VIE_JPN_stats.json',
-               'VIE_KSA_stats.json', 'VIE_OMA_stats.json']
+wcCompetition = '2022 World Cup Asian Qualifiers'
+affCompetition = 'AFF Cup 2020'
 
-wcEventsList = ['AUS_VIE_events.json', 'CHN_VIE_events.json',
-                'JPN_VIE_events.json', 'KSA_VIE_events.json',
-                'OMA_VIE_events.json', 'VIE_AUS_events.json',
-                'VIE_CHN_events.json', 'VIE_JPN_events.json',
-                'VIE_KSA_events.json', 'VIE_OMA_events.json']
+wcDirectory = catalog.directory(wcCompetition)
+affDirectory = catalog.directory(affCompetition)
 
-wcXGoalsList = ['AUS_VIE_xgoal_stats.json', 'CHN_VIE_xgoal.json',
-                'JPN_VIE_xgoal_stats.json', 'KSA_VIE_xgoal.json',
-                'OMA_VIE_xgoal_stats.json', 'VIE_AUS_xgoal.json',
-                'VIE_CHN_xgoal_stats.json', 'VIE_JPN_xgoal_stats.json',
-                'VIE_KSA_xgoal_stats.json', 'VIE_OMA_xgoal_stats.json']
+# Files of every match of each competition, found by the catalog
+wcStatsList = catalog.files(wcCompetition, 'stats')
+wcXGoalsList = catalog.files(wcCompetition, 'xgoal_stats')
 
-affStatsList = ['IDN_VIE_stats.json', 'LAO_VIE_stats.json',
-                'THA_VIE_stats.json', 'VIE_CAM_stats.json',
-                'VIE_MAS_stats.json', 'VIE_THA_stats.json']
+affStatsList = catalog.files(affCompetition, 'stats')
+affXGoalsList = catalog.files(affCompetition, 'xgoal_stats')
 
-affEventsList = ['IDN_VIE_events.json', 'LAO_VIE_events.json',
-                 'THA_VIE_events.json', 'VIE_CAM_events.json',
-                 'VIE_MAS_events.json', 'VIE_THA_events.json']
-
-affXGoalsList = ['IDN_VIE_xgoal_stats.json', 'LAO_VIE_xgoal_stats.json',
-                 'THA_VIE_xgoal_stats.json', 'VIE_CAM_xgoal_stats.json',
-                 'VIE_MAS_xgoal_stats.json', 'VIE_THA_xgoal_stats.json']
-
-# Import the fonts from the same folder as this code
 robotoRegular = fm.FontProperties(fname='./Roboto-Regular.ttf')
 robotoBold = fm.FontProperties(fname='./Roboto-Bold.ttf')
 
@@ -217,6 +199,31 @@ def playersListExtractor(directory1, files_list1, directory2, files_list2, chose
         return playersList
 
 
+# Function to find the chosen player's events in the chosen competition
+def find_player_events(competitionOption, playerId, typeIds):
+    """
+    This function finds the events of a player with the given types in every match of the chosen competition,
+    using the inverted event index of each competition instead of scanning the events files.
+
+    :param str competitionOption: The chosen competition, or 'All competitions'.
+    :param str playerId: The Opta player ID.
+    :param list typeIds: The Opta type IDs of the events.
+
+    :return list: The event store and the rows of the events of every match the player has such events in.
+    """
+    if (competitionOption == 'All competitions'):
+        competitions = catalog.competitions()
+    else:
+        competitions = [competitionOption]
+
+    playerEvents = []
+    for competition in competitions:
+        index = get_event_index(catalog.directory(competition), catalog.files(competition, 'events'))
+        playerEvents += index.find(playerId, typeIds)
+
+    return playerEvents
+
+
 col1, col2 = st.columns(2)
 
 with col1:
@@ -408,165 +415,31 @@ with st.spinner("The app is trying its hardest to bring you the best viz!"):
 
         touches_data = []
 
-        if (competitionOption == '2022 World Cup Asian Qualifiers'):
-
-            competition_info = competitionOption
-
-            for eventsFile in wcEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(wcDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for touch in event:
-                    isqualifier = False
-
-                    if ("playerId" in touch) and (touch["playerId"] == idOption):
-
-                        if (touch["typeId"] in outfield_typeId):
-
-                            for qualifier in touch['qualifier']:
-                                if (qualifier['qualifierId'] == 123):
-                                    isqualifier = True
-                                    break
-
-                            if (isqualifier == False):
-
-                                touch_period = touch["periodId"]
-                                touch_min = touch["timeMin"]
-                                touch_sec = touch["timeSec"]
-                                touch_type = touch["typeId"]
-
-                                x_start = touch["x"]
-                                y_start = touch["y"]
-
-                                touch_outcome = touch["outcome"]
-
-                                touches_data.append(
-                                    [touch_period, touch_min, touch_sec, touch_type, x_start, y_start, touch_outcome])
-
-        elif (competitionOption == 'AFF Cup 2020'):
-
-            competition_info = competitionOption
-
-            for eventsFile in affEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(affDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for touch in event:
-                    isqualifier = False
-
-                    if ("playerId" in touch) and (touch["playerId"] == idOption):
-
-                        if (touch["typeId"] in outfield_typeId):
-
-                            for qualifier in touch['qualifier']:
-                                if (qualifier['qualifierId'] == 123):
-                                    isqualifier = True
-                                    break
-
-                            if (isqualifier == False):
-
-                                touch_period = touch["periodId"]
-                                touch_min = touch["timeMin"]
-                                touch_sec = touch["timeSec"]
-                                touch_type = touch["typeId"]
-
-                                x_start = touch["x"]
-                                y_start = touch["y"]
-
-                                touch_outcome = touch["outcome"]
-
-                                touches_data.append(
-                                    [touch_period, touch_min, touch_sec, touch_type, x_start, y_start, touch_outcome])
-
-        elif (competitionOption == 'All competitions'):
-
+        if (competitionOption == 'All competitions'):
             competition_info = '2022 Asian Qualifiers & AFF Cup 2020'
+        else:
+            competition_info = competitionOption
 
-            for eventsFile in wcEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(wcDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for touch in event:
-                    isqualifier = False
-
-                    if ("playerId" in touch) and (touch["playerId"] == idOption):
-
-                        if (touch["typeId"] in outfield_typeId):
-
-                            for qualifier in touch['qualifier']:
-                                if (qualifier['qualifierId'] == 123):
-                                    isqualifier = True
-                                    break
-
-                            if (isqualifier == False):
-
-                                touch_period = touch["periodId"]
-                                touch_min = touch["timeMin"]
-                                touch_sec = touch["timeSec"]
-                                touch_type = touch["typeId"]
-
-                                x_start = touch["x"]
-                                y_start = touch["y"]
-
-                                touch_outcome = touch["outcome"]
-
-                                touches_data.append(
-                                    [touch_period, touch_min, touch_sec, touch_type, x_start, y_start, touch_outcome])
-
-            for eventsFile in affEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(affDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for touch in event:
-                    isqualifier = False
-
-                    if ("playerId" in touch) and (touch["playerId"] == idOption):
-
-                        if (touch["typeId"] in outfield_typeId):
+        # Read the player's touches from the event stores, through the inverted event index
+        for store, rows in find_player_events(competitionOption, idOption, outfield_typeId):
 
-                            for qualifier in touch['qualifier']:
-                                if (qualifier['qualifierId'] == 123):
-                                    isqualifier = True
-                                    break
+            # Leave out the events with qualifier 123
+            touches = store.events[rows[~store.qualifier_mask(123)[rows]]]
 
-                            if (isqualifier == False):
+            for touch in touches:
 
-                                touch_period = touch["periodId"]
-                                touch_min = touch["timeMin"]
-                                touch_sec = touch["timeSec"]
-                                touch_type = touch["typeId"]
+                touch_period = int(touch["periodId"])
+                touch_min = int(touch["timeMin"])
+                touch_sec = int(touch["timeSec"])
+                touch_type = int(touch["typeId"])
 
-                                x_start = touch["x"]
-                                y_start = touch["y"]
+                x_start = float(touch["x"])
+                y_start = float(touch["y"])
 
-                                touch_outcome = touch["outcome"]
+                touch_outcome = int(touch["outcome"])
 
-                                touches_data.append(
-                                    [touch_period, touch_min, touch_sec, touch_type, x_start, y_start, touch_outcome])
+                touches_data.append(
+                    [touch_period, touch_min, touch_sec, touch_type, x_start, y_start, touch_outcome])
 
         # Set up and draw the pitch
         pitch = Pitch(positional=True, positional_color='white',
@@ -662,341 +535,84 @@ with st.spinner("The app is trying its hardest to bring you the best viz!"):
 
         passes_data = []
 
-        if (competitionOption == '2022 World Cup Asian Qualifiers'):
-
-            competition_info = competitionOption
-
-            for eventsFile in wcEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(wcDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for passes in event:
-
-                    isqualifier = False
-
-                    if ("playerId" in passes) and (passes["playerId"] == idOption):
-
-                        if (passes["typeId"] in [1, 2]):
-
-                            isassist = 0
-                            iskeypass = 0
-
-                            if ("assist" in passes) and (passes["assist"] == 1):
-                                isassist = 1
-
-                            if ("keyPass" in passes) and (passes["keyPass"] == 1):
-                                iskeypass = 1
-
-                            if (touchOption == 'Crosses'):
-
-                                for qualifier in passes["qualifier"]:
-
-                                    if (qualifier["qualifierId"] == 5) or (qualifier["qualifierId"] == 6):
-                                        break
-                                    else:
-                                        if (qualifier["qualifierId"] == 2):
-                                            isqualifier = True
-
-                                        if (qualifier["qualifierId"] == 140):
-                                            ending_x = float(
-                                                qualifier["value"])
-
-                                        if (qualifier["qualifierId"] == 141):
-                                            ending_y = float(
-                                                qualifier["value"])
-
-                                if (isqualifier == True):
-
-                                    passes_period = passes["periodId"]
-                                    passes_min = passes["timeMin"]
-                                    passes_sec = passes["timeSec"]
-                                    passes_outcome = passes["outcome"]
-
-                                    starting_x = passes["x"]
-                                    starting_y = passes["y"]
-
-                                    passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                        isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
-
-                            elif (touchOption == 'Passes'):
-
-                                for qualifier in passes["qualifier"]:
-
-                                    if (qualifier["qualifierId"] == 140):
-                                        ending_x = float(
-                                            qualifier["value"])
-
-                                    if (qualifier["qualifierId"] == 141):
-                                        ending_y = float(
-                                            qualifier["value"])
-
-                                passes_period = passes["periodId"]
-                                passes_min = passes["timeMin"]
-                                passes_sec = passes["timeSec"]
-                                passes_outcome = passes["outcome"]
-
-                                starting_x = passes["x"]
-                                starting_y = passes["y"]
-
-                                passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                    isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
-
-        elif (competitionOption == 'AFF Cup 2020'):
-
-            competition_info = competitionOption
-
-            for eventsFile in affEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(affDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for passes in event:
-
-                    isqualifier = False
-
-                    if ("playerId" in passes) and (passes["playerId"] == idOption):
-
-                        if (passes["typeId"] in [1, 2]):
-
-                            isassist = 0
-                            iskeypass = 0
-
-                            if ("assist" in passes) and (passes["assist"] == 1):
-                                isassist = 1
-
-                            if ("keyPass" in passes) and (passes["keyPass"] == 1):
-                                iskeypass = 1
-
-                            if (touchOption == 'Crosses'):
-
-                                for qualifier in passes["qualifier"]:
-
-                                    if (qualifier["qualifierId"] == 5) or (qualifier["qualifierId"] == 6):
-                                        break
-                                    else:
-                                        if (qualifier["qualifierId"] == 2):
-                                            isqualifier = True
-
-                                        if (qualifier["qualifierId"] == 140):
-                                            ending_x = float(
-                                                qualifier["value"])
-
-                                        if (qualifier["qualifierId"] == 141):
-                                            ending_y = float(
-                                                qualifier["value"])
-
-                                if (isqualifier == True):
-
-                                    passes_period = passes["periodId"]
-                                    passes_min = passes["timeMin"]
-                                    passes_sec = passes["timeSec"]
-                                    passes_outcome = passes["outcome"]
-
-                                    starting_x = passes["x"]
-                                    starting_y = passes["y"]
-
-                                    passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                        isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
-
-                            elif (touchOption == 'Passes'):
-
-                                for qualifier in passes["qualifier"]:
-
-                                    if (qualifier["qualifierId"] == 140):
-                                        ending_x = float(
-                                            qualifier["value"])
-
-                                    if (qualifier["qualifierId"] == 141):
-                                        ending_y = float(
-                                            qualifier["value"])
-
-                                passes_period = passes["periodId"]
-                                passes_min = passes["timeMin"]
-                                passes_sec = passes["timeSec"]
-                                passes_outcome = passes["outcome"]
-
-                                starting_x = passes["x"]
-                                starting_y = passes["y"]
-
-                                passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                    isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
-
-        elif (competitionOption == 'All competitions'):
-
+        if (competitionOption == 'All competitions'):
             competition_info = '2022 Asian Qualifiers & AFF Cup 2020'
+        else:
+            competition_info = competitionOption
 
-            for eventsFile in wcEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(wcDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for passes in event:
-
-                    isqualifier = False
-
-                    if ("playerId" in passes) and (passes["playerId"] == idOption):
-
-                        if (passes["typeId"] in [1, 2]):
-
-                            isassist = 0
-                            iskeypass = 0
-
-                            if ("assist" in passes) and (passes["assist"] == 1):
-                                isassist = 1
-
-                            if ("keyPass" in passes) and (passes["keyPass"] == 1):
-                                iskeypass = 1
-
-                            if (touchOption == 'Crosses'):
-
-                                for qualifier in passes["qualifier"]:
-
-                                    if (qualifier["qualifierId"] == 5) or (qualifier["qualifierId"] == 6):
-                                        break
-                                    else:
-                                        if (qualifier["qualifierId"] == 2):
-                                            isqualifier = True
-
-                                        if (qualifier["qualifierId"] == 140):
-                                            ending_x = float(
-                                                qualifier["value"])
-
-                                        if (qualifier["qualifierId"] == 141):
-                                            ending_y = float(
-                                                qualifier["value"])
-
-                                if (isqualifier == True):
-
-                                    passes_period = passes["periodId"]
-                                    passes_min = passes["timeMin"]
-                                    passes_sec = passes["timeSec"]
-                                    passes_outcome = passes["outcome"]
-
-                                    starting_x = passes["x"]
-                                    starting_y = passes["y"]
-
-                                    passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                        isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
-
-                            elif (touchOption == 'Passes'):
-
-                                for qualifier in passes["qualifier"]:
-
-                                    if (qualifier["qualifierId"] == 140):
-                                        ending_x = float(
-                                            qualifier["value"])
-
-                                    if (qualifier["qualifierId"] == 141):
-                                        ending_y = float(
-                                            qualifier["value"])
-
-                                passes_period = passes["periodId"]
-                                passes_min = passes["timeMin"]
-                                passes_sec = passes["timeSec"]
-                                passes_outcome = passes["outcome"]
-
-                                starting_x = passes["x"]
-                                starting_y = passes["y"]
-
-                                passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                    isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
-
-            for eventsFile in affEventsList:
-
-                # Open the json file, copy its data, and then immediately close the json file
-                with open(affDirectory + eventsFile, encoding='utf-8') as jsonFile:
-                    jsonData = json.load(jsonFile)
-                    jsonFile.close()
-
-                liveData = jsonData['liveData']
-                event = liveData['event']
-
-                for passes in event:
+        # Read the player's passes from the event stores, through the inverted event index
+        for store, rows in find_player_events(competitionOption, idOption, [1, 2]):
 
-                    isqualifier = False
+            for row in rows:
 
-                    if ("playerId" in passes) and (passes["playerId"] == idOption):
+                passes = store.events[row]
+                qualifierStart = int(passes["qualifierStart"])
+                qualifiers = store.qualifiers[qualifierStart:qualifierStart + int(passes["qualifierCount"])]
 
-                        if (passes["typeId"] in [1, 2]):
+                isqualifier = False
 
-                            isassist = 0
-                            iskeypass = 0
+                isassist = 0
+                iskeypass = 0
 
-                            if ("assist" in passes) and (passes["assist"] == 1):
-                                isassist = 1
+                if (passes["assist"] == 1):
+                    isassist = 1
 
-                            if ("keyPass" in passes) and (passes["keyPass"] == 1):
-                                iskeypass = 1
+                if (passes["keyPass"] == 1):
+                    iskeypass = 1
 
-                            if (touchOption == 'Crosses'):
+                if (touchOption == 'Crosses'):
 
-                                for qualifier in passes["qualifier"]:
+                    for qualifier in qualifiers:
 
-                                    if (qualifier["qualifierId"] == 5) or (qualifier["qualifierId"] == 6):
-                                        break
-                                    else:
-                                        if (qualifier["qualifierId"] == 2):
-                                            isqualifier = True
+                        if (qualifier["qualifierId"] == 5) or (qualifier["qualifierId"] == 6):
+                            break
+                        else:
+                            if (qualifier["qualifierId"] == 2):
+                                isqualifier = True
 
-                                        if (qualifier["qualifierId"] == 140):
-                                            ending_x = float(
-                                                qualifier["value"])
+                            if (qualifier["qualifierId"] == 140):
+                                ending_x = float(
+                                    store.string(int(qualifier["value"])))
 
-                                        if (qualifier["qualifierId"] == 141):
-                                            ending_y = float(
-                                                qualifier["value"])
+                            if (qualifier["qualifierId"] == 141):
+                                ending_y = float(
+                                    store.string(int(qualifier["value"])))
 
-                                if (isqualifier == True):
+                    if (isqualifier == True):
 
-                                    passes_period = passes["periodId"]
-                                    passes_min = passes["timeMin"]
-                                    passes_sec = passes["timeSec"]
-                                    passes_outcome = passes["outcome"]
+                        passes_period = int(passes["periodId"])
+                        passes_min = int(passes["timeMin"])
+                        passes_sec = int(passes["timeSec"])
+                        passes_outcome = int(passes["outcome"])
 
-                                    starting_x = passes["x"]
-                                    starting_y = passes["y"]
+                        starting_x = float(passes["x"])
+                        starting_y = float(passes["y"])
 
-                                    passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                        isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
+                        passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
+                                            isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
 
-                            elif (touchOption == 'Passes'):
+                elif (touchOption == 'Passes'):
 
-                                for qualifier in passes["qualifier"]:
+                    for qualifier in qualifiers:
 
-                                    if (qualifier["qualifierId"] == 140):
-                                        ending_x = float(
-                                            qualifier["value"])
+                        if (qualifier["qualifierId"] == 140):
+                            ending_x = float(
+                                store.string(int(qualifier["value"])))
 
-                                    if (qualifier["qualifierId"] == 141):
-                                        ending_y = float(
-                                            qualifier["value"])
+                        if (qualifier["qualifierId"] == 141):
+                            ending_y = float(
+                                store.string(int(qualifier["value"])))
 
-                                passes_period = passes["periodId"]
-                                passes_min = passes["timeMin"]
-                                passes_sec = passes["timeSec"]
-                                passes_outcome = passes["outcome"]
+                    passes_period = int(passes["periodId"])
+                    passes_min = int(passes["timeMin"])
+                    passes_sec = int(passes["timeSec"])
+                    passes_outcome = int(passes["outcome"])
 
-                                starting_x = passes["x"]
-                                starting_y = passes["y"]
+                    starting_x = float(passes["x"])
+                    starting_y = float(passes["y"])
 
-                                passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
-                                                    isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
+                    passes_data.append([passes_period, passes_min, passes_sec, passes_outcome,
+                                        isassist, iskeypass, starting_x, starting_y, ending_x, ending_y])
 
         # Set up and draw the pitch
         pitch = Pitch(positional=True, positional_color='white',
@@ -1,11 +1,12 @@
 import streamlit as st
 import json
+import numpy as np
 import pandas as pd
 import matplotlib as mpl
 import matplotlib.font_manager as fm
 
 from mplsoccer import Pitch, VerticalPitch
-from utils import save_and_render_figure
+from utils import save_and_render_figure, eventStore, get_match_catalog
 
 mpl.rcParams['figure.dpi'] = 300
 
@@ -16,118 +17,29 @@ col1, col2 = st.columns(2)
 
 with col1:
     
+    # Catalog of the matches in the data folders
+    catalog = get_match_catalog()
+
     # Select box to choose competition
     competitionOption = st.radio(
         label='Choose competition',
-        options=('2022 World Cup Asian Qualifiers',
-                    'AFF Cup 2020'),
+        options=catalog.competitions(),
         index=0
     )
 
-    if (competitionOption == '2022 World Cup Asian Qualifiers'):
-        # Select box to choose current displaying match
-        matchOption = st.selectbox(
-            label='Choose match to display visualisations',
-            options=('3 September 2021 - Saudi Arabia 3-1 Vietnam',
-                        '7 September 2021 - Vietnam 0-1 Australia',
-                        '8 October 2021 - China 3-2 Vietnam',
-                        '13 October 2021 - Oman 3-1 Vietnam',
-                        '11 November 2021 - Vietnam 0-1 Japan',
-                        '16 November 2021 - Vietnam 0-1 Saudi Arabia',
-                        '27 January 2022 - Australia 4-0 Vietnam',
-                        '1 February 2022 - Vietnam 3-1 China',
-                        '24 March 2022 - Vietnam 0-1 Oman',
-                        '29 March 2022 - Japan 1-1 Vietnam'),
-            index=0
-        )
-    elif (competitionOption == 'AFF Cup 2020'):
-        matchOption = st.selectbox(
-            label='Choose match to display visualisations',
-            options=('6 December 2021 - Laos 0-2 Vietnam',
-                        '12 December 2021 - Vietnam 3-0 Malaysia',
-                        '15 December 2021 - Indonesia 0-0 Vietnam',
-                        '19 December 2021 - Vietnam 4-0 Cambodia',
-                        '23 December 2021 - Vietnam 0-2 Thailand',
-                        '26 December 2021 - Thailand 0-0 Vietnam'),
-            index=0
-        )
+    # Select box to choose current displaying match
+    matchOption = st.selectbox(
+        label='Choose match to display visualisations',
+        options=catalog.labels(competitionOption),
+        index=0
+    )
 
     # Assign json files that belong to the chosen match
-    xgoalFile = ''
-    eventsFile = ''
-    statsFile = ''
-
-    if (competitionOption == '2022 World Cup Asian Qualifiers'):
-        directory = 'data/2022 World Cup Asian Qualifiers/'
-
-        if (matchOption == '3 September 2021 - Saudi Arabia 3-1 Vietnam'):
-            xgoalFile = 'KSA_VIE_xgoal.json'
-            eventsFile = 'KSA_VIE_events.json'
-            statsFile = 'KSA_VIE_stats.json'
-        elif (matchOption == '7 September 2021 - Vietnam 0-1 Australia'):
-            xgoalFile = 'VIE_AUS_xgoal.json'
-            eventsFile = 'VIE_AUS_events.json'
-            statsFile = 'VIE_AUS_stats.json'
-        elif (matchOption == '8 October 2021 - China 3-2 Vietnam'):
-            xgoalFile = 'CHN_VIE_xgoal.json'
-            eventsFile = 'CHN_VIE_events.json'
-            statsFile = 'CHN_VIE_stats.json'
-        elif (matchOption == '13 October 2021 - Oman 3-1 Vietnam'):
-            xgoalFile = 'OMA_VIE_xgoal_stats.json'
-            eventsFile = 'OMA_VIE_events.json'
-            statsFile = 'OMA_VIE_stats.json'
-        elif (matchOption == '11 November 2021 - Vietnam 0-1 Japan'):
-            xgoalFile = 'VIE_JPN_xgoal_stats.json'
-            eventsFile = 'VIE_JPN_events.json'
-            statsFile = 'VIE_JPN_stats.json'
-        elif (matchOption == '16 November 2021 - Vietnam 0-1 Saudi Arabia'):
-            xgoalFile = 'VIE_KSA_xgoal_stats.json'
-            eventsFile = 'VIE_KSA_events.json'
-            statsFile = 'VIE_KSA_stats.json'
-        elif (matchOption == '27 January 2022 - Australia 4-0 Vietnam'):
-            xgoalFile = 'AUS_VIE_xgoal_stats.json'
-            eventsFile = 'AUS_VIE_events.json'
-            statsFile = 'AUS_VIE_stats.json'
-        elif (matchOption == '1 February 2022 - Vietnam 3-1 China'):
-            xgoalFile = 'VIE_CHN_xgoal_stats.json'
-            eventsFile = 'VIE_CHN_events.json'
-            statsFile = 'VIE_CHN_stats.json'
-        elif (matchOption == '24 March 2022 - Vietnam 0-1 Oman'):
-            xgoalFile = 'VIE_OMA_xgoal_stats.json'
-            eventsFile = 'VIE_OMA_events.json'
-            statsFile = 'VIE_OMA_stats.json'
-        elif (matchOption == '29 March 2022 - Japan 1-1 Vietnam'):
-            xgoalFile = 'JPN_VIE_xgoal_stats.json'
-            eventsFile = 'JPN_VIE_events.json'
-            statsFile = 'JPN_VIE_stats.json'
-
-    elif (competitionOption == 'AFF Cup 2020'):
-        directory = 'data/AFF Cup 2020/'
-
-        if (matchOption == '6 December 2021 - Laos 0-2 Vietnam'):
-            xgoalFile = 'LAO_VIE_xgoal_stats.json'
-            eventsFile = 'LAO_VIE_events.json'
-            statsFile = 'LAO_VIE_stats.json'
-        elif (matchOption == '12 December 2021 - Vietnam 3-0 Malaysia'):
-            xgoalFile = 'VIE_MAS_xgoal_stats.json'
-            eventsFile = 'VIE_MAS_events.json'
-            statsFile = 'VIE_MAS_stats.json'
-        elif (matchOption == '15 December 2021 - Indonesia 0-0 Vietnam'):
-            xgoalFile = 'IDN_VIE_xgoal_stats.json'
-            eventsFile = 'IDN_VIE_events.json'
-            statsFile = 'IDN_VIE_stats.json'
-        elif (matchOption == '19 December 2021 - Vietnam 4-0 Cambodia'):
-            xgoalFile = 'VIE_CAM_xgoal_stats.json'
-            eventsFile = 'VIE_CAM_events.json'
-            statsFile = 'VIE_CAM_stats.json'
-        elif (matchOption == '23 December 2021 - Vietnam 0-2 Thailand'):
-            xgoalFile = 'VIE_THA_xgoal_stats.json'
-            eventsFile = 'VIE_THA_events.json'
-            statsFile = 'VIE_THA_stats.json'
-        elif (matchOption == '26 December 2021 - Thailand 0-0 Vietnam'):
-            xgoalFile = 'THA_VIE_xgoal_stats.json'
-            eventsFile = 'THA_VIE_events.json'
-            statsFile = 'THA_VIE_stats.json'
+    match = catalog.find(competitionOption, matchOption)
+    directory = match['directory']
+    xgoalFile = match['files']['xgoal_stats']
+    eventsFile = match['files']['events']
+    statsFile = match['files']['stats']
 
     # Variables to store match and team's information
     matchName = ""
@@ -366,13 +278,8 @@ with col2:
             index=0
         )
 
-# Open the json file, copy its data, and then immediately close the json file
-with open(directory + eventsFile, encoding='utf-8') as jsonFile:
-    jsonData = json.load(jsonFile)
-    jsonFile.close()
-
-liveData = jsonData['liveData']
-event = liveData['event']
+# Memory-map the events of the match instead of parsing the json file
+store = eventStore(directory, eventsFile).load()
 
 viz_info = ''
 
@@ -380,34 +287,14 @@ with st.spinner("Have a bite while you are waiting for this viz!"):
 
     if (vizOption == 'Touch map'):
 
-        touches_data = []
-
-        for touch in event:
-
-            isqualifier = False
-
-            if ("playerId" in touch) and (touch["playerId"] == idOption):
-
-                if (touch["typeId"] in outfield_typeId):
-
-                    for qualifier in touch['qualifier']:
-                        if (qualifier['qualifierId'] == 123):
-                            isqualifier = True
-                            break
-
-                    if (isqualifier == False):
-                        touch_period = touch["periodId"]
-                        touch_min = touch["timeMin"]
-                        touch_sec = touch["timeSec"]
-                        touch_type = touch["typeId"]
-
-                        x_start = touch["x"]
-                        y_start = touch["y"]
+        # The player's outfield touches, without the ones with qualifier 123
+        touches = store.events[store.player_mask(idOption) & np.isin(store.events['typeId'], outfield_typeId)
+                               & ~store.qualifier_mask(123)]
 
-                        touch_outcome = touch["outcome"]
-
-                        touches_data.append(
-                            [touch_period, touch_min, touch_sec, touch_type, x_start, y_start, touch_outcome])
+        touches_data = [
+            [int(touch['periodId']), int(touch['timeMin']), int(touch['timeSec']), int(touch['typeId']),
+             float(touch['x']), float(touch['y']), int(touch['outcome'])]
+            for touch in touches]
 
         # Set up and draw the pitch
         pitch = Pitch(positional=True, positional_color='white',
@@ -505,6 +392,13 @@ with st.spinner("Have a bite while you are waiting for this viz!"):
 
         passes_data = []
 
+        # Open the json file, copy its data, and then immediately close the json file
+        with open(directory + eventsFile, encoding='utf-8') as jsonFile:
+            jsonData = json.load(jsonFile)
+            jsonFile.close()
+
+        event = jsonData['liveData']['event']
+
         for passes in event:
 
             isqualifier = False
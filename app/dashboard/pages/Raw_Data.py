@@ -6,6 +6,7 @@ import pandas as pd
 
 from snowflake.snowpark import Session
 from first_time_setup import get_is_first_time_setup_dismissed, render as render_first_time_setup
+from utils import get_session
 
 # Function to get data from Snowflake
 
@@ -15,7 +16,7 @@ def get_data(_session: Session, table_name: str) -> pd.DataFrame:
     modified_table_name: str = table_name.upper().replace(" ", "_")
     # Query to get data from Snowflake
     query = f"select * from reference('{modified_table_name}') as {modified_table_name}"
-    return session.sql(query).to_pandas()
+    return _session.sql(query).to_pandas()
 
 # Function to render the page
 
@@ -46,7 +47,7 @@ def render(session: Session):
 
 
 if __name__ == "__main__":
-    session = Session.builder.getOrCreate()
+    session = get_session()
     if not get_is_first_time_setup_dismissed(session):
         render_first_time_setup(session)
     else:
@@ -1,6 +1,11 @@
 """ This module imports the utils classes/ functions so that they can be used like
 from mplsoccer import Pitch."""
 
+from .json_cache import *
+from .json_sections import *
+from .match_catalog import *
+from .event_store import *
+from .event_index import *
 from .utilfunc import *
 from .datafunc import *
 from .xG_timeline import *
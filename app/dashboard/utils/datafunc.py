@@ -2,7 +2,10 @@
 
 # Necessary imports
 from typing import List, Tuple
-from utils import open_json
+from utils import open_json, read_json_sections, eventStore
+
+# Sections at the start of every Opta file, read together by the header accessors
+HEADER_SECTIONS = ['matchInfo', 'liveData.matchDetails']
 
 class dataFunc:
     # Constructor
@@ -14,14 +17,102 @@ class dataFunc:
         """
         This class extracts data from Opta's JSON files.
 
+        Nothing is read until the first access, and then only the sections an accessor needs are decoded
+        (see read_json_sections), so the header accessors never decode the event array. The whole file
+        is only parsed when jsonData is used.
+
         :param str directory: The directory where the JSON file is located.
         :param str jsonFile: The name of the JSON file.
         """
         self.directory = directory
         self.jsonFile = jsonFile
 
-        # Retrieve the data from the JSON file
-        self.jsonData = open_json(self.directory, self.jsonFile)
+        # Sections decoded so far, nested as in the JSON file
+        self.sections: dict = {}
+        # Whole JSON file, parsed on first use
+        self._jsonData: dict = None
+        # Event store of the JSON file, loaded on first use
+        self._eventStore: eventStore = None
+
+    # Function to get the whole JSON file
+    @property
+    def jsonData(self) -> dict:
+        """
+        This function gets the data of the whole JSON file, parsing it on first use.
+
+        :return dict: The data of the JSON file.
+        """
+        if self._jsonData is None:
+            self._jsonData = open_json(self.directory, self.jsonFile)
+
+        return self._jsonData
+
+    # Function to check whether a section is decoded
+    # Utility function
+    def has_section(self, section: str) -> bool:
+        """
+        This function checks whether a section has already been decoded.
+
+        :param str section: The dotted path of the section, e.g. 'liveData.matchDetails'.
+
+        :return bool: True if the section can be read without opening the file.
+        """
+        node = self.sections
+        for key in section.split('.'):
+            if not isinstance(node, dict) or key not in node:
+                return False
+            node = node[key]
+
+        return True
+
+    # Function to load sections of the JSON file
+    def load_sections(
+        self,
+        sections: List[str],
+    ):
+        """
+        This function decodes the given sections of the JSON file in a single read, skipping the ones already decoded.
+
+        :param List[str] sections: The dotted paths of the sections, e.g. ['matchInfo', 'liveData.lineUp'].
+        """
+        missing = [section for section in sections if not self.has_section(section)]
+        if self._jsonData is not None or not missing:
+            return
+
+        # Merge the new sections into the ones already decoded
+        decoded = read_json_sections(self.directory + self.jsonFile, missing)
+        pending = [(self.sections, decoded)]
+        while pending:
+            node, new = pending.pop()
+            for key, value in new.items():
+                if key in node and isinstance(node[key], dict) and isinstance(value, dict):
+                    pending.append((node[key], value))
+                else:
+                    node[key] = value
+
+    # Function to get a section of the JSON file
+    def get_section(
+        self,
+        section: str,
+    ) -> any:
+        """
+        This function gets a section of the JSON file, decoding it on first access.
+
+        :param str section: The dotted path of the section, e.g. 'matchInfo' or 'liveData.lineUp'.
+
+        :return: The data of the section.
+        """
+        if self._jsonData is not None:
+            node = self._jsonData
+        else:
+            # The header sections are small and next to each other, so they are decoded together
+            self.load_sections(HEADER_SECTIONS if section in HEADER_SECTIONS else [section])
+            node = self.sections
+
+        for key in section.split('.'):
+            node = node[key]
+
+        return node
 
     # Function to get the team info
     def get_team_info(
@@ -33,7 +124,7 @@ class dataFunc:
         :return Tuple[str, str]: The IDs and names of the two teams.
         """
         # Get the necessary information about the match
-        matchInfo = self.jsonData['matchInfo']
+        matchInfo = self.get_section('matchInfo')
 
         # Variable to check if the team is the home team
         isHomeTeam = False
@@ -73,7 +164,7 @@ class dataFunc:
 
         # Access the lineUp section of the json file
         # and get the lineups of both teams
-        squadList = self.jsonData['liveData']['lineUp']
+        squadList = self.get_section('liveData.lineUp')
         
         # Return data based on which_team
         if which_team == "home":
@@ -93,8 +184,7 @@ class dataFunc:
         :return Tuple[int, int]: The scores of the home and away teams.
         """
         # Get the necessary information about the match
-        liveData = self.jsonData['liveData']
-        matchDetails = liveData['matchDetails']
+        matchDetails = self.get_section('liveData.matchDetails')
 
         # Get the scores of the home and away teams
         homeScore = matchDetails['scores']['total']['home']
@@ -112,7 +202,7 @@ class dataFunc:
         :return int: The number of periods in the match.
         """
         # Get the necessary information about the match
-        matchInfo = self.jsonData['matchInfo']
+        matchInfo = self.get_section('matchInfo')
 
         # Get the number of periods in the match
         periodNo = int(matchInfo['numberOfPeriods'])
@@ -129,7 +219,7 @@ class dataFunc:
         :return str: The name of the match.
         """
         # Get the necessary information about the match
-        matchInfo = self.jsonData['matchInfo']
+        matchInfo = self.get_section('matchInfo')
 
         # Get the name of the match
         matchName = matchInfo['description']
@@ -146,9 +236,24 @@ class dataFunc:
         :return str: The name of the competition.
         """
         # Get the necessary information about the match
-        matchInfo = self.jsonData['matchInfo']
+        matchInfo = self.get_section('matchInfo')
 
         # Get the name of the competition
         compName = matchInfo['competition']['name']
 
-        return compName
\ No newline at end of file
+        return compName
+
+    # Function to get the event store
+    def get_event_store(
+        self,
+    ) -> eventStore:
+        """
+        This function gets the memory-mapped events of the JSON file, so the events can be filtered
+        with NumPy instead of looping over the parsed JSON.
+
+        :return eventStore: The loaded event store.
+        """
+        if self._eventStore is None:
+            self._eventStore = eventStore(self.directory, self.jsonFile).load()
+
+        return self._eventStore
@@ -0,0 +1,246 @@
+# This file contains the inverted index finding the events of a player across every match of a competition.
+
+# Necessary imports
+import os
+import json
+import shutil
+import tempfile
+import threading
+import numpy as np
+
+from typing import List, Tuple
+from utils import eventStore, STORE_VERSION, store_lock
+
+# Layout of one (player, type) key, pointing to a range of postings
+INDEX_KEY_DTYPE = np.dtype([
+    ('key', np.int64),  # Player index * KEY_STRIDE + typeId
+    ('start', np.int64),
+    ('count', np.int32),
+])
+
+# Layout of one posting, an event of a match
+POSTING_DTYPE = np.dtype([
+    ('match', np.int32),  # Position of the events file in the index
+    ('row', np.int32),  # Position of the event in the event store of the match
+])
+
+# Multiplier of the player index in a key, larger than any Opta type ID
+KEY_STRIDE = 1 << 16
+
+
+class eventIndex:
+    # Constructor
+    def __init__(
+        self,
+        directory: str,
+        eventsFiles: List[str],
+    ):
+        """
+        This class maps every (playerId, typeId) pair of a competition to the events it appears in.
+
+        The postings of a pair are the (match, row) positions of its events in the event stores (see eventStore),
+        stored contiguously and sorted by match then row, so the events of a player are found with a binary search
+        and read from the memory-mapped stores without opening the JSON files. The index sits in
+        data/.events/<competition>/_index/ and is built again when one of the events files changes.
+
+        :param str directory: The directory of the competition, e.g. 'data/AFF Cup 2020/'.
+        :param List[str] eventsFiles: The names of the events files to index, in the order their events are returned.
+        """
+        self.directory = directory
+        self.eventsFiles = list(eventsFiles)
+
+        folder = os.path.normpath(directory)
+        self.indexPath = os.path.join(os.path.dirname(folder), '.events', os.path.basename(folder), '_index')
+
+        # Arrays, memory-mapped by load
+        self.keys: np.ndarray = None
+        self.postings: np.ndarray = None
+        self.players: List[str] = []
+        self.playerIndex: dict = {}
+        # Event stores of the matches, loaded on first use
+        self.stores: dict = {}
+
+    # Function to get the version of the events files
+    def source_version(self) -> list:
+        """
+        This function gets the name, modification time and size of every events file.
+
+        :return list: The version the index must have been built from.
+        """
+        sources = []
+        for eventsFile in self.eventsFiles:
+            stat = os.stat(self.directory + eventsFile)
+            sources.append([eventsFile, stat.st_mtime_ns, stat.st_size])
+
+        return [STORE_VERSION, sources]
+
+    # Function to check the index
+    def is_fresh(self) -> bool:
+        """
+        This function checks whether the index exists and was built from the current events files.
+
+        :return bool: True if the index can be loaded.
+        """
+        try:
+            with open(os.path.join(self.indexPath, 'players.json'), encoding='utf-8') as playersFile:
+                return json.load(playersFile)['source'] == self.source_version()
+        except (OSError, ValueError, KeyError):
+            return False
+
+    # Function to build the index
+    def build(self):
+        """
+        This function reads the event store of every match and writes the index.
+        """
+        version = self.source_version()
+
+        players: List[str] = []
+        playerIndex: dict = {}
+        matchColumns, rowColumns, keyColumns = [], [], []
+
+        for match, eventsFile in enumerate(self.eventsFiles):
+            store = eventStore(self.directory, eventsFile).load()
+            events = store.events
+
+            # Map the string indices of the store to indices in the player list of the index
+            storePlayers = np.full(len(store.strings) + 1, -1, dtype=np.int64)
+            for stringIndex in np.unique(events['playerId']):
+                if stringIndex >= 0:
+                    playerId = store.string(int(stringIndex))
+                    if playerId not in playerIndex:
+                        playerIndex[playerId] = len(players)
+                        players.append(playerId)
+                    storePlayers[stringIndex] = playerIndex[playerId]
+
+            rows = np.flatnonzero(events['playerId'] >= 0)
+            matchColumns.append(np.full(len(rows), match, dtype=np.int32))
+            rowColumns.append(rows.astype(np.int32))
+            keyColumns.append(storePlayers[events['playerId'][rows]] * KEY_STRIDE + events['typeId'][rows])
+
+        matches = np.concatenate(matchColumns) if matchColumns else np.zeros(0, dtype=np.int32)
+        rows = np.concatenate(rowColumns) if rowColumns else np.zeros(0, dtype=np.int32)
+        keys = np.concatenate(keyColumns) if keyColumns else np.zeros(0, dtype=np.int64)
+
+        # Sort by key, then match, then row, so the postings of a key are contiguous and in match order
+        order = np.lexsort((rows, matches, keys))
+        postings = np.zeros(len(order), dtype=POSTING_DTYPE)
+        postings['match'] = matches[order]
+        postings['row'] = rows[order]
+
+        uniqueKeys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+        indexKeys = np.zeros(len(uniqueKeys), dtype=INDEX_KEY_DTYPE)
+        indexKeys['key'] = uniqueKeys
+        indexKeys['start'] = starts
+        indexKeys['count'] = counts
+
+        # Write to a temporary directory of its own, then swap it in, so a reader never sees half an index
+        os.makedirs(os.path.dirname(self.indexPath), exist_ok=True)
+        tempPath = tempfile.mkdtemp(prefix=os.path.basename(self.indexPath) + '.tmp', dir=os.path.dirname(self.indexPath))
+        try:
+            np.save(os.path.join(tempPath, 'keys.npy'), indexKeys)
+            np.save(os.path.join(tempPath, 'postings.npy'), postings)
+            with open(os.path.join(tempPath, 'players.json'), 'w', encoding='utf-8') as playersFile:
+                json.dump({'source': version, 'players': players}, playersFile)
+
+            os.makedirs(self.indexPath, exist_ok=True)
+            for file in ['keys.npy', 'postings.npy', 'players.json']:
+                os.replace(os.path.join(tempPath, file), os.path.join(self.indexPath, file))
+        finally:
+            shutil.rmtree(tempPath, ignore_errors=True)
+
+    # Function to load the index
+    def load(self) -> 'eventIndex':
+        """
+        This function memory-maps the index, building it first if it is missing or out of date.
+        Sessions loading the same index wait for the one building it (see store_lock).
+
+        :return eventIndex: The index itself, so it can be chained after the constructor.
+        """
+        with store_lock(self.indexPath):
+            if not self.is_fresh():
+                self.build()
+
+        self.keys = np.load(os.path.join(self.indexPath, 'keys.npy'), mmap_mode='r')
+        self.postings = np.load(os.path.join(self.indexPath, 'postings.npy'), mmap_mode='r')
+        with open(os.path.join(self.indexPath, 'players.json'), encoding='utf-8') as playersFile:
+            self.players = json.load(playersFile)['players']
+        self.playerIndex = {playerId: index for index, playerId in enumerate(self.players)}
+        self.stores = {}
+
+        return self
+
+    # Function to get the event store of a match
+    def get_store(self, match: int) -> eventStore:
+        """
+        This function gets the event store of a match of the index.
+
+        :param int match: The position of the events file in the index.
+
+        :return eventStore: The loaded event store.
+        """
+        if match not in self.stores:
+            self.stores[match] = eventStore(self.directory, self.eventsFiles[match]).load()
+
+        return self.stores[match]
+
+    # Function to find the events of a player
+    def find(
+        self,
+        playerId: str,
+        typeIds: List[int],
+    ) -> List[Tuple[eventStore, np.ndarray]]:
+        """
+        This function finds the events of a player with the given types in every match of the index.
+
+        :param str playerId: The Opta player ID.
+        :param List[int] typeIds: The Opta type IDs of the events.
+
+        :return List[Tuple[eventStore, np.ndarray]]: The event store and the rows of the events of every match
+            the player has such events in, in the order of the events files. The rows of a match are in event order.
+        """
+        player = self.playerIndex.get(playerId)
+        if player is None:
+            return []
+
+        wanted = player * KEY_STRIDE + np.asarray(sorted(set(typeIds)), dtype=np.int64)
+        positions = np.searchsorted(self.keys['key'], wanted)
+        found = positions < len(self.keys)
+        found[found] = self.keys['key'][positions[found]] == wanted[found]
+        positions = positions[found]
+
+        ranges = [self.postings[int(self.keys['start'][position]):int(self.keys['start'][position]) + int(self.keys['count'][position])]
+                  for position in positions]
+        if not ranges:
+            return []
+
+        postings = np.concatenate(ranges)
+        postings = postings[np.lexsort((postings['row'], postings['match']))]
+
+        # Split the postings by match
+        matches, starts = np.unique(postings['match'], return_index=True)
+        return [(self.get_store(int(match)), rows)
+                for match, rows in zip(matches, np.split(postings['row'], starts[1:]))]
+
+
+# Indexes shared by every session of the process, keyed by directory
+_shared_indexes: dict = {}
+_shared_indexes_lock = threading.Lock()
+
+
+# Function to get the shared index of a competition
+def get_event_index(directory: str, eventsFiles: List[str]) -> eventIndex:
+    """
+    This function gets the index of a competition shared by every session, loading or building it if needed.
+    Only the modification times of the events files are checked when nothing changed.
+
+    :param str directory: The directory of the competition, e.g. 'data/AFF Cup 2020/'.
+    :param List[str] eventsFiles: The names of the events files to index.
+
+    :return eventIndex: The loaded index.
+    """
+    with _shared_indexes_lock:
+        index = _shared_indexes.get(directory)
+        if index is None or index.eventsFiles != list(eventsFiles) or not index.is_fresh():
+            index = _shared_indexes[directory] = eventIndex(directory, eventsFiles).load()
+
+    return index
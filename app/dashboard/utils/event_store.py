@@ -0,0 +1,275 @@
+# This file contains the binary per-match event store memory-mapped by the dashboard instead of parsing Opta's JSON files.
+
+# Necessary imports
+import os
+import json
+import shutil
+import tempfile
+import threading
+import numpy as np
+
+from typing import List
+from utils import load_json_file
+
+# Layout of one event
+EVENT_DTYPE = np.dtype([
+    ('eventId', np.int32),
+    ('typeId', np.int16),
+    ('periodId', np.int8),
+    ('timeMin', np.int16),
+    ('timeSec', np.int8),
+    ('x', np.float32),
+    ('y', np.float32),
+    ('outcome', np.int8),
+    ('assist', np.int8),
+    ('keyPass', np.int8),
+    ('playerId', np.int32),  # Index in the string dictionary, -1 when missing
+    ('playerName', np.int32),
+    ('contestantId', np.int32),
+    ('qualifierStart', np.int32),  # First row of the event in the qualifiers array
+    ('qualifierCount', np.int16),
+])
+
+# Layout of one qualifier
+QUALIFIER_DTYPE = np.dtype([
+    ('qualifierId', np.int16),
+    ('value', np.int32),  # Index in the string dictionary, -1 when missing
+])
+
+# Version of the layout, stores written with another version are built again
+STORE_VERSION = 1
+
+# Locks of the stores and indexes, keyed by path, so two sessions of the process never build the same one at once
+_store_locks: dict = {}
+_store_locks_lock = threading.Lock()
+
+
+# Function to get the lock of a store
+def store_lock(path: str) -> threading.Lock:
+    """
+    This function gets the lock guarding the build of the store or index at a path, shared by every session.
+
+    :param str path: The path to the store or index.
+
+    :return threading.Lock: The lock of the path.
+    """
+    with _store_locks_lock:
+        return _store_locks.setdefault(os.path.normpath(path), threading.Lock())
+
+
+class eventStore:
+    # Constructor
+    def __init__(
+        self,
+        directory: str,
+        jsonFile: str,
+    ):
+        """
+        This class compiles the events of an Opta events or xgoal_stats file into NumPy arrays and memory-maps them.
+
+        The store of a file sits in data/.events/<competition>/<file name>/ and holds the events (events.npy),
+        the qualifiers of every event (qualifiers.npy) and a dictionary of the strings they refer to (strings.json).
+        It is built again when the JSON file changes.
+
+        :param str directory: The directory where the JSON file is located, e.g. 'data/AFF Cup 2020/'.
+        :param str jsonFile: The name of the JSON file.
+        """
+        self.directory = directory
+        self.jsonFile = jsonFile
+
+        folder = os.path.normpath(directory)
+        self.storePath = os.path.join(os.path.dirname(folder), '.events', os.path.basename(folder),
+                                      os.path.splitext(jsonFile)[0])
+
+        # Arrays, memory-mapped by load
+        self.events: np.ndarray = None
+        self.qualifiers: np.ndarray = None
+        self.strings: List[str] = []
+        self.stringIndex: dict = {}
+
+    # Function to get the version of the JSON file
+    def source_version(self) -> list:
+        """
+        This function gets the modification time and size of the JSON file.
+
+        :return list: The version the store must have been built from.
+        """
+        stat = os.stat(self.directory + self.jsonFile)
+
+        return [STORE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    # Function to check the store
+    def is_fresh(self) -> bool:
+        """
+        This function checks whether the store exists and was built from the current JSON file.
+
+        :return bool: True if the store can be loaded.
+        """
+        try:
+            with open(os.path.join(self.storePath, 'strings.json'), encoding='utf-8') as stringsFile:
+                return json.load(stringsFile)['source'] == self.source_version()
+        except (OSError, ValueError, KeyError):
+            return False
+
+    # Function to build the store
+    def build(self):
+        """
+        This function parses the JSON file and writes the store.
+        """
+        version = self.source_version()
+        # Parsed without the shared cache, the JSON is not needed once the store is written
+        jsonData = load_json_file(self.directory + self.jsonFile)
+        events = jsonData['liveData']['event']
+
+        strings: List[str] = []
+        stringIndex: dict = {}
+
+        def intern(value) -> int:
+            if value is None:
+                return -1
+            value = str(value)
+            if value not in stringIndex:
+                stringIndex[value] = len(strings)
+                strings.append(value)
+            return stringIndex[value]
+
+        eventArray = np.zeros(len(events), dtype=EVENT_DTYPE)
+        qualifierArray = np.zeros(sum(len(event.get('qualifier', [])) for event in events), dtype=QUALIFIER_DTYPE)
+
+        row = 0
+        for i, event in enumerate(events):
+            qualifiers = event.get('qualifier', [])
+            eventArray[i] = (
+                event.get('eventId', 0), event.get('typeId', 0), event.get('periodId', 0),
+                event.get('timeMin', 0), event.get('timeSec', 0), event.get('x', np.nan), event.get('y', np.nan),
+                event.get('outcome', -1), event.get('assist', 0), event.get('keyPass', 0),
+                intern(event.get('playerId')), intern(event.get('playerName')), intern(event.get('contestantId')),
+                row, len(qualifiers),
+            )
+            for qualifier in qualifiers:
+                qualifierArray[row] = (qualifier['qualifierId'], intern(qualifier.get('value')))
+                row += 1
+
+        # Write to a temporary directory of its own, then swap it in, so a reader never sees half a store
+        os.makedirs(os.path.dirname(self.storePath), exist_ok=True)
+        tempPath = tempfile.mkdtemp(prefix=os.path.basename(self.storePath) + '.tmp', dir=os.path.dirname(self.storePath))
+        try:
+            np.save(os.path.join(tempPath, 'events.npy'), eventArray)
+            np.save(os.path.join(tempPath, 'qualifiers.npy'), qualifierArray)
+            with open(os.path.join(tempPath, 'strings.json'), 'w', encoding='utf-8') as stringsFile:
+                json.dump({'source': version, 'strings': strings}, stringsFile)
+
+            os.makedirs(self.storePath, exist_ok=True)
+            for file in ['events.npy', 'qualifiers.npy', 'strings.json']:
+                os.replace(os.path.join(tempPath, file), os.path.join(self.storePath, file))
+        finally:
+            shutil.rmtree(tempPath, ignore_errors=True)
+
+    # Function to load the store
+    def load(self) -> 'eventStore':
+        """
+        This function memory-maps the store, building it first if it is missing or out of date.
+        Sessions loading the same store wait for the one building it.
+
+        :return eventStore: The store itself, so it can be chained after the constructor.
+        """
+        with store_lock(self.storePath):
+            if not self.is_fresh():
+                self.build()
+
+        self.events = np.load(os.path.join(self.storePath, 'events.npy'), mmap_mode='r')
+        self.qualifiers = np.load(os.path.join(self.storePath, 'qualifiers.npy'), mmap_mode='r')
+        with open(os.path.join(self.storePath, 'strings.json'), encoding='utf-8') as stringsFile:
+            self.strings = json.load(stringsFile)['strings']
+        self.stringIndex = {value: index for index, value in enumerate(self.strings)}
+
+        return self
+
+    # Function to get a string from the dictionary
+    def string(self, index: int) -> str:
+        """
+        This function gets a string from its index in the dictionary.
+
+        :param int index: The index, e.g. events['playerId'][i].
+
+        :return str: The string, or None for -1.
+        """
+        return None if index < 0 else self.strings[index]
+
+    # Function to get the index of a string
+    def string_index(self, value: str) -> int:
+        """
+        This function gets the index of a string in the dictionary.
+
+        :param str value: The string, e.g. a player ID.
+
+        :return int: The index, or -2 if the string is not in the store (so it never matches a missing value).
+        """
+        return self.stringIndex.get(value, -2)
+
+    # Function to find the events of a player
+    def player_mask(self, playerId: str) -> np.ndarray:
+        """
+        This function finds the events of a player.
+
+        :param str playerId: The Opta player ID.
+
+        :return np.ndarray: A boolean mask over the events.
+        """
+        return self.events['playerId'] == self.string_index(playerId)
+
+    # Function to find the events with a qualifier
+    def qualifier_mask(self, qualifierId: int) -> np.ndarray:
+        """
+        This function finds the events that have a qualifier.
+
+        :param int qualifierId: The Opta qualifier ID.
+
+        :return np.ndarray: A boolean mask over the events.
+        """
+        rows = np.flatnonzero(self.qualifiers['qualifierId'] == qualifierId)
+        mask = np.zeros(len(self.events), dtype=bool)
+        if len(rows):
+            # The event of each qualifier row is the last event starting at or before it
+            mask[np.searchsorted(self.events['qualifierStart'], rows, side='right') - 1] = True
+
+        return mask
+
+    # Function to get the value of a qualifier
+    def qualifier_value(self, eventIndex: int, qualifierId: int) -> str:
+        """
+        This function gets the value of a qualifier of an event.
+
+        :param int eventIndex: The position of the event.
+        :param int qualifierId: The Opta qualifier ID.
+
+        :return str: The value, or None if the event does not have the qualifier.
+        """
+        start = int(self.events['qualifierStart'][eventIndex])
+        qualifiers = self.qualifiers[start:start + int(self.events['qualifierCount'][eventIndex])]
+        for qualifier in qualifiers:
+            if qualifier['qualifierId'] == qualifierId:
+                return self.string(int(qualifier['value']))
+
+        return None
+
+
+# Function to build the stores of a data folder ahead of time
+def build_event_stores(directory: str) -> int:
+    """
+    This function builds the missing or out of date stores of every events and xgoal_stats file of a data folder.
+
+    :param str directory: The data folder, e.g. 'data/AFF Cup 2020/'.
+
+    :return int: The number of stores built.
+    """
+    built = 0
+    for jsonFile in sorted(os.listdir(directory)):
+        if jsonFile.endswith('_events.json') or jsonFile.endswith('_xgoal.json') or jsonFile.endswith('_xgoal_stats.json'):
+            store = eventStore(directory, jsonFile)
+            with store_lock(store.storePath):
+                if not store.is_fresh():
+                    store.build()
+                    built += 1
+
+    return built
@@ -0,0 +1,165 @@
+# This file contains the process-wide cache of parsed JSON files shared by every dashboard session.
+
+# Necessary imports
+import os
+import json
+import threading
+
+from collections import OrderedDict
+from typing import Callable
+
+
+# Function to parse a JSON file
+def load_json_file(path: str) -> any:
+    """
+    This function parses a JSON file.
+
+    :param str path: The path to the JSON file.
+
+    :return: The parsed data.
+    """
+    with open(path, encoding='utf-8') as jsonFile:
+        return json.load(jsonFile)
+
+
+class jsonCache:
+    # Constructor
+    def __init__(
+        self,
+        max_bytes: int = 128 * 1024 ** 2,
+    ):
+        """
+        This class keeps parsed JSON files in memory, so each file is parsed at most once per process.
+
+        Entries are keyed by path and checked against the modification time and size of the file, so an updated
+        file is parsed again. The least recently used files are evicted once the files held add up to more
+        than max_bytes on disk. The cache is thread-safe and a file requested by several sessions at the same
+        time is only parsed by the first one. The parsed data is shared, so callers must not modify it.
+
+        The budget counts the size of the files on disk, not the memory of the parsed data, which is larger:
+        about 1.6 times the file size for the bundled (indented) Opta feeds, and several times for compact JSON.
+        Size max_bytes with that ratio in mind.
+
+        :param int max_bytes: The budget of the cache, in bytes of JSON on disk. Default is 128 MB.
+        """
+        self.max_bytes = max_bytes
+
+        # path -> (version, data, size), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per file being parsed
+        self._loading: dict = {}
+
+        # Statistics
+        self.current_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    # Function to look up an entry that is still fresh
+    def _lookup(self, path: str, version: tuple) -> tuple:
+        """
+        This function returns the cached data of a file if it is still fresh. Must be called with the lock held.
+
+        :param str path: The normalised path to the file.
+        :param tuple version: The modification time and size of the file.
+
+        :return tuple: (True, data) if the file is cached, (False, None) otherwise.
+        """
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != version:
+            return False, None
+
+        self._entries.move_to_end(path)
+        self.hits += 1
+
+        return True, entry[1]
+
+    # Function to get a parsed file
+    def get(self, path: str, loader: Callable = load_json_file) -> any:
+        """
+        This function returns the parsed data of a file, parsing it only if it is not cached or has changed.
+
+        :param str path: The path to the file.
+        :param Callable loader: The function parsing the file. Default is load_json_file.
+
+        :return: The parsed data.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        version: tuple = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            found, data = self._lookup(path, version)
+            if found:
+                return data
+            load_lock = self._loading.setdefault((path, version), threading.Lock())
+
+        with load_lock:
+            # Another session may have parsed the file while this one was waiting
+            with self._lock:
+                found, data = self._lookup(path, version)
+                if found:
+                    return data
+
+            try:
+                data = loader(path)
+            except BaseException:
+                # Forget the lock of this version, so the next session tries to parse the file again
+                with self._lock:
+                    self._loading.pop((path, version), None)
+                raise
+
+            with self._lock:
+                self.misses += 1
+
+                # Replace an older version of the file
+                old = self._entries.pop(path, None)
+                if old is not None:
+                    self.current_bytes -= old[2]
+
+                # A file larger than the whole budget is returned without being cached
+                if stat.st_size <= self.max_bytes:
+                    self._entries[path] = (version, data, stat.st_size)
+                    self.current_bytes += stat.st_size
+
+                    while self.current_bytes > self.max_bytes:
+                        _, (_, _, size) = self._entries.popitem(last=False)
+                        self.current_bytes -= size
+                        self.evictions += 1
+
+                # Only forget the lock once the data is cached, so a session arriving in between finds it
+                self._loading.pop((path, version), None)
+
+        return data
+
+    # Function to empty the cache
+    def clear(self):
+        """
+        This function removes every cached file.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    # Function to get the cache statistics
+    def cache_info(self) -> dict:
+        """
+        This function returns the statistics of the cache.
+
+        :return dict: The number of hits, misses, evictions and files held, and the bytes held and allowed.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'files': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Cache shared by every session of the process. Its budget is read from DASHBOARD_JSON_CACHE_MB, in MB of JSON on disk,
+# so the parsed data it holds takes roughly 1.6 times as much memory for the bundled feeds
+shared_json_cache = jsonCache(int(os.environ.get('DASHBOARD_JSON_CACHE_MB', '128')) * 1024 ** 2)
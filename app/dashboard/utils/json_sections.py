@@ -0,0 +1,279 @@
+# This file contains the reader decoding only some sections of Opta's JSON files, e.g. matchInfo without the events.
+#
+# It is the only implementation of the reader: scripts/python/stream_json.py builds jsonStreamer on top of sectionReader.
+# The dashboard is deployed on its own (snowflake.yml only ships app/*), so the reader lives here, and it must only
+# import the standard library since the scripts load this file without the rest of the utils package.
+
+# Necessary imports
+import re
+import json
+
+from typing import List
+
+# Whitespace allowed in between JSON tokens
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Characters that open or close a container or a string
+STRUCTURAL = re.compile(r'[\[\]{}"]')
+# The rest of a string, up to and including its closing quote
+STRING_REST = re.compile(r'(?:[^"\\]|\\.)*"')
+
+
+class sectionReader:
+    # Constructor
+    def __init__(
+        self,
+        file_path: str,
+        chunk_size: int = 65536,
+    ):
+        """
+        This class reads a JSON file incrementally, decoding the wanted sections and skipping every other value
+        by matching brackets, without building it. Only a chunk of the file is held at a time, so the sections at
+        the start of an Opta file (matchInfo, liveData.matchDetails) are read without reading the event array.
+
+        :param str file_path: The path to the JSON file.
+        :param int chunk_size: The number of characters to read from the file at a time. Default is 65536.
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+        # Keys seen in each object walked by read_sections, keyed by dotted path
+        self.keys: dict = {}
+
+        # Reader state
+        self._file = None
+        self._buffer: str = ''
+        self._pos: int = 0
+        self._eof: bool = False
+        self._decoder = json.JSONDecoder()
+
+    # Utility function
+    def _reset(self):
+        """
+        This function empties the buffer, before reading the file from its start.
+        """
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    # Utility function
+    def _fill(self, size: int = None):
+        """
+        This function reads the next chunk of the file into the buffer, discarding what has already been consumed.
+
+        :param int size: The number of characters to read. Default is the chunk size.
+        """
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+
+        data = self._file.read(size or self.chunk_size)
+        if not data:
+            self._eof = True
+        self._buffer += data
+
+    # Utility function
+    def _skip_whitespace(self):
+        """
+        This function moves the reader past any whitespace, reading more of the file when needed.
+        """
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill()
+
+    # Utility function
+    def _expect(self, char: str):
+        """
+        This function consumes the next non-whitespace character and checks that it is the expected one.
+
+        :param str char: The expected character.
+        """
+        self._skip_whitespace()
+        if self._buffer[self._pos:self._pos + 1] != char:
+            raise ValueError(f"Invalid JSON in {self.file_path}: expected '{char}' at offset {self._pos}.")
+        self._pos += 1
+
+    # Utility function
+    def _peek(self) -> str:
+        """
+        This function returns the next non-whitespace character without consuming it.
+
+        :return str: The next character, or an empty string at the end of the file.
+        """
+        self._skip_whitespace()
+        return self._buffer[self._pos:self._pos + 1]
+
+    # Utility function
+    def _decode_value(self) -> any:
+        """
+        This function decodes the next complete JSON value, reading more of the file until the value is complete.
+
+        :return: The decoded value.
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Grow geometrically so a large value is not decoded again once per chunk
+                self._fill(max(self.chunk_size, len(self._buffer)))
+                continue
+
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+
+            self._pos = end
+            return value
+
+    # Utility function
+    def _skip_string(self):
+        """
+        This function moves the reader past the rest of a string whose opening quote has been consumed.
+        """
+        while True:
+            match = STRING_REST.match(self._buffer, self._pos)
+            if match:
+                self._pos = match.end()
+                return
+            if self._eof:
+                raise ValueError(f'Invalid JSON in {self.file_path}: unterminated string.')
+            self._fill(max(self.chunk_size, len(self._buffer)))
+
+    # Utility function
+    def _skip_value(self):
+        """
+        This function moves the reader past the next complete JSON value, matching brackets instead of building it.
+        """
+        char = self._peek()
+        if char == '"':
+            self._pos += 1
+            self._skip_string()
+            return
+        if char not in '{[':
+            # Numbers, booleans and null are short enough to decode
+            self._decode_value()
+            return
+
+        depth = 0
+        while True:
+            match = STRUCTURAL.search(self._buffer, self._pos)
+            if not match:
+                if self._eof:
+                    raise ValueError(f'Invalid JSON in {self.file_path}: unexpected end of file.')
+                self._pos = len(self._buffer)
+                self._fill()
+                continue
+
+            self._pos = match.end()
+            token = match.group()
+            if token == '"':
+                self._skip_string()
+            elif token in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    # Function to read an object
+    def _read_object(
+        self,
+        path: tuple,
+        remaining: set,
+        prefixes: set,
+        sections: dict,
+        stop_early: bool,
+    ) -> bool:
+        """
+        This function reads one object, decoding the wanted sections, walking into the objects containing one
+        and skipping the rest.
+
+        :param tuple path: The keys leading to the object.
+        :param set remaining: The paths of the sections still to decode.
+        :param set prefixes: The paths of the objects containing a wanted section.
+        :param dict sections: The decoded sections, filled in place.
+        :param bool stop_early: Whether to stop once every section has been decoded.
+
+        :return bool: True if reading can stop.
+        """
+        self._expect('{')
+        keys = self.keys.setdefault('.'.join(path), [])
+
+        while True:
+            if self._peek() == '}':
+                self._pos += 1
+                return False
+
+            key = self._decode_value()
+            self._expect(':')
+            keys.append(key)
+            child = path + (key,)
+
+            if child in remaining:
+                # Store the section at the same place as in the file
+                node = sections
+                for parent in path:
+                    node = node.setdefault(parent, {})
+                node[key] = self._decode_value()
+
+                remaining.discard(child)
+                if stop_early and not remaining:
+                    return True
+            elif child in prefixes and self._peek() == '{':
+                if self._read_object(child, remaining, prefixes, sections, stop_early):
+                    return True
+            else:
+                self._skip_value()
+
+            if self._peek() == ',':
+                self._pos += 1
+
+    # Function to decode some sections of the file
+    def read_sections(
+        self,
+        sections: List[str],
+        stop_early: bool = True,
+    ) -> dict:
+        """
+        This function decodes only the given sections of the file.
+
+        The keys seen along the way are kept in the keys attribute (e.g. keys['liveData']).
+
+        :param List[str] sections: The dotted paths of the sections, e.g. ['matchInfo', 'liveData.matchDetails'].
+        :param bool stop_early: Whether to stop reading once every section has been decoded. Default is True.
+            Set it to False to collect every key of the walked objects.
+
+        :return dict: The decoded sections, nested as in the file. Sections that are not in the file are left out.
+        """
+        wanted = {tuple(section.split('.')) for section in sections}
+        prefixes = {section[:depth] for section in wanted for depth in range(1, len(section))}
+
+        self.keys = {}
+        self._reset()
+
+        decoded: dict = {}
+        with open(self.file_path, encoding='utf-8') as self._file:
+            self._read_object((), set(wanted), prefixes, decoded, stop_early)
+
+        return decoded
+
+
+# Function to decode some sections of a JSON file
+def read_json_sections(path: str, sections: List[str], chunk_size: int = 65536) -> dict:
+    """
+    This function decodes only the given sections of a JSON file (see sectionReader).
+
+    Reading stops as soon as every section has been decoded, so the sections at the start of an Opta
+    file (matchInfo, liveData.matchDetails) are read without decoding, or even reading, the event array.
+
+    :param str path: The path to the JSON file.
+    :param List[str] sections: The dotted paths of the sections, e.g. ['matchInfo', 'liveData.matchDetails'].
+    :param int chunk_size: The number of characters to read from the file at a time. Default is 65536.
+
+    :return dict: The decoded sections, nested as in the file. Sections that are not in the file are left out.
+    """
+    return sectionReader(path, chunk_size).read_sections(sections)
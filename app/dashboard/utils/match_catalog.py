@@ -0,0 +1,281 @@
+# This file contains the catalog of the matches in the data folders, used to fill the selectboxes of the dashboard.
+
+# Necessary imports
+import os
+import threading
+
+from datetime import date
+from typing import List
+from utils import read_json_sections
+
+# Feed types and the suffixes of their file names
+FEED_SUFFIXES = [
+    ('xgoal_stats', ('_xgoal_stats.json', '_xgoal.json')),
+    ('pass_matrix', ('_pass_matrix.json', '_pass.json')),
+    ('events', ('_events.json',)),
+    ('stats', ('_stats.json',)),
+]
+FEED_TYPES = [feed for feed, _ in FEED_SUFFIXES]
+
+
+# Function to find the feed type of a file
+def feed_type(jsonFile: str) -> str:
+    """
+    This function finds the feed type of a file from its name.
+
+    :param str jsonFile: The name of the JSON file, e.g. 'KSA_VIE_pass.json'.
+
+    :return str: The feed type, or None if the file is not an Opta feed.
+    """
+    for feed, suffixes in FEED_SUFFIXES:
+        if jsonFile.endswith(suffixes):
+            return feed
+
+    return None
+
+
+class matchCatalog:
+    # Constructor
+    def __init__(
+        self,
+        dataRoot: str = 'data/',
+    ):
+        """
+        This class indexes the matches of every data folder from the matchInfo and matchDetails of their feeds.
+
+        Every competition is a folder of dataRoot, so adding a competition only needs its files. Each file is
+        read once, and only the start of it (see read_json_sections), then again only if it changes.
+        Matches are found by ID or by the label shown in the selectboxes through dictionaries.
+
+        :param str dataRoot: The directory containing the data folders. Default is 'data/'.
+        """
+        self.dataRoot = dataRoot
+
+        # Header of each file, keyed by path, with the modification time and size it was read at
+        self.fileHeaders: dict = {}
+        # Lookup tables, built by refresh
+        self.matches: dict = {}
+        self.labelIndex: dict = {}
+        self.competitionMatches: dict = {}
+
+        self._lock = threading.Lock()
+        self._signature = None
+
+    # Function to read the header of a file
+    def read_header(self, path: str) -> dict:
+        """
+        This function reads the match information of a file, without the rest of it.
+
+        :param str path: The path to the JSON file.
+
+        :return dict: The matchInfo and the liveData.matchDetails sections of the file.
+        """
+        sections = read_json_sections(path, ['matchInfo', 'liveData.matchDetails'])
+
+        return {
+            'matchInfo': sections['matchInfo'],
+            'matchDetails': sections.get('liveData', {}).get('matchDetails', {}),
+        }
+
+    # Function to scan the data folders
+    def refresh(self) -> 'matchCatalog':
+        """
+        This function scans the data folders and rebuilds the lookup tables if a file was added, changed or removed.
+        Hidden folders (e.g. the event stores) are ignored.
+
+        :return matchCatalog: The catalog itself.
+        """
+        files = []
+        for competition in sorted(os.listdir(self.dataRoot)):
+            directory = os.path.join(self.dataRoot, competition, '')
+            if competition.startswith('.') or not os.path.isdir(directory):
+                continue
+
+            for jsonFile in sorted(os.listdir(directory)):
+                feed = feed_type(jsonFile)
+                if feed is not None:
+                    stat = os.stat(directory + jsonFile)
+                    files.append((competition, jsonFile, feed, stat.st_mtime_ns, stat.st_size))
+
+        with self._lock:
+            if files == self._signature:
+                return self
+
+            matches = {}
+            fileHeaders = {}
+            for competition, jsonFile, feed, mtime, size in files:
+                directory = os.path.join(self.dataRoot, competition, '')
+                header = self.fileHeaders.get(directory + jsonFile)
+                if header is None or header['version'] != (mtime, size):
+                    header = dict(self.read_header(directory + jsonFile), version=(mtime, size))
+                fileHeaders[directory + jsonFile] = header
+
+                matchInfo = header['matchInfo']
+                match = matches.get(matchInfo['id'])
+                if match is None:
+                    match = matches[matchInfo['id']] = self.match_entry(competition, directory, header)
+                match['files'].setdefault(feed, jsonFile)
+
+            self.fileHeaders = fileHeaders
+            self.matches = matches
+            self.competitionMatches = {}
+            self.labelIndex = {}
+            for match in sorted(matches.values(), key=lambda match: (match['date'], match['label'])):
+                self.competitionMatches.setdefault(match['competition'], []).append(match)
+                self.labelIndex[(match['competition'], match['label'])] = match
+            self._signature = files
+
+        return self
+
+    # Function to build the entry of a match
+    def match_entry(
+        self,
+        competition: str,
+        directory: str,
+        header: dict,
+    ) -> dict:
+        """
+        This function builds the entry of a match from the header of one of its files.
+
+        :param str competition: The data folder of the match.
+        :param str directory: The path to the data folder.
+        :param dict header: The header of the file, from read_header.
+
+        :return dict: The entry of the match. Its files are filled in by refresh.
+        """
+        matchInfo = header['matchInfo']
+        scores = header['matchDetails'].get('scores', {}).get('total', {})
+
+        teams = {contestant['position']: contestant for contestant in matchInfo['contestant']}
+        matchDate = date.fromisoformat(matchInfo['date'][:10])
+        homeTeam = teams['home']['name']
+        awayTeam = teams['away']['name']
+        homeScore = scores.get('home')
+        awayScore = scores.get('away')
+
+        # e.g. '2 September 2021 - Saudi Arabia 3-1 Vietnam'
+        label = f'{matchDate.day} {matchDate:%B %Y} - {homeTeam} {homeScore}-{awayScore} {awayTeam}'
+
+        return {
+            'matchId': matchInfo['id'],
+            'competition': competition,
+            'competitionName': matchInfo['competition']['name'],
+            'directory': directory,
+            'date': matchDate,
+            'homeTeamId': teams['home']['id'],
+            'homeTeam': homeTeam,
+            'awayTeamId': teams['away']['id'],
+            'awayTeam': awayTeam,
+            'homeScore': homeScore,
+            'awayScore': awayScore,
+            'label': label,
+            'files': {},
+        }
+
+    # Function to get the competitions
+    def competitions(self) -> List[str]:
+        """
+        This function gets the data folders holding at least one match.
+
+        :return List[str]: The data folders, in alphabetical order.
+        """
+        return sorted(self.competitionMatches)
+
+    # Function to get the matches of a competition
+    def get_matches(self, competition: str) -> List[dict]:
+        """
+        This function gets the matches of a competition.
+
+        :param str competition: The data folder.
+
+        :return List[dict]: The entries of the matches, in chronological order.
+        """
+        return list(self.competitionMatches.get(competition, []))
+
+    # Function to get the labels of the matches of a competition
+    def labels(self, competition: str) -> List[str]:
+        """
+        This function gets the labels of the matches of a competition, to fill a selectbox.
+
+        :param str competition: The data folder.
+
+        :return List[str]: The labels, in chronological order.
+        """
+        return [match['label'] for match in self.competitionMatches.get(competition, [])]
+
+    # Function to find a match from its label
+    def find(self, competition: str, label: str) -> dict:
+        """
+        This function finds a match from the label chosen in a selectbox.
+
+        :param str competition: The data folder.
+        :param str label: The label of the match.
+
+        :return dict: The entry of the match.
+        """
+        return self.labelIndex[(competition, label)]
+
+    # Function to get a match from its ID
+    def get_match(self, matchId: str) -> dict:
+        """
+        This function gets a match from its ID.
+
+        :param str matchId: The Opta match ID.
+
+        :return dict: The entry of the match.
+        """
+        return self.matches[matchId]
+
+    # Function to get the files of a feed
+    def files(self, competition: str, feed: str) -> List[str]:
+        """
+        This function gets the files of a feed type in a competition.
+
+        :param str competition: The data folder.
+        :param str feed: The feed type.
+
+            Options:
+                - "events": Event data
+                - "pass_matrix": Pass network data
+                - "stats": General stats
+                - "xgoal_stats": Expected goal stats
+
+        :return List[str]: The names of the files, in alphabetical order.
+        """
+        if feed not in FEED_TYPES:
+            raise ValueError("Invalid feed type. Please select from the following options: 'events', 'pass_matrix', 'stats', 'xgoal_stats'.")
+
+        return sorted(match['files'][feed] for match in self.competitionMatches.get(competition, [])
+                      if feed in match['files'])
+
+    # Function to get the directory of a competition
+    def directory(self, competition: str) -> str:
+        """
+        This function gets the path to the data folder of a competition.
+
+        :param str competition: The data folder.
+
+        :return str: The path, ending with a slash, e.g. 'data/AFF Cup 2020/'.
+        """
+        return os.path.join(self.dataRoot, competition, '')
+
+
+# Catalogs shared by every session of the process, keyed by data root
+_shared_catalogs: dict = {}
+_shared_catalogs_lock = threading.Lock()
+
+
+# Function to get the shared match catalog
+def get_match_catalog(dataRoot: str = 'data/') -> matchCatalog:
+    """
+    This function gets the catalog shared by every session, refreshed so it reflects the files on disk.
+    Only the modification times of the files are checked when nothing changed.
+
+    :param str dataRoot: The directory containing the data folders. Default is 'data/'.
+
+    :return matchCatalog: The refreshed catalog.
+    """
+    with _shared_catalogs_lock:
+        catalog = _shared_catalogs.setdefault(dataRoot, matchCatalog(dataRoot))
+
+    return catalog.refresh()
@@ -5,7 +5,7 @@ from matplotlib import pyplot as plt
 from mplsoccer import Pitch
 
 # Import from utilfunc
-from utils import open_json, import_fonts
+from utils import import_fonts
 # Import from xG_timeline
 from utils import xGTimeline
 
@@ -53,25 +53,12 @@ class shotMap:
         robotoRegular, robotoBold = import_fonts()
 
         ## Get the necessary information about the match
-        # Open the json file, copy its data, and then immediately close the json file
-        jsonData = open_json(self.directory, self.eventsFile)
-        # Assign each section of the json file to a variable
-        matchInfo = jsonData['matchInfo']
-        liveData = jsonData['liveData']
-        matchDetails = liveData["matchDetails"]
+        # Only the header of the events file is decoded, not its events
+        eventsFuncs = self.xGTimeline.eventsFuncs
         # Variables to store the home and away team's scores
-        homeScore = matchDetails['scores']['total']['home']
-        awayScore = matchDetails['scores']['total']['away']
-        # Variable to check the home team
-        isHomeTeam = False
+        homeScore, awayScore = eventsFuncs.get_scores()
         # Get the necessary information about both teams
-        for contestant in matchInfo['contestant']:
-
-            if contestant['position'] == 'home':
-                homeTeam = contestant['name']
-            else:
-                if isHomeTeam == False:
-                    awayTeam = contestant['name']
+        homeTeamId, homeTeam, awayTeamId, awayTeam = eventsFuncs.get_team_info()
 
         # Create counting variables and categorise the shots
         home_goals = 0
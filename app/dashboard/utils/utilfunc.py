@@ -1,7 +1,8 @@
 # This file contains utility functions that are used in the dashboard.
 
 # Necessary imports
-import json
+import os
+import sys
 import base64
 import streamlit as st
 import matplotlib.font_manager as fm  # Import fonts
@@ -9,6 +10,44 @@ import matplotlib.font_manager as fm  # Import fonts
 from typing import Tuple
 from snowflake.snowpark import Session
 from matplotlib import pyplot as plt
+from utils import shared_json_cache
+
+
+# Function to get the session of the dashboard
+def get_session() -> Session:
+    """
+    This function gets the Snowpark session of the dashboard.
+
+    When SNOWFLAKE_LOCAL_DATABASE is set to the path of a SQLite file, the session comes from the default provider
+    of scripts/python/session_pool.py instead, so the pages, reference() and the first time setup read the tables
+    loaded by a local ingest. This only works from a clone of the repo, scripts/ is not deployed with the app.
+
+    :return Session: The session.
+    """
+    if os.environ.get('SNOWFLAKE_LOCAL_DATABASE'):
+        return get_local_session()
+
+    return Session.builder.getOrCreate()
+
+
+@st.cache_resource
+def get_local_session():
+    """
+    This function takes a local session from the default provider, kept for the life of the process
+    like the active Snowpark session, and creates the configuration table as the setup script of the app does.
+
+    :return localSession: The session.
+    """
+    repoRoot = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if repoRoot not in sys.path:
+        sys.path.append(repoRoot)
+    from scripts.python.session_pool import default_provider
+
+    session = default_provider().acquire()
+    session.sql('create schema if not exists config_data').collect()
+    session.run_script(os.path.join(repoRoot, 'app', 'sql', 'config_data-configuration.sql'))
+
+    return session
 
 
 @st.cache_data
@@ -54,14 +93,13 @@ def open_json(directory: str, file: str):
     """
     This function opens a JSON file and returns the data as a dictionary.
 
+    The file is parsed once per process and shared by every session through shared_json_cache,
+    so the returned data must not be modified.
+
     :param str directory: The directory where the JSON file is located.
     :param str file: The name of the JSON file.
     """
-    with open(directory + file, encoding='utf-8') as jsonFile:
-        jsonData = json.load(jsonFile)
-        jsonFile.close()
-
-    return jsonData
+    return shared_json_cache.get(directory + file)
 
 def import_fonts() -> Tuple[fm.FontProperties, fm.FontProperties]:
     """
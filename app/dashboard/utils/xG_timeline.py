@@ -49,18 +49,14 @@ class xGTimeline:
 
         :return pd.DataFrame: A dataframe containing the xG data.
         """
-        # Open the json file, copy its data, and then immediately close the json file
-        eventsData = open_json(self.directory, self.eventsFile)
-
-        # Assign each section of the json file to a variable
-        matchInfo = eventsData['matchInfo']
         # Variable to store the number of periods played in the match
         periodNo = self.eventsFuncs.get_num_periods()
-        liveData = eventsData['liveData']
-        events = liveData['event']
+        # Only the end of period events (type 30) are needed, read from the memory-mapped event store
+        events = self.eventsFuncs.get_event_store().events
+        periodEnds = events[events['typeId'] == 30]
 
         # For loop to get the end time of each half
-        for event in events:
+        for event in periodEnds:
 
             # Check if the number of periods played is 2 or not
             if (periodNo == 2):
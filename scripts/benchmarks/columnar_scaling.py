@@ -0,0 +1,111 @@
+# This file contains the benchmark comparing per-file pd.concat with the column builder
+#
+# Usage (from the root of the repo):
+#   python -m scripts.benchmarks.columnar_scaling --sizes 32 256 1024 4096
+
+# Necessary imports
+import time
+import argparse
+import pandas as pd
+
+from scripts.python.convert_json import converter
+from scripts.python.columnar import columnBuilder
+
+
+DATA_FOLDERS: list = ["2022 World Cup Asian Qualifiers", "AFF Cup 2020"]
+
+
+# Load the bundled files once
+def load_bundled(file_type: str) -> list:
+    """
+    Extract the mapped values of every bundled file once, so the benchmark only measures accumulation.
+
+    :param str file_type: The type of table to extract.
+
+    :return: A list of (data_from_file, num_values) tuples.
+    """
+    extracted: list = []
+    for folder in DATA_FOLDERS:
+        conv = converter(folder)
+        for file in conv.feed_files(file_type):
+            extracted.append(conv.extract_file(conv.import_json(file), file_type))
+
+    return extracted
+
+
+# Build a synthetic list of files by repeating the bundled ones
+def synthesise(extracted: list, num_files: int) -> list:
+    """
+    Repeat the bundled files until num_files files are available, giving each copy its own match ID.
+
+    :param list extracted: The extracted bundled files.
+    :param int num_files: The number of files to return.
+
+    :return: A list of (data_from_file, num_values) tuples.
+    """
+    files: list = []
+    for i in range(num_files):
+        data_from_file, num_values = extracted[i % len(extracted)]
+        data_from_file = dict(data_from_file)
+        if "matchId" in data_from_file:
+            data_from_file["matchId"] = f"synthetic{i:016d}"
+        files.append((data_from_file, num_values))
+
+    return files
+
+
+# Accumulate with one pd.concat per file (previous behaviour)
+def accumulate_concat(files: list, columns: list) -> pd.DataFrame:
+    df: pd.DataFrame = pd.DataFrame(columns=columns)
+    for data_from_file, num_values in files:
+        df = pd.concat(
+            [df, pd.DataFrame(data_from_file, index=[i for i in range(0, num_values)])], ignore_index=True)
+
+    return df
+
+
+# Accumulate with the column builder
+def accumulate_columnar(files: list, columns: list, dtypes: dict) -> pd.DataFrame:
+    builder = columnBuilder(columns, dtypes)
+    for data_from_file, num_values in files:
+        builder.append_file(data_from_file, num_values)
+
+    return builder.to_df()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-file pd.concat with the column builder.")
+    parser.add_argument("--file-type", default="match_details",
+                        help="The table to convert. Default is match_details.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 256, 1024, 4096],
+                        help="The numbers of files to accumulate.")
+    parser.add_argument("--concat-limit", type=int, default=4096,
+                        help="Skip pd.concat above this number of files, as it grows quadratically.")
+    args = parser.parse_args()
+
+    conv = converter(DATA_FOLDERS[0])
+    columns: list = conv.mapping(args.file_type, which_way="left")
+    dtypes: dict = conv.column_dtypes(args.file_type)
+    extracted: list = load_bundled(args.file_type)
+
+    print(f"{'files':>8} {'concat (s)':>12} {'us/file':>10} {'columnar (s)':>14} {'us/file':>10}")
+    for size in args.sizes:
+        files: list = synthesise(extracted, size)
+
+        start = time.perf_counter()
+        accumulate_columnar(files, columns, dtypes)
+        columnar_time = time.perf_counter() - start
+
+        if size <= args.concat_limit:
+            start = time.perf_counter()
+            accumulate_concat(files, columns)
+            concat_time = time.perf_counter() - start
+            concat_cells = f"{concat_time:>12.3f} {concat_time / size * 1e6:>10.0f}"
+        else:
+            concat_cells = f"{'skipped':>12} {'-':>10}"
+
+        print(f"{size:>8} {concat_cells} {columnar_time:>14.3f} {columnar_time / size * 1e6:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
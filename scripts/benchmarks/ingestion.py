@@ -0,0 +1,238 @@
+# This file contains the ingestion benchmark suite, measuring throughput and peak memory of every table type
+#
+# Usage (from the root of the repo):
+#   python -m scripts.benchmarks.ingestion --scales 50 500
+#   python -m scripts.benchmarks.ingestion --compare .benchmarks/ingestion-<old commit>.json
+
+# Necessary imports
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import platform
+import subprocess
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+DATA_ROOT: str = "app/dashboard/data/"
+DATA_FOLDERS: list = ["2022 World Cup Asian Qualifiers", "AFF Cup 2020"]
+FILE_TYPES: list = ["competitions", "contestants", "matches", "match_details", "players", "pass_matrix", "xgoal_stats", "events"]
+# Ways of getting a table
+METHODS: list = ["json_to_df", "load_data", "parquet_build", "parquet_read"]
+
+
+# Peak resident memory of the current process
+# Utility function
+def peak_rss_mb() -> float:
+    """
+    A utility function to get the peak resident set size of the current process.
+
+    :return float: The peak RSS in MB.
+    """
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+# Run one case in the current process
+def run_case(method: str, file_type: str, data_root: str, data_folder: str) -> dict:
+    """
+    Get one table with one method and measure it. Meant to run in a fresh process, so the peak RSS belongs to this case only.
+
+    :param str method: The way of getting the table (see METHODS).
+    :param str file_type: The table type, as accepted by converter.json_to_df.
+    :param str data_root: The directory containing the data folder.
+    :param str data_folder: The data folder.
+
+    :return dict: The measurements of the case.
+    """
+    from scripts.python.convert_json import converter
+    from scripts.python.parquet_cache import parquetCache
+
+    conv = converter(data_folder, data_root)
+    files: list = conv.feed_files(file_type)
+    num_bytes: int = sum(os.path.getsize(conv.data_path + file) for file in files)
+    cache = parquetCache(os.path.join(data_root, ".cache", ""), data_root)
+
+    if method == "load_data":
+        # The connector needs the Snowflake dependencies installed, even though reading does not connect
+        try:
+            from scripts.python.snowflake import SnowflakeConnector
+        except Exception as error:
+            return {"skipped": f"{type(error).__name__}: {error}"}
+        if data_root != DATA_ROOT:
+            return {"skipped": "load_data only reads the bundled data folders"}
+    elif method == "parquet_read" and not cache.is_fresh(file_type, data_folder):
+        # Only the read is measured
+        cache.build(file_type, data_folder)
+
+    baseline_mb: float = peak_rss_mb()
+    start: float = time.perf_counter()
+
+    if method == "json_to_df":
+        df = conv.json_to_df(file_type)
+    elif method == "load_data":
+        df = SnowflakeConnector().load_data(file_type, data_folder)
+    elif method == "parquet_build":
+        cache.build(file_type, data_folder)
+        df = cache.read(file_type, [data_folder])
+    else:
+        df = cache.read(file_type, [data_folder])
+
+    seconds: float = time.perf_counter() - start
+
+    return {
+        "files": len(files),
+        "rows": len(df),
+        "megabytes": num_bytes / 1024 ** 2,
+        "seconds": seconds,
+        "files_per_s": len(files) / seconds,
+        "rows_per_s": len(df) / seconds,
+        "mb_per_s": num_bytes / 1024 ** 2 / seconds,
+        "baseline_rss_mb": baseline_mb,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# Run one case in a fresh process
+def run_isolated(method: str, file_type: str, data_root: str, data_folder: str) -> dict:
+    """
+    Run a case in a new interpreter, so the peak RSS of earlier cases does not carry over.
+
+    :param str method: The way of getting the table (see METHODS).
+    :param str file_type: The table type, as accepted by converter.json_to_df.
+    :param str data_root: The directory containing the data folder.
+    :param str data_folder: The data folder.
+
+    :return dict: The measurements of the case.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_case, method, file_type, data_root, data_folder).result()
+
+
+# Make the synthetic data folders
+def synthetic_folders(scales: list, events_per_match: int, output_root: str) -> list:
+    """
+    Generate a synthetic data folder for every scale, unless it already exists.
+
+    :param list scales: The number of matches of each folder.
+    :param int events_per_match: The number of events per match.
+    :param str output_root: The directory to write the folders to.
+
+    :return: A list of (data root, data folder) tuples.
+    """
+    from scripts.python.synthetic_feeds import feedGenerator
+
+    datasets: list = []
+    for num_matches in scales:
+        folder: str = f"bench-{num_matches}-{events_per_match}"
+        if not os.path.isdir(os.path.join(output_root, folder)):
+            print(f"Generating {num_matches} synthetic matches in {output_root}{folder}")
+            feedGenerator(output_root, folder, num_matches, events_per_match).generate()
+        datasets.append((output_root, folder))
+
+    return datasets
+
+
+# Current commit
+# Utility function
+def git_commit() -> str:
+    """
+    A utility function to get the current commit, so results can be compared between commits.
+
+    :return str: The short hash of HEAD, with a "-dirty" suffix for uncommitted changes, or "unknown".
+    """
+    try:
+        commit: str = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty: str = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return commit + ("-dirty" if dirty.strip() else "")
+
+
+# Compare two result files
+def compare(old_path: str, new_results: dict):
+    """
+    Print the throughput and peak memory of every case relative to an earlier run.
+
+    :param str old_path: The path to the earlier results.
+    :param dict new_results: The results of the current run.
+    """
+    with open(old_path, encoding="utf-8", mode="r") as f:
+        old_results: dict = json.load(f)
+
+    old_cases: dict = {
+        (case["method"], case["data_folder"], case["file_type"]): case for case in old_results["cases"] if "seconds" in case}
+
+    print(f"\nCompared with {old_results['commit']}:")
+    print(f"{'method':<14} {'data folder':<34} {'file type':<14} {'rows/s':>9} {'peak RSS':>9}")
+    for case in new_results["cases"]:
+        old: dict = old_cases.get((case["method"], case["data_folder"], case["file_type"]))
+        if old is None or "seconds" not in case:
+            continue
+        print(f"{case['method']:<14} {case['data_folder'][:34]:<34} {case['file_type']:<14} "
+              f"{case['rows_per_s'] / old['rows_per_s']:>8.2f}x {case['peak_rss_mb'] / old['peak_rss_mb']:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the throughput and peak memory of every table type.")
+    parser.add_argument("--scales", type=int, nargs="*", default=[50],
+                        help="The number of matches of each synthetic data folder. Default is 50. Pass none to only use the bundled folders.")
+    parser.add_argument("--events-per-match", type=int, default=1700,
+                        help="The number of events per synthetic match. Default is 1700.")
+    parser.add_argument("--synthetic-root", default="synthetic_data/",
+                        help="The directory of the synthetic data folders. Default is 'synthetic_data/'.")
+    parser.add_argument("--file-types", nargs="+", default=FILE_TYPES, choices=FILE_TYPES,
+                        help="The table types to measure. Default is every table type.")
+    parser.add_argument("--methods", nargs="+", default=METHODS, choices=METHODS,
+                        help="The ways of getting the tables to measure. Default is every method.")
+    parser.add_argument("--output", default=None,
+                        help="The path to the results. Default is .benchmarks/ingestion-<commit>.json.")
+    parser.add_argument("--compare", default=None,
+                        help="The path to earlier results to compare with.")
+    args = parser.parse_args()
+
+    datasets: list = [(DATA_ROOT, folder) for folder in DATA_FOLDERS]
+    datasets += synthetic_folders(args.scales, args.events_per_match, args.synthetic_root)
+
+    results: dict = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "cases": [],
+    }
+
+    print(f"{'method':<14} {'data folder':<34} {'file type':<14} {'files/s':>9} {'rows/s':>11} {'MB/s':>8} {'peak RSS':>10}")
+    for method in args.methods:
+        for data_root, data_folder in datasets:
+            for file_type in args.file_types:
+                case: dict = {"method": method, "data_root": data_root, "data_folder": data_folder, "file_type": file_type}
+                case.update(run_isolated(method, file_type, data_root, data_folder))
+                results["cases"].append(case)
+
+                if "skipped" in case:
+                    print(f"{method:<14} {data_folder[:34]:<34} {file_type:<14} skipped ({case['skipped'][:60]})")
+                else:
+                    print(f"{method:<14} {data_folder[:34]:<34} {file_type:<14} {case['files_per_s']:>9.1f} "
+                          f"{case['rows_per_s']:>11.0f} {case['mb_per_s']:>8.1f} {case['peak_rss_mb']:>7.0f} MB")
+
+    output: str = args.output or os.path.join(".benchmarks", f"ingestion-{results['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, encoding="utf-8", mode="w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
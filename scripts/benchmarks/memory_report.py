@@ -0,0 +1,38 @@
+# This file contains the report comparing the memory usage of converted tables before and after the compact schema
+#
+# Usage (from the root of the repo):
+#   python -m scripts.benchmarks.memory_report --data-folder "AFF Cup 2020"
+
+# Necessary imports
+import argparse
+import pandas as pd
+
+from scripts.python.convert_json import converter
+from scripts.python.schema import compact_df, memory_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the memory usage of converted tables before and after the compact schema.")
+    parser.add_argument("--data-folder", default="2022 World Cup Asian Qualifiers",
+                        help="The data folder to convert. Default is 2022 World Cup Asian Qualifiers.")
+    args = parser.parse_args()
+
+    conv = converter(args.data_folder)
+    event_tables: dict = conv.event_tables()
+
+    tables: dict = {
+        "events": event_tables["events"],
+        "qualifiers": event_tables["qualifiers"],
+        "matches": conv.json_to_df("matches"),
+        "match_details": conv.json_to_df("match_details"),
+    }
+
+    pd.set_option("display.width", 160)
+    for table, df in tables.items():
+        report: pd.DataFrame = memory_report(df, compact_df(df))
+        print(f"\n{table} ({len(df)} rows)")
+        print(report.to_string(float_format=lambda value: f"{value:.1f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# This file contains the micro-benchmark comparing converter.traverse_data with the compiled path accessors
+#
+# Usage (from the root of the repo):
+#   python -m scripts.benchmarks.path_accessors --repeat 50
+
+# Necessary imports
+import time
+import argparse
+
+from scripts.python.convert_json import converter
+
+
+DATA_FOLDERS: list = ["2022 World Cup Asian Qualifiers", "AFF Cup 2020"]
+FILE_TYPES: list = ["competitions", "contestants", "matches", "match_details", "players", "pass_matrix", "xgoal_stats"]
+
+
+# Extract with the recursive traversal (previous behaviour)
+def legacy_extract(conv: converter, data: dict, json_columns: dict) -> tuple:
+    data_from_file: dict = {k: "" for k in json_columns.keys()}
+    num_values: int = 0
+
+    for key, value in json_columns.items():
+        path_dest: list = value.split(".")
+        top_level = data[path_dest[0]]
+        second_level = top_level[path_dest[1]]
+        extracted_data = conv.traverse_data(second_level, path_dest[2:])
+
+        if ("Date" in key) or ("Time" in key):
+            data_from_file[key] = extracted_data.replace("Z", "")
+        elif (key != "contestantId1") and (key != "contestantId2"):
+            data_from_file[key] = extracted_data
+        elif key == "contestantId1":
+            data_from_file[key] = extracted_data[0]
+        elif key == "contestantId2":
+            data_from_file[key] = extracted_data[1]
+
+        num_values = len(extracted_data) if isinstance(extracted_data, list) else 1
+
+    return data_from_file, num_values
+
+
+# Load the bundled files once
+def load_bundled(file_type: str) -> list:
+    """
+    Parse every bundled file of a file type once, so the benchmark only measures extraction.
+
+    :param str file_type: The type of table to extract.
+
+    :return: A list of the parsed files.
+    """
+    documents: list = []
+    for folder in DATA_FOLDERS:
+        conv = converter(folder)
+        for file in conv.feed_files(file_type):
+            documents.append(conv.import_json(file))
+
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the recursive traversal with the compiled path accessors.")
+    parser.add_argument("--repeat", type=int, default=50,
+                        help="The number of passes over the bundled files. Default is 50.")
+    args = parser.parse_args()
+
+    conv = converter(DATA_FOLDERS[0])
+
+    print(f"{'file type':<15} {'files':>6} {'traverse (ms)':>14} {'compiled (ms)':>14} {'speed-up':>9}  same output")
+    for file_type in FILE_TYPES:
+        documents: list = load_bundled(file_type)
+        json_columns: dict = conv.mapping(file_type, which_way="right", return_dict=True)
+
+        # The recursive traversal cannot handle some of the mappings
+        try:
+            legacy_output: list = [legacy_extract(conv, data, json_columns) for data in documents]
+        except (TypeError, KeyError):
+            legacy_output = None
+
+        compiled_output: list = [conv.extract_file(data, file_type) for data in documents]
+
+        if legacy_output is not None:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for data in documents:
+                    legacy_extract(conv, data, json_columns)
+            legacy_time = (time.perf_counter() - start) * 1000
+            legacy_cell = f"{legacy_time:>14.1f}"
+        else:
+            legacy_cell = f"{'fails':>14}"
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for data in documents:
+                conv.extract_file(data, file_type)
+        compiled_time = (time.perf_counter() - start) * 1000
+
+        speed_up: str = f"{legacy_time / compiled_time:>8.1f}x" if legacy_output is not None else f"{'-':>9}"
+        same: str = str(legacy_output == compiled_output) if legacy_output is not None else "-"
+        print(f"{file_type:<15} {len(documents):>6} {legacy_cell} {compiled_time:>14.1f} {speed_up}  {same}")
+
+
+if __name__ == "__main__":
+    main()
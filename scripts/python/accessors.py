@@ -0,0 +1,130 @@
+# This file contains the precompiled path accessors used to extract mapped values from Opta's JSON files
+
+# Necessary imports
+from typing import Callable
+
+
+# Keys holding a list in Opta's feeds, the values below them are extracted item by item
+LIST_KEYS: set = {"contestant", "lineUp", "player", "event", "period",
+                  "stat", "qualifier", "playerPass", "goal", "card", "substitute", "missedPen"}
+
+# Keys whose list is kept whole as a single value (see converter.traverse_data)
+WRAPPED_KEYS: set = {"qualifier", "stat", "scores", "period", "playerPass"}
+
+
+# Build the accessor for one step of a path
+def _compile_step(key: str, is_list: bool, is_wrapped: bool, following: Callable) -> Callable:
+    """
+    Build the accessor for one key of a path.
+
+    :param str key: The key to access.
+    :param bool is_list: Whether the data at this step is a list.
+    :param bool is_wrapped: Whether the value is kept whole as a single value.
+    :param Callable following: The accessor for the rest of the path.
+
+    :return Callable: The accessor for this key and the rest of the path.
+    """
+    if is_list:
+        # Extract the key from every item that has it
+        def step(data):
+            return [following(item[key]) for item in data if key in item]
+    elif is_wrapped:
+        def step(data):
+            return [following(data[key])]
+    else:
+        def step(data):
+            return following(data[key])
+
+    return step
+
+
+# Compile one dotted path
+def compile_path(path: str) -> Callable:
+    """
+    Compile a dotted path from converter.mapping into a single accessor.
+
+    The path is split and the type of each level is resolved once here,
+    so running the accessor needs no string splitting, recursion or type checks.
+
+    :param str path: The dotted path, e.g. "liveData.lineUp.player.playerId".
+
+    :return Callable: A function taking the data of a JSON file and returning the extracted value.
+    """
+    path_dest: list = path.split(".")
+    if len(path_dest) < 2:
+        raise ValueError(f"Invalid path '{path}'. Paths need at least two levels.")
+
+    def identity(data):
+        return data
+
+    # Build the accessors from the end of the path
+    accessor: Callable = identity
+    for depth in range(len(path_dest) - 1, 1, -1):
+        key: str = path_dest[depth]
+        is_list: bool = path_dest[depth - 1] in LIST_KEYS
+        is_wrapped: bool = key in WRAPPED_KEYS
+        accessor = _compile_step(key, is_list, is_wrapped, accessor)
+
+    # The two top levels (e.g. liveData.lineUp) are always objects
+    top_key: str = path_dest[0]
+    second_key: str = path_dest[1]
+    below: Callable = accessor
+
+    def root(data):
+        return below(data[top_key][second_key])
+
+    return root
+
+
+class compiledMapping:
+    # Constructor
+    def __init__(
+        self,
+        json_columns: dict
+    ):
+        """
+        Initialise the compiledMapping class.
+
+        Compiles every column of a mapping once, so the same extractor can be reused for every file.
+
+        :param dict json_columns: The mapping of columns to the flattened JSON. Inherited from converter.mapping.
+        """
+        self.columns: list = list(json_columns.keys())
+        self.extractors: list = []
+
+        for key, value in json_columns.items():
+            # Resolve the post-processing of each column once
+            if ("Date" in key) or ("Time" in key):
+                def post_process(extracted_data):
+                    return extracted_data.replace("Z", "")
+            elif key == "contestantId1":
+                def post_process(extracted_data):
+                    return extracted_data[0]
+            elif key == "contestantId2":
+                def post_process(extracted_data):
+                    return extracted_data[1]
+            else:
+                post_process = None
+
+            self.extractors.append((key, compile_path(value), post_process))
+
+    # Extract the mapped values from one file
+    def extract(self, data: dict) -> tuple:
+        """
+        Extract the mapped values from the data of one JSON file.
+
+        :param dict data: The data from the JSON file.
+
+        :return: A tuple containing the extracted values keyed by column and the number of rows they make up.
+        """
+        data_from_file: dict = {}
+        extracted_data = None
+
+        for key, accessor, post_process in self.extractors:
+            extracted_data = accessor(data)
+            data_from_file[key] = post_process(extracted_data) if post_process else extracted_data
+
+        # The number of rows follows the last column
+        num_values: int = len(extracted_data) if isinstance(extracted_data, list) else 1
+
+        return data_from_file, num_values
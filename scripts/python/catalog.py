@@ -0,0 +1,185 @@
+# This file contains the catalog indexing the Opta feeds of every data folder by match and feed type
+
+# Necessary imports
+import os
+import json
+
+from scripts.python.stream_json import jsonStreamer
+
+
+# Feed types, as accepted by converter.feed_files
+FEED_TYPES: list = ["events", "pass_matrix", "stats", "xgoal_stats"]
+
+
+class dataCatalog:
+    # Constructor
+    def __init__(
+        self,
+        index_path: str = None,
+        data_root: str = "app/dashboard/data/"
+    ):
+        """
+        Initialise the dataCatalog class.
+
+        Every JSON file under the data folders is classified once from its contents (the keys of liveData
+        and the match ID in matchInfo) rather than from its name, which is not consistent across feeds
+        (e.g. KSA_VIE_pass.json and AUS_VIE_pass_matrix.json). The index is saved to index_path and only
+        the files whose size or modification time changed are read again.
+
+        :param str index_path: The path to the index file. Default is ".ingest/catalog.json" for the bundled data
+            and ".catalog.json" inside data_root for any other directory.
+        :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
+        """
+        if index_path is None:
+            index_path = ".ingest/catalog.json" if data_root == "app/dashboard/data/" else os.path.join(data_root, ".catalog.json")
+
+        self.index_path = index_path
+        self.data_root = data_root
+
+        # Load the existing index, if any
+        self.entries: dict = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8", mode="r") as f:
+                index: dict = json.load(f)
+            if index.get("data_root") == self.data_root:
+                self.entries = index.get("files", {})
+
+        # Lookup tables, built by refresh
+        self.by_feed: dict = {}
+        self.by_match: dict = {}
+
+        self.refresh()
+
+    # Classify a file from its contents
+    # Utility function
+    def classify(self, file_path: str) -> dict:
+        """
+        A utility function to find the feed type and match of a file.
+
+        Only matchInfo and liveData.matchDetails are decoded, every other value is skipped.
+
+        :param str file_path: The path to the JSON file.
+
+        :return dict: The feed type and match ID of the file.
+        """
+        streamer = jsonStreamer(file_path)
+        sections: dict = streamer.read_sections(["matchInfo", "liveData.matchDetails"], stop_early=False)
+        live_keys: set = set(streamer.keys.get("liveData", []))
+
+        if "event" in live_keys and "lineUp" in live_keys:
+            feed: str = "xgoal_stats"
+        elif "event" in live_keys:
+            feed: str = "events"
+        elif live_keys == {"matchDetails", "lineUp"}:
+            feed: str = "pass_matrix"
+        elif "lineUp" in live_keys:
+            feed: str = "stats"
+        else:
+            raise ValueError(f"Invalid feed in {file_path}. Expected one of: {', '.join(FEED_TYPES)}.")
+
+        return {"feed": feed, "matchId": sections.get("matchInfo", {}).get("id")}
+
+    # Scan the data folders
+    def refresh(self):
+        """
+        Scan the data folders, classify the new or changed files and rebuild the lookup tables.
+
+        Hidden directories (e.g. the Parquet cache) are ignored. The index is saved when it changed.
+        """
+        found: dict = {}
+        changed: bool = False
+
+        for competition in sorted(os.listdir(self.data_root)):
+            folder_path: str = os.path.join(self.data_root, competition)
+            if competition.startswith(".") or not os.path.isdir(folder_path):
+                continue
+
+            for file in sorted(os.listdir(folder_path)):
+                if not file.endswith(".json"):
+                    continue
+
+                key: str = competition + "/" + file
+                stat = os.stat(os.path.join(folder_path, file))
+                entry: dict = self.entries.get(key)
+
+                if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                    entry = {
+                        "competition": competition,
+                        "file": file,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        **self.classify(os.path.join(folder_path, file)),
+                    }
+                    changed = True
+
+                found[key] = entry
+
+        changed = changed or found.keys() != self.entries.keys()
+        self.entries = found
+
+        # Lookup tables
+        self.by_feed = {}
+        self.by_match = {}
+        for entry in self.entries.values():
+            self.by_feed.setdefault((entry["competition"], entry["feed"]), []).append(entry["file"])
+            self.by_match.setdefault(entry["matchId"], {}).setdefault(entry["feed"], []).append(
+                (entry["competition"], entry["file"]))
+
+        if changed:
+            self.save()
+
+    # Files of a feed type in a competition
+    def files(self, competition: str, feed: str) -> list:
+        """
+        Get the files of a feed type in a data folder.
+
+        :param str competition: The data folder.
+        :param str feed: The feed type.
+
+            Options:
+            - "events": Event data.
+            - "pass_matrix": Pass network data.
+            - "stats": General stats.
+            - "xgoal_stats": Expected goal stats.
+
+        :return: A sorted list of file names.
+        """
+        if feed not in FEED_TYPES:
+            raise ValueError(
+                "Invalid feed type. Please select from the following options: 'events', 'pass_matrix', 'stats', 'xgoal_stats'")
+
+        return list(self.by_feed.get((competition, feed), []))
+
+    # Feeds of a match
+    def match_feeds(self, match_id: str) -> dict:
+        """
+        Get every feed of a match.
+
+        :param str match_id: The Opta match ID.
+
+        :return: A dict mapping each feed type to a list of (data folder, file name) tuples.
+        """
+        return {feed: list(files) for feed, files in self.by_match.get(match_id, {}).items()}
+
+    # Data folders in the catalog
+    def competitions(self) -> list:
+        """
+        Get the data folders holding at least one feed.
+
+        :return: A sorted list of data folders.
+        """
+        return sorted({entry["competition"] for entry in self.entries.values()})
+
+    # Save the index
+    def save(self):
+        """
+        Save the index, replacing the previous file atomically.
+        """
+        directory: str = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path: str = self.index_path + ".tmp"
+        with open(temp_path, encoding="utf-8", mode="w") as f:
+            json.dump({"data_root": self.data_root, "files": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.index_path)
@@ -0,0 +1,132 @@
+# This file contains the checkpoints used to resume an interrupted ingest run
+
+# Necessary imports
+import os
+import json
+import time
+import hashlib
+
+
+class ingestCheckpoints:
+    # Constructor
+    def __init__(
+        self,
+        checkpoint_path: str = ".ingest/checkpoints.json",
+        data_root: str = "app/dashboard/data/"
+    ):
+        """
+        Initialise the ingestCheckpoints class.
+
+        A checkpoint is saved as soon as one table of one batch is loaded. Batches are identified by the
+        size and modification time of their source files, so a rerun over the same files finds the same batch keys
+        and skips the tables already loaded, while a batch whose files changed gets a new key and is loaded again.
+        The checkpoints are cleared once a run completes and its files are recorded in the ingest manifest.
+
+        :param str checkpoint_path: The path to the checkpoint file. Default is ".ingest/checkpoints.json".
+        :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
+        """
+        self.checkpoint_path = checkpoint_path
+        self.data_root = data_root
+
+        # Load the existing checkpoints, if any
+        self.entries: dict = {}
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding="utf-8", mode="r") as f:
+                self.entries = json.load(f).get("batches", {})
+
+    # Key of a batch
+    # Utility function
+    def batch_key(self, files: dict) -> str:
+        """
+        A utility function to get the key of a batch from the files it is read from.
+
+        :param dict files: The names of the files of the batch, keyed by data folder.
+
+        :return str: The hex digest identifying the batch.
+        """
+        digest = hashlib.sha256()
+        for data_folder in sorted(files):
+            for file in sorted(files[data_folder]):
+                stat = os.stat(os.path.join(self.data_root, data_folder, file))
+                digest.update(f"{data_folder}\0{file}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+
+        return digest.hexdigest()
+
+    # Key of a table of a batch
+    # Utility function
+    def entry_key(self, data_folder: str, table: str, batch_key: str) -> str:
+        """
+        A utility function to get the key of a (folder, table, batch) checkpoint.
+
+        :param str data_folder: The data folder.
+        :param str table: The Snowflake table.
+        :param str batch_key: The key of the batch, from batch_key.
+
+        :return str: The key of the checkpoint.
+        """
+        return f"{data_folder}/{table}/{batch_key}"
+
+    # Check whether a table of a batch is loaded
+    def is_done(self, data_folder: str, table: str, batch_key: str) -> bool:
+        """
+        Check whether a table of a batch was loaded by an earlier attempt.
+
+        :param str data_folder: The data folder.
+        :param str table: The Snowflake table.
+        :param str batch_key: The key of the batch.
+
+        :return bool: True if the table of the batch can be skipped.
+        """
+        return self.entry_key(data_folder, table, batch_key) in self.entries
+
+    # Rows recorded for a loaded table of a batch
+    def file_rows(self, data_folder: str, table: str, batch_key: str) -> dict:
+        """
+        Get the number of rows each file produced in a table of a loaded batch.
+
+        :param str data_folder: The data folder.
+        :param str table: The Snowflake table.
+        :param str batch_key: The key of the batch.
+
+        :return dict: The number of rows keyed by "<data folder>/<file name>", empty if the batch is not loaded.
+        """
+        return dict(self.entries.get(self.entry_key(data_folder, table, batch_key), {}).get("rows", {}))
+
+    # Record a loaded table of a batch
+    def mark_done(self, data_folder: str, table: str, batch_key: str, file_rows: dict):
+        """
+        Record that a table of a batch is loaded and save the checkpoints right away.
+
+        :param str data_folder: The data folder.
+        :param str table: The Snowflake table.
+        :param str batch_key: The key of the batch.
+        :param dict file_rows: The number of rows each file produced in the table, keyed by "<data folder>/<file name>".
+        """
+        self.entries[self.entry_key(data_folder, table, batch_key)] = {
+            "rows": dict(file_rows),
+            "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self.save()
+
+    # Forget every checkpoint
+    def clear(self):
+        """
+        Forget every checkpoint and delete the checkpoint file, once a run has completed.
+        """
+        self.entries = {}
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    # Save the checkpoints
+    def save(self):
+        """
+        Save the checkpoints, replacing the previous file atomically.
+        """
+        directory: str = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path: str = self.checkpoint_path + ".tmp"
+        with open(temp_path, encoding="utf-8", mode="w") as f:
+            json.dump({"batches": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.checkpoint_path)
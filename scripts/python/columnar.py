@@ -0,0 +1,157 @@
+# This file contains the column buffers used to build DataFrames from converted JSON files
+
+# Necessary imports
+import pandas as pd
+
+
+# Make a value usable as a set member
+# Utility function
+def freeze(value: any) -> any:
+    """
+    A utility function to turn lists and dicts into tuples, recursively, so the value can be hashed.
+
+    :param any value: The value to freeze.
+
+    :return: The value, with every list and dict replaced by a tuple.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+
+    return value
+
+
+class columnBuilder:
+    # Constructor
+    def __init__(
+        self,
+        columns: list,
+        dtypes: dict = None,
+        key_columns: list = None,
+        seen_keys: set = None
+    ):
+        """
+        Initialise the columnBuilder class.
+
+        Values are appended into one Python list per column and the DataFrame is only
+        created once in to_df, so the total copying stays linear in the number of rows.
+
+        When key_columns are given, a row whose key was already appended is dropped on arrival
+        (the first occurrence is kept), so duplicated rows are never buffered.
+
+        :param list columns: The columns of the DataFrame to build.
+        :param dict dtypes: The pandas dtype of each column. Columns that are not listed keep the object dtype.
+        :param list key_columns: The columns identifying a row. Default is None (keep every row).
+        :param set seen_keys: The keys already appended, to share deduplication across builders. Default is a new set.
+        """
+        self.columns: list = list(columns)
+        self.dtypes: dict = dtypes or {}
+        self.key_columns: list = list(key_columns or [])
+        self.seen_keys: set = seen_keys if seen_keys is not None else set()
+
+        missing: list = [column for column in self.key_columns if column not in self.columns]
+        if missing:
+            raise ValueError(f"Invalid key columns. {missing} are not columns of the DataFrame.")
+
+        # One buffer per column
+        self.buffers: dict = {column: [] for column in self.columns}
+        self.num_rows: int = 0
+        self.num_duplicates: int = 0
+
+    # Check a row key against the keys already appended
+    def _is_new(self, key: tuple) -> bool:
+        """
+        Record the key of a row and check whether it was seen before.
+
+        :param tuple key: The values of the key columns.
+
+        :return bool: True if the row has to be kept.
+        """
+        try:
+            hash(key)
+        except TypeError:
+            # Lists and dicts cannot be hashed
+            key = freeze(key)
+
+        if key in self.seen_keys:
+            self.num_duplicates += 1
+            return False
+
+        self.seen_keys.add(key)
+        return True
+
+    # Append the values extracted from one file
+    def append_file(self, data_from_file: dict, num_values: int):
+        """
+        Append the values extracted from one file.
+
+        Mirrors pd.DataFrame(data_from_file, index=range(num_values)): list values
+        fill one row each and any other value is repeated on every row.
+
+        :param dict data_from_file: The extracted values, keyed by column.
+        :param int num_values: The number of rows extracted from the file.
+        """
+        for column in self.columns:
+            value = data_from_file[column]
+            if isinstance(value, list) and len(value) != num_values:
+                raise ValueError(
+                    f"Length of values ({len(value)}) for column '{column}' does not match the number of rows ({num_values}).")
+
+        # Rows to keep, None when every row is kept
+        keep: list = None
+        if self.key_columns:
+            key_values: list = [
+                data_from_file[column] if isinstance(data_from_file[column], list) else [data_from_file[column]] * num_values
+                for column in self.key_columns]
+            keep = [row for row, key in enumerate(zip(*key_values)) if self._is_new(key)]
+            if len(keep) == num_values:
+                keep = None
+
+        for column in self.columns:
+            value = data_from_file[column]
+            if isinstance(value, list):
+                self.buffers[column].extend(value if keep is None else [value[row] for row in keep])
+            else:
+                self.buffers[column].extend([value] * (num_values if keep is None else len(keep)))
+
+        self.num_rows += num_values if keep is None else len(keep)
+
+    # Append a single row
+    def append_row(self, row: dict):
+        """
+        Append a single row. Missing columns are filled with None.
+
+        :param dict row: The values of the row, keyed by column.
+        """
+        if self.key_columns and not self._is_new(tuple(row.get(column) for column in self.key_columns)):
+            return
+
+        for column in self.columns:
+            self.buffers[column].append(row.get(column))
+
+        self.num_rows += 1
+
+    # Append several rows
+    def extend_rows(self, rows: list):
+        """
+        Append several rows. Missing columns are filled with None.
+
+        :param list rows: The rows to append, each a dict keyed by column.
+        """
+        for row in rows:
+            self.append_row(row)
+
+    # Build the DataFrame
+    def to_df(self) -> pd.DataFrame:
+        """
+        Build the DataFrame from the column buffers.
+
+        :return pd.DataFrame: The DataFrame, with the declared dtypes applied.
+        """
+        data: dict = {}
+        for column in self.columns:
+            dtype = self.dtypes.get(column, object)
+            data[column] = pd.Series(self.buffers[column], dtype=dtype)
+
+        return pd.DataFrame(data, columns=self.columns)
@@ -5,12 +5,36 @@ import os
 import json
 import pandas as pd
 
+from typing import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor
+from scripts.python.stream_json import jsonStreamer
+from scripts.python.columnar import columnBuilder
+from scripts.python.accessors import compiledMapping
+from scripts.python.schema import compact_df, table_keys, table_columns, SQL_TABLES
+from scripts.python.catalog import dataCatalog
+
+
+# Directory of the bundled data folders
+DATA_ROOT: str = "app/dashboard/data/"
+
+# Tables of scripts/sql/create_db.sql loaded a batch of matches at a time, and the feeds they are read from.
+# Players are flattened from the lineUps along with the fact tables.
+FACT_FEEDS: dict = {
+    "players": ["stats", "xgoal_stats"],
+    "events": ["events"],
+    "pass_matrix": ["pass_matrix"],
+    "player_stats": ["stats"],
+    "xgoal": ["xgoal_stats"],
+    "contestant_stats": ["stats", "xgoal_stats"],
+}
+
 
 class converter:
     # Constructor
     def __init__(
         self,
-        data_folder: str
+        data_folder: str,
+        data_root: str = DATA_ROOT
     ):
         """
         Initialise the converter class.
@@ -20,21 +44,52 @@ class converter:
             Options:
             - "2022 World Cup Asian Qualifiers"
             - "AFF Cup 2020"
+            - Any folder of data_root, when data_root is not the bundled data directory (e.g. generated feeds).
+
+        :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
         """
-        if data_folder not in ["2022 World Cup Asian Qualifiers", "AFF Cup 2020"]:
+        if data_root == DATA_ROOT and data_folder not in ["2022 World Cup Asian Qualifiers", "AFF Cup 2020"]:
             raise ValueError(
                 "Invalid data folder. Please select from the following options: '2022 World Cup Asian Qualifiers', 'AFF Cup 2020'")
+        elif not os.path.isdir(os.path.join(data_root, data_folder)):
+            raise ValueError(
+                f"Invalid data folder. '{data_folder}' is not a directory of '{data_root}'.")
         else:
-            self.data_path = "app/dashboard/data/" + data_folder + "/"
+            self.data_folder = data_folder
+            self.data_root = data_root
+            self.data_path = os.path.join(data_root, data_folder, "")
+
+        # Compiled mappings, built on first use
+        self.compiled_mappings: dict = {}
+        # Catalog of the data folders, loaded on first use
+        self.catalog: dataCatalog = None
 
     # Get the list of files in the data directory
     def get_files(self) -> list:
         """
         Get the list of files in the data directory.
 
-        :return: A list of files in the data directory.
+        :return: A sorted list of files in the data directory.
+        """
+        return sorted(os.listdir(self.data_path))
+
+    # Get the files holding a table
+    def feed_files(self, file_type: str) -> list:
         """
-        return os.listdir(self.data_path)
+        Get the files of the data directory holding a table, as classified by the data catalog.
+
+        :param str file_type: The type of table, as accepted by json_to_df.
+            The competitions, contestants, matches, match_details and players tables are read from the stats and xgoal_stats feeds.
+
+        :return: A sorted list of files.
+        """
+        if self.catalog is None:
+            self.catalog = dataCatalog(data_root=self.data_root)
+
+        feeds: list = ["stats", "xgoal_stats"] if file_type in [
+            "competitions", "contestants", "matches", "match_details", "players"] else [file_type]
+
+        return sorted(file for feed in feeds for file in self.catalog.files(self.data_folder, feed))
 
     # Import JSON file
     def import_json(self, file_name: str) -> dict:
@@ -95,7 +150,7 @@ class converter:
             "matchId": "matchInfo.id",
             "contestantId": "liveData.event.contestantId",
             "playerId": "liveData.event.playerId",
-            "eventId": "liveData.event.eventid",
+            "eventId": "liveData.event.eventId",
             "typeId": "liveData.event.typeId",
             "outcome": "liveData.event.outcome",
             "periodId": "liveData.event.periodId",
@@ -115,7 +170,7 @@ class converter:
             "avgY": "liveData.lineUp.player.y",
             "passSuccess": "liveData.lineUp.player.passSuccess",
             "passLost": "liveData.lineUp.player.passLost",
-            "playerPasses": "liveData.lineUp.playerPass",
+            "playerPasses": "liveData.lineUp.player.playerPass",
         }
 
         playerStats_columns: dict = {
@@ -263,6 +318,68 @@ class converter:
                 else:
                     return list(players_columns.values())
 
+    # Primary key of a table
+    # Utility function
+    def key_columns(self, file_type: str) -> list:
+        """
+        A utility function to get the columns identifying a row, as declared by the primary key in scripts/sql/create_db.sql.
+
+        :param str file_type: The type of JSON file. Inherited from the json_to_df method.
+
+        :return: A list of columns, empty if the table has no declared primary key.
+        """
+        table: str = SQL_TABLES.get(file_type)
+        if table is None:
+            return []
+
+        return list(table_keys()[table]["primary_key"])
+
+    # Column dtypes of the converted DataFrames
+    # Utility function
+    def column_dtypes(self, file_type: str) -> dict:
+        """
+        A utility function to get the pandas dtypes of the converted columns.
+
+        Only columns holding one scalar per row are typed, columns holding nested lists keep the object dtype.
+
+        :param str file_type: The type of JSON file. Inherited from the json_to_df method.
+
+        :return: A dict mapping column names to pandas dtypes.
+        """
+        events_dtypes: dict = {
+            "matchId": "string",
+            "contestantId": "string",
+            "playerId": "string",
+            "eventId": "Int64",
+            "typeId": "Int64",
+            "outcome": "Int64",
+            "periodId": "Int64",
+            "matchMin": "Int64",
+            "matchSec": "Int64",
+            "eventX": "float64",
+            "eventY": "float64",
+            "timeStamp": "string",
+        }
+
+        match_details_dtypes: dict = {
+            "matchId": "string",
+            "numberOfPeriods": "Int64",
+            "periodLength": "Int64",
+            "overtimeLength": "Int64",
+            "matchLengthMin": "Int64",
+            "matchLengthSec": "Int64",
+        }
+
+        if file_type == "events":
+            return events_dtypes
+        elif file_type == "match_details":
+            return match_details_dtypes
+        elif file_type in ["competitions", "contestants", "matches"]:
+            # Every column of these tables is a string
+            return {column: "string" for column in self.mapping(file_type, which_way="left")}
+        else:
+            return {}
+
     # Traverse the data
     def traverse_data(self, data: str | int | float | list | dict, path_dest: list) -> any:
         """
@@ -302,8 +419,373 @@ class converter:
             # If the data is a primitive type, return it
             return data
 
+    # Flatten a batch of streamed events
+    def flatten_events(self, events: list, header: dict) -> list:
+        """
+        Flatten a batch of events into rows using the events mapping.
+
+        :param list events: The events streamed from liveData.event.
+        :param dict header: The values that precede the event array (matchInfo, liveData.matchDetails).
+
+        :return: A list of dicts, one per event, keyed by the predefined events columns.
+        """
+        # Split the paths once for the whole batch
+        json_columns: dict = self.mapping("events", return_dict=True)
+        event_paths: dict = {}
+        header_values: dict = {}
+        for key, value in json_columns.items():
+            path_dest: list = value.split(".")
+            if path_dest[:2] == ["liveData", "event"]:
+                event_paths[key] = path_dest[2]
+            else:
+                header_values[key] = self.traverse_data(header, path_dest)
+
+        # One row per event, with the match-level values repeated
+        rows: list = []
+        for event in events:
+            row: dict = dict(header_values)
+            for key, event_key in event_paths.items():
+                row[key] = event.get(event_key)
+            rows.append(row)
+
+        return rows
+
+    # Flatten the lineUp of one file into rows
+    def flatten_lineup(self, data: dict, table: str) -> list:
+        """
+        Flatten the lineUp of one pass_matrix, stats or xgoal_stats file into the rows of a fact table.
+
+        :param dict data: The data from the JSON file.
+        :param str table: The fact table.
+
+            Options:
+            - "players": One row per player, known by their match name when they have no known name.
+            - "pass_matrix": One row per player with an average position (players who did not play have none).
+            - "player_stats": One row per player, from a stats feed.
+            - "xgoal": One row per player, from an xgoal_stats feed.
+            - "contestant_stats": One row per team, with the team stats in the "stats" column.
+
+        :return: A list of dicts keyed by the columns of the table in scripts/sql/create_db.sql.
+        """
+        if table not in ["players", "pass_matrix", "player_stats", "xgoal", "contestant_stats"]:
+            raise ValueError(
+                "Invalid table. Please select from the following options: 'players', 'pass_matrix', 'player_stats', 'xgoal', 'contestant_stats'")
+
+        match_id: str = data["matchInfo"]["id"]
+
+        rows: list = []
+        for team in data["liveData"].get("lineUp", []):
+            if table == "contestant_stats":
+                rows.append({"contestantId": team["contestantId"], "matchId": match_id, "stats": team.get("stat", [])})
+                continue
+
+            for player in team.get("player", []):
+                row: dict = {"contestantId": team["contestantId"], "matchId": match_id, "playerId": player["playerId"]}
+
+                if table == "players":
+                    row.update({
+                        "playerKnownName": player.get("knownName", player.get("matchName")),
+                        "playerMatchName": player.get("matchName"),
+                    })
+                elif table == "pass_matrix":
+                    if "x" not in player:
+                        continue
+                    row.update({
+                        "avgX": player["x"],
+                        "avgY": player["y"],
+                        "passSuccess": player.get("passSuccess", 0),
+                        "passLost": player.get("passLost", 0),
+                        "playerPasses": player.get("playerPass", []),
+                    })
+                else:
+                    row["stats"] = player.get("stat", [])
+
+                rows.append(row)
+
+        return rows
+
+    # Feeds of every match in the data directory
+    def match_files(self) -> dict:
+        """
+        Get the files of every match in the data directory, as classified by the data catalog.
+
+        :return: A dict mapping each match ID to a dict of its files keyed by feed type, in match ID order.
+        """
+        if self.catalog is None:
+            self.catalog = dataCatalog(data_root=self.data_root)
+
+        matches: dict = {}
+        for match_id in sorted(self.catalog.by_match, key=str):
+            for feed, files in self.catalog.match_feeds(match_id).items():
+                for competition, file in files:
+                    if competition == self.data_folder:
+                        matches.setdefault(match_id, {}).setdefault(feed, []).append(file)
+
+        return matches
+
+    # Convert the fact tables a batch of matches at a time
+    def iter_fact_batches(self, tables: list = list(FACT_FEEDS), batch_matches: int = 8, match_ids: list = None) -> Generator[tuple, None, None]:
+        """
+        Convert the fact tables of the data directory a few matches at a time, so memory is bounded by the batch
+        rather than by the number of matches. Events are streamed, the other feeds are read one file at a time.
+
+        :param list tables: The tables to convert. Default is the players and every fact table (see FACT_FEEDS).
+        :param int batch_matches: The number of matches per batch. Default is 8.
+        :param list match_ids: The matches to convert. Default is every match of the data directory.
+
+        :return: A generator yielding (match IDs, rows per file and table, DataFrames keyed by table) tuples.
+            The DataFrames have the columns of scripts/sql/create_db.sql and one row per primary key.
+        """
+        for table in tables:
+            if table not in FACT_FEEDS:
+                raise ValueError(
+                    "Invalid table. Please select from the following options: 'players', 'events', 'pass_matrix', 'player_stats', 'xgoal', 'contestant_stats'")
+        if batch_matches < 1:
+            raise ValueError("Invalid batch size. Please provide a positive integer.")
+
+        matches: dict = self.match_files()
+        if match_ids is not None:
+            matches = {match_id: matches[match_id] for match_id in match_ids if match_id in matches}
+
+        # Typed columns, so every batch is written with the same Parquet types
+        events_dtypes: dict = self.column_dtypes("events")
+        events_dtypes["eventOutcome"] = events_dtypes.pop("outcome")
+        dtypes: dict = {
+            "events": events_dtypes,
+            "pass_matrix": {"avgX": "float64", "avgY": "float64", "passSuccess": "Int64", "passLost": "Int64"},
+        }
+
+        match_ids = list(matches)
+        for start in range(0, len(match_ids), batch_matches):
+            batch: list = match_ids[start:start + batch_matches]
+            builders: dict = {
+                table: columnBuilder(list(table_columns()[table]), dtypes.get(table), table_keys()[table]["primary_key"])
+                for table in tables}
+            file_rows: dict = {}
+
+            for match_id in batch:
+                feeds: dict = matches[match_id]
+
+                if "events" in tables:
+                    for file in feeds.get("events", []):
+                        before: int = builders["events"].num_rows
+                        streamer = jsonStreamer(self.data_path + file)
+                        for events in streamer.iter_batches():
+                            rows: list = self.flatten_events(events, streamer.header)
+                            for row in rows:
+                                row["eventOutcome"] = row.pop("outcome")
+                            builders["events"].extend_rows(rows)
+                        file_rows.setdefault(file, {})["events"] = builders["events"].num_rows - before
+
+                # Team stats are split over the stats (general) and xgoal_stats (xG) feeds
+                team_stats: dict = {}
+                for feed in ["pass_matrix", "stats", "xgoal_stats"]:
+                    feed_tables: list = [table for table in tables if table != "events" and feed in FACT_FEEDS[table]]
+                    for file in feeds.get(feed, []) if feed_tables else []:
+                        data: dict = self.import_json(file)
+                        for table in feed_tables:
+                            rows: list = self.flatten_lineup(data, table)
+                            if table == "contestant_stats":
+                                column: str = "generalStats" if feed == "stats" else "xgoalStats"
+                                for row in rows:
+                                    team_stats.setdefault((row["contestantId"], row["matchId"]), {})[column] = row["stats"]
+                                file_rows.setdefault(file, {})[table] = len(rows)
+                            else:
+                                before: int = builders[table].num_rows
+                                builders[table].extend_rows(rows)
+                                file_rows.setdefault(file, {})[table] = builders[table].num_rows - before
+
+                for (contestant_id, row_match_id), stats in team_stats.items():
+                    builders["contestant_stats"].append_row({
+                        "contestantId": contestant_id,
+                        "matchId": row_match_id,
+                        "generalStats": stats.get("generalStats", []),
+                        "xgoalStats": stats.get("xgoalStats", []),
+                    })
+
+            yield batch, file_rows, {table: builder.to_df() for table, builder in builders.items()}
+
+    # Stream the events files
+    def iter_events(self, batch_size: int = 5000) -> Generator[pd.DataFrame, None, None]:
+        """
+        Stream the events files in the data directory as flattened DataFrames.
+
+        The liveData.event array of each file is parsed incrementally, so only one batch of events
+        is held in memory at a time instead of the whole document tree.
+
+        :param int batch_size: The maximum number of rows per DataFrame. Default is 5000.
+
+        :return: A generator yielding DataFrames with the predefined events columns.
+        """
+        # Retain only the events files
+        files: list = self.feed_files("events")
+
+        # Events already streamed, so an event repeated in another file is dropped
+        seen_keys: set = set()
+        for file in files:
+            yield from self.iter_file_events(file, batch_size, seen_keys)
+
+    # Stream one events file
+    def iter_file_events(self, file_name: str, batch_size: int = 5000, seen_keys: set = None) -> Generator[pd.DataFrame, None, None]:
+        """
+        Stream one events file as flattened DataFrames.
+
+        :param str file_name: The name of the events file.
+        :param int batch_size: The maximum number of rows per DataFrame. Default is 5000.
+        :param set seen_keys: The primary keys of the events already streamed, which are skipped. Default is a new set.
+
+        :return: A generator yielding DataFrames with the predefined events columns.
+        """
+        columns: list = self.mapping("events", which_way="left")
+        dtypes: dict = self.column_dtypes("events")
+        key_columns: list = self.key_columns("events")
+        seen_keys: set = seen_keys if seen_keys is not None else set()
+
+        streamer = jsonStreamer(self.data_path + file_name)
+
+        for events in streamer.iter_batches(batch_size):
+            builder = columnBuilder(columns, dtypes, key_columns, seen_keys)
+            builder.extend_rows(self.flatten_events(events, streamer.header))
+            yield builder.to_df()
+
+    # Append one events file to column buffers
+    def append_file_events(self, builder: columnBuilder, file_name: str, batch_size: int = 5000):
+        """
+        Stream one events file into column buffers, a batch of events at a time, without building a DataFrame per batch.
+
+        :param columnBuilder builder: The column buffers, with the predefined events columns.
+        :param str file_name: The name of the events file.
+        :param int batch_size: The maximum number of events parsed at a time. Default is 5000.
+        """
+        streamer = jsonStreamer(self.data_path + file_name)
+
+        for events in streamer.iter_batches(batch_size):
+            builder.extend_rows(self.flatten_events(events, streamer.header))
+
+    # Stream one events file as separate events and qualifiers tables
+    def iter_file_event_tables(self, file_name: str, batch_size: int = 5000) -> Generator[tuple, None, None]:
+        """
+        Stream one events file as a typed events table and a narrow qualifiers table.
+
+        The qualifiers table has one row per qualifier (matchId, contestantId, eventId, qualifierId, value, numericValue),
+        so qualifier lookups become filters or joins instead of loops over each event's qualifier list.
+        Opta numbers eventId separately for each team, so qualifiers are joined to their event on
+        (matchId, contestantId, eventId), the primary key of the events table.
+
+        :param str file_name: The name of the events file.
+        :param int batch_size: The maximum number of events per batch. Default is 5000.
+
+        :return: A generator yielding (events, qualifiers) DataFrame tuples.
+        """
+        events_columns: list = [
+            column for column in self.mapping("events", which_way="left") if column != "qualifiers"]
+        events_dtypes: dict = self.column_dtypes("events")
+        qualifiers_columns: list = ["matchId", "contestantId", "eventId", "qualifierId", "value"]
+        qualifiers_dtypes: dict = {
+            "matchId": "string", "contestantId": "string", "eventId": "Int64", "qualifierId": "Int64", "value": "string"}
+
+        streamer = jsonStreamer(self.data_path + file_name)
+
+        for events in streamer.iter_batches(batch_size):
+            rows: list = self.flatten_events(events, streamer.header)
+
+            events_builder = columnBuilder(events_columns, events_dtypes)
+            events_builder.extend_rows(rows)
+
+            # Explode the qualifier list of every event
+            qualifiers_builder = columnBuilder(qualifiers_columns, qualifiers_dtypes)
+            for row in rows:
+                for qualifier in row["qualifiers"] or []:
+                    qualifiers_builder.append_row({
+                        "matchId": row["matchId"],
+                        "contestantId": row["contestantId"],
+                        "eventId": row["eventId"],
+                        "qualifierId": qualifier["qualifierId"],
+                        "value": qualifier.get("value"),
+                    })
+
+            qualifiers: pd.DataFrame = qualifiers_builder.to_df()
+            qualifiers["numericValue"] = pd.to_numeric(
+                qualifiers["value"], errors="coerce").astype("float64")
+
+            yield events_builder.to_df(), qualifiers
+
+    # Convert the events files to separate events and qualifiers tables
+    def event_tables(self, workers: int = 1, compact: bool = False) -> dict:
+        """
+        Convert the events files to a typed events table and a narrow qualifiers table.
+
+        :param int workers: The number of processes to spread the files over. Default is 1 (no process pool).
+        :param bool compact: Whether to cast the columns to the compact schema (see schema.compact_df). Default is False.
+
+        :return: A dict with the "events" and "qualifiers" DataFrames.
+        """
+        files: list = self.feed_files("events")
+        results: list = map_files(
+            _event_tables_worker, [(self.data_folder, self.data_root, file) for file in files], workers)
+
+        tables: dict = {}
+        for position, table in enumerate(["events", "qualifiers"]):
+            frames: list = [result[position] for result in results]
+            tables[table] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            if compact:
+                tables[table] = compact_df(tables[table])
+
+        return tables
+
+    # Pivot qualifier values into columns
+    # Utility function
+    def pivot_qualifiers(self, qualifiers: pd.DataFrame, qualifier_ids: list, numeric: bool = True) -> pd.DataFrame:
+        """
+        A utility function to turn selected qualifiers into one column each, ready to join onto the events table.
+
+        :param pd.DataFrame qualifiers: The qualifiers table from event_tables.
+        :param list qualifier_ids: The qualifier IDs to keep, e.g. [321, 322] for xG and xGOT.
+        :param bool numeric: Whether to use the numeric value rather than the raw string. Default is True.
+
+        :return pd.DataFrame: A DataFrame indexed by (matchId, contestantId, eventId) with one column per qualifier ID.
+        """
+        selected: pd.DataFrame = qualifiers[qualifiers["qualifierId"].isin(qualifier_ids)]
+
+        pivoted: pd.DataFrame = selected.pivot_table(
+            index=["matchId", "contestantId", "eventId"],
+            columns="qualifierId",
+            values="numericValue" if numeric else "value",
+            aggfunc="first"
+        )
+
+        # Keep a column for every requested qualifier, even when none of the events has it
+        return pivoted.reindex(columns=qualifier_ids)
+
+    # Compile a mapping into a reusable extractor
+    def compile_mapping(self, file_type: str) -> compiledMapping:
+        """
+        Compile the mapping of a file type once and reuse it for every file.
+
+        :param str file_type: The type of JSON file. Inherited from the json_to_df method.
+
+        :return compiledMapping: The compiled mapping.
+        """
+        if file_type not in self.compiled_mappings:
+            self.compiled_mappings[file_type] = compiledMapping(
+                self.mapping(file_type, which_way="right", return_dict=True))
+
+        return self.compiled_mappings[file_type]
+
+    # Extract the mapped values from one file
+    def extract_file(self, data: dict, file_type: str) -> tuple:
+        """
+        Extract the mapped values from the data of one JSON file.
+
+        :param dict data: The data from the JSON file.
+        :param str file_type: The type of JSON file. Inherited from the json_to_df method.
+
+        :return: A tuple containing the extracted values keyed by column and the number of rows they make up.
+        """
+        return self.compile_mapping(file_type).extract(data)
+
     # Convert JSON to DataFrame
-    def json_to_df(self, file_type: str = "events") -> pd.DataFrame:
+    def json_to_df(self, file_type: str = "events", workers: int = 1, compact: bool = False) -> pd.DataFrame:
         """
         Convert JSON files to a DataFrame.
 
@@ -312,87 +794,222 @@ class converter:
             Options:
             - "events": Event data. Default option.
             - "pass_matrix": Pass network data.
-            - "stats": General stats.
             - "xgoal_stats": Expected goal stats.
             - "competitions": Competition data.
             - "contestants": Contestant data.
             - "matches": Match data.
             - "match_details": Match details data.
             - "players": Player data.
+
+            The stats feed holds two tables, convert it with iter_fact_batches (player_stats and contestant_stats).
+
+        :param int workers: The number of processes to spread the files over. Default is 1 (no process pool).
+        :param bool compact: Whether to cast the columns to the compact schema (see schema.compact_df). Default is False.
         """
         # Check if the file type is valid
-        if file_type not in ["events", "pass_matrix", "stats", "xgoal_stats", "competitions", "contestants", "matches", "match_details", "players"]:
+        if file_type not in ["events", "pass_matrix", "xgoal_stats", "competitions", "contestants", "matches", "match_details", "players"]:
             raise ValueError(
-                "Invalid file type. Please select from the following options: 'events', 'pass_matrix', 'stats', 'xgoal_stats', 'competitions', 'contestants', 'matches', 'match_details', 'players'")
+                "Invalid file type. Please select from the following options: 'events', 'pass_matrix', 'xgoal_stats', 'competitions', 'contestants', 'matches', 'match_details', 'players'")
+
+        # Events files are streamed rather than loaded whole
+        if file_type == "events":
+            if workers > 1:
+                files: list = self.feed_files("events")
+                batches: list = map_files(
+                    _events_worker, [(self.data_folder, self.data_root, file) for file in files], workers)
+                if not batches:
+                    return pd.DataFrame(columns=self.mapping("events", which_way="left"))
+                df: pd.DataFrame = pd.concat(batches, ignore_index=True)
+            else:
+                # Append every batch to one set of column buffers as it is streamed, dropping repeated events
+                builder = columnBuilder(
+                    self.mapping("events", which_way="left"), self.column_dtypes("events"), self.key_columns("events"))
+                for file in self.feed_files("events"):
+                    self.append_file_events(builder, file)
+                df: pd.DataFrame = builder.to_df()
 
-        # Get all files in the data directory
-        files: list = self.get_files()
+            return compact_df(df) if compact else df
 
-        # Retain only the files with the specified file type
-        if file_type not in ["competitions", "contestants", "matches", "match_details", "players"]:
-            files: list = [file for file in files if file_type in file]
-        else:
-            files: list = [file for file in files if "stats" in file]
+        # Get the files holding the table
+        files: list = self.feed_files(file_type)
 
         # Determine columns based on the file type
         columns: list = self.mapping(file_type, which_way="left")
-        json_columns: dict = self.mapping(
-            file_type, which_way="right", return_dict=True)
 
-        # Initialise an empty DataFrame
-        df: pd.DataFrame = pd.DataFrame(columns=columns)
+        # Buffer the values per column and build the DataFrame once, dropping repeated primary keys
+        builder = columnBuilder(columns, self.column_dtypes(file_type), self.key_columns(file_type))
 
-        # Iterate through all files
-        for file in files:
-            # Import the JSON file
-            data: dict = self.import_json(file)
-
-            # Empty dict to store the extracted data
-            data_from_file: dict = {k: "" for k in json_columns.keys()}
-
-            # Empty variable to store the number of values in the dict
-            num_values: int = 0
-
-            # Iterate through the JSON columns
-            for key, value in json_columns.items():
-                # Construct the path
-                path_dest: list = value.split(".")
-
-                # Extract the data
-                top_level = data[path_dest[0]]
-                second_level = top_level[path_dest[1]]
-
-                # Traverse the data
-                extracted_data = self.traverse_data(
-                    second_level, path_dest[2:])
-
-                # Add the extracted data to the dict
-                if ("Date" in key) or ("Time" in key):
-                    data_from_file[key] = extracted_data.replace("Z", "")
-                elif (key != "contestantId1") and (key != "contestantId2"):
-                    data_from_file[key] = extracted_data
-                elif key == "contestantId1":
-                    data_from_file[key] = extracted_data[0]
-                elif key == "contestantId2":
-                    data_from_file[key] = extracted_data[1]
-
-                num_values = len(extracted_data) if isinstance(
-                    extracted_data, list) else 1
-
-            # Concatenate the mapped data to the main DataFrame
-            df = pd.concat(
-                [df, pd.DataFrame(data_from_file, index=[i for i in range(0, num_values)])], ignore_index=True)
-
-        # Drop duplicates
-        try:
-            # Get all ID columns in the DataFrame
-            id_columns: list = [
-                col for col in df.columns if "Id" in col]
-
-            # Drop duplicates based on the ID columns
-            df.drop_duplicates(subset=id_columns, keep="first",
-                               inplace=True, ignore_index=True)
-        except TypeError:
-            pass
-
-        return df
+        # Extract the mapped data from every file, in file order
+        results: list = map_files(
+            _extract_worker, [(self.data_folder, self.data_root, file, [file_type]) for file in files], workers)
+
+        # Add the extracted data to the column buffers
+        for result in results:
+            data_from_file, num_values = result[file_type]
+            builder.append_file(data_from_file, num_values)
+
+        df: pd.DataFrame = builder.to_df()
+
+        return compact_df(df) if compact else df
+
+    # Convert the stats files to several tables in one pass
+    def extract_tables(self, tables: list = ["competitions", "contestants", "matches", "match_details"], workers: int = 1) -> dict:
+        """
+        Convert the stats files to several tables, opening and parsing each file only once.
+
+        :param list tables: The tables to extract. Default is the four tables loaded into Snowflake.
+
+            Options:
+            - "competitions": Competition data.
+            - "contestants": Contestant data.
+            - "matches": Match data.
+            - "match_details": Match details data.
+            - "players": Player data.
+
+        :param int workers: The number of processes to spread the files over. Default is 1 (no process pool).
+
+        :return: A dict mapping each table to its DataFrame.
+        """
+        return convert_folders([self.data_folder], tables, workers, data_root=self.data_root)[self.data_folder]
+
+    # Build the tables from extracted files
+    def build_tables(self, results: list, tables: list) -> dict:
+        """
+        Build the DataFrames of several tables from the values extracted from each file.
+
+        :param list results: The extracted values of each file, in file order. Each item maps a table to its (data_from_file, num_values) tuple.
+        :param list tables: The tables to build.
+
+        :return: A dict mapping each table to its DataFrame.
+        """
+        # One set of column buffers per table, dropping repeated primary keys
+        builders: dict = {
+            table: columnBuilder(self.mapping(table, which_way="left"), self.column_dtypes(table), self.key_columns(table))
+            for table in tables}
+
+        for result in results:
+            for table in tables:
+                data_from_file, num_values = result[table]
+                builders[table].append_file(data_from_file, num_values)
+
+        return {table: builders[table].to_df() for table in tables}
+
+
+# Converters used by the worker processes, one per data folder
+_worker_converters: dict = {}
+
+
+# Get the converter of a data folder in the current process
+def _get_worker_converter(data_folder: str, data_root: str) -> converter:
+    if (data_root, data_folder) not in _worker_converters:
+        _worker_converters[(data_root, data_folder)] = converter(data_folder, data_root)
+
+    return _worker_converters[(data_root, data_folder)]
+
+
+# Extract several tables from one file
+def _extract_worker(data_folder: str, data_root: str, file_name: str, file_types: list) -> dict:
+    conv: converter = _get_worker_converter(data_folder, data_root)
+    data: dict = conv.import_json(file_name)
+
+    return {file_type: conv.extract_file(data, file_type) for file_type in file_types}
+
+
+# Flatten one events file
+def _events_worker(data_folder: str, data_root: str, file_name: str) -> pd.DataFrame:
+    conv: converter = _get_worker_converter(data_folder, data_root)
+    builder = columnBuilder(conv.mapping("events", which_way="left"), conv.column_dtypes("events"), conv.key_columns("events"))
+    conv.append_file_events(builder, file_name)
+
+    return builder.to_df()
+
+
+# Split one events file into events and qualifiers tables
+def _event_tables_worker(data_folder: str, data_root: str, file_name: str) -> tuple:
+    conv: converter = _get_worker_converter(data_folder, data_root)
+    batches: list = list(conv.iter_file_event_tables(file_name))
+
+    return (pd.concat([batch[0] for batch in batches], ignore_index=True),
+            pd.concat([batch[1] for batch in batches], ignore_index=True))
+
+
+# Run a function over files, optionally in a process pool
+def map_files(function: Callable, jobs: list, workers: int = 1) -> list:
+    """
+    Run a function over a list of jobs, spreading them over a process pool when workers is above 1.
+
+    :param Callable function: A module-level function, so it can be sent to the worker processes.
+    :param list jobs: The arguments of each call, as tuples.
+    :param int workers: The number of processes. Default is 1 (run in the current process).
+
+    :return: The results, in the same order as the jobs.
+    """
+    if workers < 1:
+        raise ValueError("Invalid number of workers. Please provide a positive integer.")
+
+    if workers == 1 or len(jobs) <= 1:
+        return [function(*job) for job in jobs]
+
+    # Send several files per task to keep the inter-process overhead low
+    chunksize: int = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, *zip(*jobs), chunksize=chunksize))
+
+
+# Extract the stats files of several data folders
+def extract_folders(data_folders: list, tables: list = ["competitions", "contestants", "matches", "match_details"], workers: int = 1, files: dict = None, data_root: str = DATA_ROOT) -> dict:
+    """
+    Extract the stats files of several data folders, spreading the files of every folder over one process pool.
+
+    :param list data_folders: The data folders to extract.
+    :param list tables: The tables to extract. Default is the four tables loaded into Snowflake.
+    :param int workers: The number of processes. Default is 1 (no process pool).
+    :param dict files: The files to extract for each data folder. Default is every stats and xgoal_stats feed of the folder.
+    :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
+
+    :return: A dict mapping each data folder to a list of (file name, extracted values) tuples, in file order.
+    """
+    # Check if the tables are valid
+    for table in tables:
+        if table not in ["competitions", "contestants", "matches", "match_details", "players"]:
+            raise ValueError(
+                "Invalid table. Please select from the following options: 'competitions', 'contestants', 'matches', 'match_details', 'players'")
+
+    # One job per stats file, across every folder
+    jobs: list = []
+    for folder in data_folders:
+        if files is not None and folder in files:
+            folder_files: list = files[folder]
+        else:
+            folder_files: list = converter(folder, data_root).feed_files(tables[0])
+        jobs.extend((folder, data_root, file, tables) for file in folder_files)
+
+    results: list = map_files(_extract_worker, jobs, workers)
+
+    # Group the results back by folder
+    folder_results: dict = {folder: [] for folder in data_folders}
+    for job, result in zip(jobs, results):
+        folder_results[job[0]].append((job[2], result))
+
+    return folder_results
+
+
+# Convert several data folders at once
+def convert_folders(data_folders: list, tables: list = ["competitions", "contestants", "matches", "match_details"], workers: int = 1, files: dict = None, data_root: str = DATA_ROOT) -> dict:
+    """
+    Convert the stats files of several data folders, spreading the files of every folder over one process pool.
+
+    The results are merged in folder and file order, so the DataFrames do not depend on the number of workers.
+
+    :param list data_folders: The data folders to convert.
+    :param list tables: The tables to extract. Default is the four tables loaded into Snowflake.
+    :param int workers: The number of processes. Default is 1 (no process pool).
+    :param dict files: The files to convert for each data folder. Default is every stats and xgoal_stats feed of the folder.
+    :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
+
+    :return: A dict mapping each data folder to a dict of its DataFrames, keyed by table.
+    """
+    folder_results: dict = extract_folders(data_folders, tables, workers, files, data_root)
+
+    return {
+        folder: converter(folder, data_root).build_tables([result for _, result in folder_results[folder]], tables) for folder in data_folders}
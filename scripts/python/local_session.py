@@ -0,0 +1,516 @@
+# This file contains an offline, SQLite-backed stand-in for the subset of the Snowpark Session used by the loader and the dashboard
+
+# Necessary imports
+import os
+import re
+import glob
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+import pandas as pd
+import pyarrow.parquet as pq
+
+from typing import Callable
+
+
+# Default paths, relative to the root of the repo
+CREATE_DB_PATH: str = os.path.join(os.path.dirname(__file__), "..", "sql", "create_db.sql")
+APP_MANIFEST_PATH: str = os.path.join(os.path.dirname(__file__), "..", "..", "app", "manifest.yml")
+
+# Statements that only set the Snowflake context or permissions
+IGNORED = re.compile(r"^\s*(use|grant|revoke|alter\s+session|create\s+(or\s+replace\s+)?(temporary\s+)?stage)\b", re.IGNORECASE)
+CREATE_DATABASE = re.compile(r"^\s*create\s+database\b", re.IGNORECASE)
+CREATE_SCHEMA = re.compile(r"^\s*create\s+schema\s+(?:if\s+not\s+exists\s+)?(\w+)", re.IGNORECASE)
+CREATE_OR_REPLACE = re.compile(r"^\s*create\s+or\s+replace\s+(temporary\s+)?table\s+([\w.]+)", re.IGNORECASE)
+CREATE_LIKE = re.compile(r"^\s*create\s+(?:or\s+replace\s+)?(temporary\s+)?table\s+([\w.]+)\s+like\s+([\w.]+)\s*$", re.IGNORECASE)
+COPY_INTO = re.compile(
+    r"^\s*copy\s+into\s+([\w.]+)\s*\(([^)]*)\)\s*from\s*\(\s*select\s+(.+?)\s+from\s+(@\S+?)\s*\)(.*)$",
+    re.IGNORECASE | re.DOTALL)
+COPY_FIELD = re.compile(r'\$1:"(\w+)"')
+MERGE_INTO = re.compile(
+    r"^\s*merge\s+into\s+([\w.]+)\s+(?:as\s+)?(\w+)\s+using\s+([\w.]+)\s+(?:as\s+)?(\w+)\s+on\s+(.+?)\s+"
+    r"(?:when\s+matched\s+then\s+update\s+set\s+(.+?)\s+)?"
+    r"when\s+not\s+matched\s+then\s+insert\s*\(([^)]*)\)\s*values\s*\(([^)]*)\)\s*$",
+    re.IGNORECASE | re.DOTALL)
+REFERENCE = re.compile(r"reference\(\s*'([^']+)'\s*\)", re.IGNORECASE)
+THREE_PART_NAME = re.compile(r"\b\w+\.(\w+)\.(\w+)\b")
+
+
+class localRow(tuple):
+    # Constructor
+    def __new__(cls, values: tuple, fields: list):
+        """
+        Initialise the localRow class, a result row that can be read like a Snowpark Row:
+        by position (row[0]), by upper-case column name (row["NAME"]) or as an attribute (row.NAME).
+
+        :param tuple values: The values of the row.
+        :param list fields: The upper-case column names.
+        """
+        row = super().__new__(cls, values)
+        row._fields = fields
+        return row
+
+    def __getitem__(self, item: any) -> any:
+        if isinstance(item, str):
+            return super().__getitem__(self._fields.index(item.upper()))
+        return super().__getitem__(item)
+
+    def __getattr__(self, name: str) -> any:
+        try:
+            return self[name]
+        except ValueError:
+            raise AttributeError(name) from None
+
+    # Convert the row to a dict
+    def asDict(self) -> dict:
+        """
+        Convert the row to a dict keyed by column name, like Row.asDict.
+
+        :return dict: The values of the row.
+        """
+        return dict(zip(self._fields, self))
+
+
+class localDataFrame:
+    # Constructor
+    def __init__(self, session: "localSession", query: str, params: list = None):
+        """
+        Initialise the localDataFrame class. Like a Snowpark DataFrame, the query only runs when the rows are asked for.
+
+        :param localSession session: The session running the query.
+        :param str query: The Snowflake SQL query.
+        :param list params: The values bound to the ? placeholders of the query.
+        """
+        self.session = session
+        self.query = query
+        self.params = params or []
+
+    # Function to run the query and get the rows
+    def collect(self) -> list:
+        """
+        Run the query and get every row.
+
+        :return: A list of localRow objects.
+        """
+        fields, rows = self.session.execute(self.query, self.params)
+        return [localRow(row, fields) for row in rows]
+
+    # Function to run the query and get a DataFrame
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Run the query and get the rows as a DataFrame with upper-case column names, like DataFrame.to_pandas.
+
+        :return pd.DataFrame: The rows.
+        """
+        fields, rows = self.session.execute(self.query, self.params)
+        return pd.DataFrame.from_records(rows, columns=fields)
+
+
+class localFileOperation:
+    # Constructor
+    def __init__(self, stage_root: str):
+        """
+        Initialise the localFileOperation class, the stand-in for Session.file.
+
+        :param str stage_root: The directory holding one subdirectory per stage.
+        """
+        self.stage_root = stage_root
+
+    # Stage directory of a stage location
+    # Utility function
+    def stage_path(self, stage_location: str) -> str:
+        """
+        A utility function to get the local directory of a stage location.
+
+        :param str stage_location: The stage location, e.g. "@OPTA_LOAD_STAGE/EVENTS/".
+
+        :return str: The directory holding the staged files.
+        """
+        return os.path.join(self.stage_root, *stage_location.lstrip("@").upper().strip("/").split("/"))
+
+    # Function to upload a file to a stage
+    def put(self, local_file_name: str, stage_location: str, auto_compress: bool = True, overwrite: bool = False, **kwargs) -> list:
+        """
+        Copy local files to a stage, like FileOperation.put. Files are never compressed.
+
+        :param str local_file_name: The path to the file, wildcards are allowed.
+        :param str stage_location: The stage location.
+        :param bool auto_compress: Ignored.
+        :param bool overwrite: Whether to replace a staged file with the same name. Default is False.
+
+        :return: A list of the uploaded file names.
+        """
+        directory: str = self.stage_path(stage_location)
+        os.makedirs(directory, exist_ok=True)
+
+        uploaded: list = []
+        for file in glob.glob(local_file_name):
+            target: str = os.path.join(directory, os.path.basename(file))
+            if overwrite or not os.path.exists(target):
+                shutil.copyfile(file, target)
+                uploaded.append(os.path.basename(file))
+
+        return uploaded
+
+
+class localSession:
+    # Constructor
+    def __init__(
+        self,
+        database: str = ":memory:",
+        database_name: str = "OPTA_DATA",
+        references: dict = None,
+        manifest_path: str = APP_MANIFEST_PATH
+    ):
+        """
+        Initialise the localSession class.
+
+        The session runs the Snowflake SQL used by the loader and the dashboard on SQLite, so the
+        pipeline can be run and profiled without a Snowflake account. The context and permission statements
+        (use, grant, create database) are ignored, schemas are attached databases, stages are local directories,
+        and COPY INTO and MERGE are translated. ARRAY columns hold their JSON text.
+
+        :param str database: The path to the SQLite file. Default is ":memory:".
+        :param str database_name: The name returned by current_database(). Default is "OPTA_DATA".
+        :param dict references: The table bound to each reference of the app. Default is the table named like
+            the reference, for every reference of the app manifest.
+        :param str manifest_path: The path to the app manifest declaring the references. Default is app/manifest.yml.
+        """
+        self.database = database
+        self.database_name = database_name
+        self.manifest_path = manifest_path
+        self.references = {name.upper(): table for name, table in (references or {}).items()}
+
+        # One connection shared by the threads using the session
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(database, check_same_thread=False, isolation_level=None)
+        self._connection.create_function("current_database", 0, lambda: self.database_name)
+        self._connection.create_function("current_schema", 0, lambda: "DATA")
+        self._connection.create_function("system_get_reference_definitions", 1, self.reference_definitions)
+        self._connection.create_function("parse_json", 1, lambda value: value)
+        self._schemas: set = set()
+
+        self._stage_root: str = tempfile.mkdtemp(prefix="local_stage_")
+        self.file = localFileOperation(self._stage_root)
+
+    # Function to run a query lazily
+    def sql(self, query: str, params: list = None) -> localDataFrame:
+        """
+        Get the result of a Snowflake SQL query, like Session.sql.
+
+        :param str query: The query.
+        :param list params: The values bound to the ? placeholders of the query.
+
+        :return localDataFrame: The result, computed by collect or to_pandas.
+        """
+        return localDataFrame(self, query, params)
+
+    # Function to get a table
+    def table(self, name: str) -> localDataFrame:
+        """
+        Get every row of a table, like Session.table.
+
+        :param str name: The table.
+
+        :return localDataFrame: The rows.
+        """
+        return self.sql(f"select * from {name}")
+
+    # Function to run a Snowflake SQL statement
+    def execute(self, query: str, params: list = None) -> tuple:
+        """
+        Translate a Snowflake SQL statement to SQLite and run it.
+
+        :param str query: The statement.
+        :param list params: The values bound to the ? placeholders of the statement.
+
+        :return: A tuple of the upper-case column names and the list of rows.
+        """
+        query = query.strip().rstrip(";")
+
+        with self._lock:
+            if IGNORED.match(query) or CREATE_DATABASE.match(query):
+                return ["STATUS"], [("Statement executed successfully.",)]
+
+            schema = CREATE_SCHEMA.match(query)
+            if schema:
+                self.attach_schema(schema.group(1))
+                return ["STATUS"], [(f"Schema {schema.group(1).upper()} successfully created.",)]
+
+            copy = COPY_INTO.match(query)
+            if copy:
+                return self.copy_into(*copy.groups())
+
+            like = CREATE_LIKE.match(query)
+            if like:
+                temporary, table, source = like.groups()
+                self._run(f"drop table if exists {table}")
+                return self._run(f"create {temporary or ''}table {table} as select * from {source} where 0")
+
+            replace = CREATE_OR_REPLACE.match(query)
+            if replace:
+                temporary, table = replace.groups()
+                self._run(f"drop table if exists {table}")
+                query = CREATE_OR_REPLACE.sub(f"create {temporary or ''}table {table}", query, count=1)
+
+            merge = MERGE_INTO.match(query)
+            if merge:
+                query = self.translate_merge(*merge.groups())
+
+            return self._run(self.translate(query), params or [])
+
+    # Run a SQLite statement
+    # Utility function
+    def _run(self, query: str, params: list = None) -> tuple:
+        """
+        A utility function to run a statement on the SQLite connection.
+
+        :param str query: The SQLite statement.
+        :param list params: The values bound to the ? placeholders of the statement.
+
+        :return: A tuple of the upper-case column names and the list of rows.
+        """
+        cursor = self._connection.execute(query, params or [])
+        if cursor.description is None:
+            return ["NUMBER OF ROWS AFFECTED"], [(cursor.rowcount,)]
+
+        return [column[0].upper() for column in cursor.description], cursor.fetchall()
+
+    # Rewrite the Snowflake-only syntax of a query
+    # Utility function
+    def translate(self, query: str) -> str:
+        """
+        A utility function to rewrite the parts of a query SQLite does not understand.
+
+        :param str query: The Snowflake SQL query.
+
+        :return str: The SQLite query.
+        """
+        query = REFERENCE.sub(lambda match: self.resolve_reference(match.group(1)), query)
+        query = query.replace("system$get_reference_definitions", "system_get_reference_definitions")
+
+        # database.schema.table: drop the database, and the schema too unless it is attached
+        query = THREE_PART_NAME.sub(
+            lambda match: (match.group(1) + "." if match.group(1).lower() in self._schemas else "") + match.group(2), query)
+
+        # Casts to Snowflake types (e.g. ::array, ::timestamp_ntz) have no SQLite equivalent
+        return re.sub(r"::\w+", "", query)
+
+    # Rewrite a MERGE as an upsert
+    # Utility function
+    def translate_merge(self, table: str, target: str, source_table: str, source: str, condition: str,
+                        updates: str, columns: str, values: str) -> str:
+        """
+        A utility function to rewrite a MERGE keyed on equal columns as an INSERT ... ON CONFLICT, which needs
+        the key to be the primary key of the target table.
+
+        :return str: The SQLite statement.
+        """
+        key: list = re.findall(rf"{target}\.(\w+)\s*=\s*{source}\.\1", condition, re.IGNORECASE)
+        selected: str = re.sub(rf"\b{source}\.", "", values, flags=re.IGNORECASE)
+
+        if updates:
+            assignments: str = ", ".join(
+                re.sub(rf"^\s*{target}\.(\w+)\s*=\s*{source}\.(\w+)\s*$", r"\1 = excluded.\2", assignment, flags=re.IGNORECASE)
+                for assignment in updates.split(","))
+            action: str = f"do update set {assignments}"
+        else:
+            action: str = "do nothing"
+
+        return (f"insert into {table} ({columns}) select {selected} from {source_table} where true "
+                f"on conflict ({', '.join(key)}) {action}")
+
+    # Load staged Parquet files
+    def copy_into(self, table: str, columns: str, fields: str, stage_location: str, options: str) -> tuple:
+        """
+        Insert the rows of the Parquet files of a stage location, like COPY INTO with a transforming select of $1:"FIELD".
+
+        :param str table: The table.
+        :param str columns: The comma-separated columns to fill.
+        :param str fields: The select list, one $1:"FIELD" per column.
+        :param str stage_location: The stage location.
+        :param str options: The rest of the statement. Files are deleted when it contains purge = true.
+
+        :return: A tuple of the column names and one row per loaded file, like COPY INTO.
+        """
+        names: list = COPY_FIELD.findall(fields)
+        columns: list = [column.strip() for column in columns.split(",")]
+        if len(names) != len(columns):
+            raise ValueError(f"Invalid COPY INTO {table}: every column needs one $1:\"FIELD\" in the select list.")
+
+        directory: str = self.file.stage_path(stage_location)
+        files: list = sorted(glob.glob(os.path.join(directory, "*.parquet")))
+        placeholders: str = ", ".join("?" for _ in columns)
+
+        results: list = []
+        for file in files:
+            data: pd.DataFrame = pq.read_table(file, columns=names).to_pandas()
+            data = data.astype(object).where(data.notna(), None)
+            rows: list = [
+                tuple(value.isoformat() if hasattr(value, "isoformat") else value for value in row)
+                for row in data.itertuples(index=False, name=None)]
+
+            self._connection.executemany(
+                f"insert into {table} ({', '.join(columns)}) values ({placeholders})", rows)
+            results.append((os.path.basename(file), "LOADED", len(rows)))
+
+        if re.search(r"purge\s*=\s*true", options, re.IGNORECASE):
+            for file in files:
+                os.remove(file)
+
+        return ["FILE", "STATUS", "ROWS_LOADED"], results
+
+    # Make a schema available
+    def attach_schema(self, schema: str):
+        """
+        Attach a database for a schema, so schema.table names (e.g. config_data.configuration) resolve.
+        The schemas of a file database are kept next to it.
+
+        :param str schema: The schema.
+        """
+        schema = schema.lower()
+        if schema in self._schemas or schema in ["main", "temp", "data", "public"]:
+            return
+
+        path: str = ":memory:" if self.database == ":memory:" else f"{os.path.splitext(self.database)[0]}.{schema}.sqlite"
+        self._connection.execute("attach database ? as " + schema, [path])
+        self._schemas.add(schema)
+
+    # Table bound to a reference
+    # Utility function
+    def resolve_reference(self, name: str) -> str:
+        """
+        A utility function to get the table bound to a reference of the app.
+
+        :param str name: The reference.
+
+        :return str: The table.
+        """
+        return self.references.get(name.upper(), name)
+
+    # Reference definitions of the app
+    def reference_definitions(self, app_name: str = None) -> str:
+        """
+        Get the references of the app manifest and their bindings, like system$get_reference_definitions.
+        A reference is bound when its table exists.
+
+        :param str app_name: Ignored, there is only one app.
+
+        :return str: The JSON array of references.
+        """
+        import yaml
+
+        with open(self.manifest_path, encoding="utf-8", mode="r") as f:
+            manifest: dict = yaml.safe_load(f)
+
+        tables: set = {row[0].upper() for row in self._connection.execute(
+            "select name from sqlite_master where type in ('table', 'view')")}
+
+        definitions: list = []
+        for reference in manifest.get("references", []):
+            for name, definition in reference.items():
+                table: str = self.resolve_reference(name)
+                definitions.append({
+                    "name": name.upper(),
+                    "label": definition.get("label", name),
+                    "description": definition.get("description", ""),
+                    "object_type": definition.get("object_type", "TABLE"),
+                    "multi_valued": definition.get("multi_valued", False),
+                    "privileges": definition.get("privileges", []),
+                    "bindings": [{"alias": table.upper()}] if table.upper() in tables else [],
+                })
+
+        return json.dumps(definitions)
+
+    # Function to write a DataFrame to a table
+    def write_pandas(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        database: str = None,
+        schema: str = None,
+        auto_create_table: bool = False,
+        overwrite: bool = False,
+        **kwargs
+    ) -> localDataFrame:
+        """
+        Write the rows of a DataFrame to a table, like Session.write_pandas. Nested lists and dicts are written as JSON.
+
+        :param pd.DataFrame df: The rows.
+        :param str table_name: The table.
+        :param str database: Ignored, there is only one database.
+        :param str schema: The schema of the table. Default is the default schema.
+        :param bool auto_create_table: Whether to create the table when it does not exist. Default is False.
+        :param bool overwrite: Whether to replace the rows of the table. Default is False.
+
+        :return localDataFrame: The rows of the table.
+        """
+        name: str = f"{schema}.{table_name}" if schema and schema.lower() in self._schemas else table_name
+        df = df.map(lambda value: json.dumps(value) if isinstance(value, (list, dict)) else value)
+
+        with self._lock:
+            exists: bool = bool(self._run(
+                f"select 1 from {name.split('.')[0] + '.' if '.' in name else ''}sqlite_master where type = 'table' and name = ? collate nocase",
+                [name.split(".")[-1]])[1])
+            if not exists and not auto_create_table:
+                raise ValueError(f"Invalid table {table_name}. Please create it or set auto_create_table=True.")
+
+            if exists and overwrite:
+                self._run(f"delete from {name}")
+            if exists:
+                columns: list = list(df.columns)
+                self._connection.executemany(
+                    f"insert into {name} ({', '.join(columns)}) values ({', '.join('?' for _ in columns)})",
+                    df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+            else:
+                df.to_sql(name.split(".")[-1], self._connection, schema=name.split(".")[0] if "." in name else None, index=False)
+
+        return self.table(name)
+
+    # Function to run a SQL script
+    def run_script(self, path: str = CREATE_DB_PATH):
+        """
+        Run every statement of a SQL script, e.g. scripts/sql/create_db.sql.
+
+        :param str path: The path to the script. Default is scripts/sql/create_db.sql.
+        """
+        with open(path, encoding="utf-8", mode="r") as f:
+            lines: list = [line.split("--")[0] for line in f]
+
+        for statement in "".join(lines).split(";"):
+            if statement.strip():
+                self.execute(statement)
+
+    # Function to close the session
+    def close(self):
+        """
+        Close the SQLite connection and delete the local stages.
+        """
+        with self._lock:
+            self._connection.close()
+        shutil.rmtree(self._stage_root, ignore_errors=True)
+
+
+# Session factory for a sessionProvider
+def local_session_factory(database: str, setup_script: str = CREATE_DB_PATH) -> Callable:
+    """
+    Get a function opening local sessions on a SQLite file, creating the tables the first time.
+
+    :param str database: The path to the SQLite file.
+    :param str setup_script: The script creating the tables. Default is scripts/sql/create_db.sql.
+
+    :return Callable: The session factory.
+    """
+    # Sessions opened at the same time must not both create the tables
+    lock = threading.Lock()
+
+    def factory() -> localSession:
+        session = localSession(database)
+        with lock:
+            if not session.sql("select name from sqlite_master where type = 'table'").collect():
+                session.run_script(setup_script)
+        return session
+
+    return factory
@@ -0,0 +1,161 @@
+# This file contains the ingest manifest used to only convert and load new or changed JSON files
+
+# Necessary imports
+import os
+import json
+import hashlib
+
+
+class ingestManifest:
+    # Constructor
+    def __init__(
+        self,
+        manifest_path: str = ".ingest/manifest.json",
+        data_root: str = "app/dashboard/data/"
+    ):
+        """
+        Initialise the ingestManifest class.
+
+        The manifest records the hash, size and modification time of every ingested source file,
+        along with the number of rows it produced in each table and whether its fact tables were loaded.
+
+        :param str manifest_path: The path to the manifest file. Default is ".ingest/manifest.json".
+        :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
+        """
+        self.manifest_path = manifest_path
+        self.data_root = data_root
+
+        # Load the existing manifest, if any
+        self.entries: dict = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8", mode="r") as f:
+                self.entries = json.load(f).get("files", {})
+
+    # Key of a file in the manifest
+    # Utility function
+    def file_key(self, data_folder: str, file_name: str) -> str:
+        """
+        A utility function to get the key of a file in the manifest.
+
+        :param str data_folder: The data folder of the file.
+        :param str file_name: The name of the file.
+
+        :return str: The key of the file.
+        """
+        return data_folder + "/" + file_name
+
+    # Hash a file
+    # Utility function
+    def file_hash(self, file_path: str, chunk_size: int = 1048576) -> str:
+        """
+        A utility function to compute the SHA-256 hash of a file.
+
+        :param str file_path: The path to the file.
+        :param int chunk_size: The number of bytes to read at a time. Default is 1 MB.
+
+        :return str: The hex digest of the file.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, mode="rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    # Check whether a file is new or has changed
+    def has_changed(self, data_folder: str, file_name: str, facts: bool = False) -> bool:
+        """
+        Check whether a file is new or has changed since it was last recorded.
+
+        The size and modification time are compared first, the file is only hashed when they differ.
+
+        :param str data_folder: The data folder of the file.
+        :param str file_name: The name of the file.
+        :param bool facts: Whether the fact tables are loaded, so a file recorded without them has to be ingested again.
+            Default is False.
+
+        :return bool: True if the file has to be ingested.
+        """
+        entry: dict = self.entries.get(self.file_key(data_folder, file_name))
+        if entry is None:
+            return True
+        # Entries written before the fact tables were tracked had them loaded
+        if facts and not entry.get("facts", True):
+            return True
+
+        file_path: str = os.path.join(self.data_root, data_folder, file_name)
+        stat = os.stat(file_path)
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return False
+        if stat.st_size != entry["size"]:
+            return True
+
+        # Touched but possibly unchanged, so compare the contents
+        if self.file_hash(file_path) != entry["sha256"]:
+            return True
+
+        # Same contents, remember the new modification time to skip hashing next time
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return False
+
+    # Filter the files that need to be ingested
+    def changed_files(self, data_folder: str, files: list, facts: bool = False) -> list:
+        """
+        Filter the files that are new or have changed since they were last recorded.
+
+        :param str data_folder: The data folder of the files.
+        :param list files: The names of the files.
+        :param bool facts: Whether the fact tables are loaded (see has_changed). Default is False.
+
+        :return: A list of the files to ingest, in the same order.
+        """
+        return [file for file in files if self.has_changed(data_folder, file, facts)]
+
+    # Record an ingested file
+    def record(self, data_folder: str, file_name: str, table_rows: dict, facts: bool = True):
+        """
+        Record a file once its rows have been loaded.
+
+        :param str data_folder: The data folder of the file.
+        :param str file_name: The name of the file.
+        :param dict table_rows: The number of rows the file produced in each table.
+        :param bool facts: Whether the fact tables of the file were loaded too. Default is True.
+        """
+        file_path: str = os.path.join(self.data_root, data_folder, file_name)
+        stat = os.stat(file_path)
+
+        self.entries[self.file_key(data_folder, file_name)] = {
+            "sha256": self.file_hash(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "tables": dict(table_rows),
+            "facts": facts,
+        }
+
+    # Remove the files that no longer exist
+    def prune(self, data_folder: str, files: list):
+        """
+        Remove the entries of a data folder whose file is not in the given list.
+
+        :param str data_folder: The data folder.
+        :param list files: The names of the files currently in the data folder.
+        """
+        keep: set = {self.file_key(data_folder, file) for file in files}
+        prefix: str = data_folder + "/"
+        for key in list(self.entries.keys()):
+            if key.startswith(prefix) and key not in keep:
+                del self.entries[key]
+
+    # Save the manifest
+    def save(self):
+        """
+        Save the manifest, replacing the previous file atomically.
+        """
+        directory: str = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path: str = self.manifest_path + ".tmp"
+        with open(temp_path, encoding="utf-8", mode="w") as f:
+            json.dump({"files": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
@@ -0,0 +1,148 @@
+# This file contains the local Parquet cache of the converted Opta tables
+
+# Necessary imports
+import os
+import json
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from scripts.python.convert_json import converter
+from scripts.python.manifest import ingestManifest
+
+
+class parquetCache:
+    # Constructor
+    def __init__(
+        self,
+        cache_root: str = "app/dashboard/data/.cache/",
+        data_root: str = "app/dashboard/data/"
+    ):
+        """
+        Initialise the parquetCache class.
+
+        Every table type is stored as one Parquet dataset partitioned by competition
+        (<cache_root>/<table>/competition=<data folder>/). Each partition keeps the hash, size
+        and modification time of the JSON files it was built from and is rebuilt when one of them changes.
+
+        :param str cache_root: The directory of the cache. Default is "app/dashboard/data/.cache/".
+        :param str data_root: The directory containing the data folders. Default is "app/dashboard/data/".
+        """
+        self.cache_root = cache_root
+        self.data_root = data_root
+
+    # Path to a partition
+    # Utility function
+    def partition_path(self, table: str, data_folder: str) -> str:
+        """
+        A utility function to get the directory of a partition.
+
+        :param str table: The table type, as accepted by converter.json_to_df.
+        :param str data_folder: The data folder.
+
+        :return str: The directory of the partition.
+        """
+        return os.path.join(self.cache_root, table, "competition=" + data_folder)
+
+    # Source files of a partition
+    # Utility function
+    def source_files(self, table: str, data_folder: str) -> list:
+        """
+        A utility function to list the JSON files a partition is built from.
+
+        :param str table: The table type.
+        :param str data_folder: The data folder.
+
+        :return: A list of file names.
+        """
+        return converter(data_folder, self.data_root).feed_files(table)
+
+    # Check whether a partition is up to date
+    def is_fresh(self, table: str, data_folder: str) -> bool:
+        """
+        Check whether a partition exists and none of its source files have been added, removed or changed.
+
+        :param str table: The table type.
+        :param str data_folder: The data folder.
+
+        :return bool: True if the partition can be read as is.
+        """
+        partition: str = self.partition_path(table, data_folder)
+        if not os.path.exists(os.path.join(partition, "data.parquet")):
+            return False
+
+        sources = ingestManifest(os.path.join(partition, "sources.json"), self.data_root)
+        files: list = self.source_files(table, data_folder)
+        recorded: set = {key.split("/", 1)[1] for key in sources.entries}
+
+        return recorded == set(files) and not sources.changed_files(data_folder, files)
+
+    # Build a partition
+    def build(self, table: str, data_folder: str):
+        """
+        Convert the JSON files of a data folder and write them as a partition.
+
+        Columns holding nested lists or dicts are stored as JSON strings and decoded again by read.
+
+        :param str table: The table type.
+        :param str data_folder: The data folder.
+        """
+        files: list = self.source_files(table, data_folder)
+        df: pd.DataFrame = converter(data_folder, self.data_root).json_to_df(table)
+
+        # Encode the nested columns
+        json_columns: list = []
+        for column in df.columns:
+            if df[column].dtype == object and df[column].map(lambda value: isinstance(value, (list, dict))).any():
+                df[column] = df[column].map(json.dumps)
+                json_columns.append(column)
+
+        table_data = pa.Table.from_pandas(df, preserve_index=False)
+        metadata: dict = dict(table_data.schema.metadata or {})
+        metadata[b"json_columns"] = json.dumps(json_columns).encode("utf-8")
+        table_data = table_data.replace_schema_metadata(metadata)
+
+        # Replace the partition
+        partition: str = self.partition_path(table, data_folder)
+        if os.path.exists(partition):
+            shutil.rmtree(partition)
+        os.makedirs(partition)
+        pq.write_table(table_data, os.path.join(partition, "data.parquet"), compression="zstd")
+
+        # Record the source files last, so an interrupted build is never considered fresh
+        sources = ingestManifest(os.path.join(partition, "sources.json"), self.data_root)
+        for file in files:
+            sources.record(data_folder, file, {})
+        sources.save()
+
+    # Read a table
+    def read(self, table: str, data_folders: list, columns: list = None) -> pd.DataFrame:
+        """
+        Read a table from the cache, rebuilding the partitions whose source files changed.
+
+        :param str table: The table type, as accepted by converter.json_to_df.
+        :param list data_folders: The data folders to read.
+        :param list columns: The columns to read. Default is every column.
+
+        :return pd.DataFrame: The table, with a competition column naming the data folder of each row.
+        """
+        frames: list = []
+        for data_folder in data_folders:
+            if not self.is_fresh(table, data_folder):
+                self.build(table, data_folder)
+
+            path: str = os.path.join(self.partition_path(table, data_folder), "data.parquet")
+            json_columns: list = json.loads(
+                pq.read_schema(path).metadata.get(b"json_columns", b"[]"))
+
+            # Only the requested columns are read from disk
+            df: pd.DataFrame = pq.read_table(path, columns=columns).to_pandas()
+            for column in json_columns:
+                if column in df.columns:
+                    df[column] = df[column].map(json.loads)
+
+            df["competition"] = data_folder
+            frames.append(df)
+
+        return pd.concat(frames, ignore_index=True)
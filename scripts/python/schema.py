@@ -0,0 +1,220 @@
+# This file contains the compact dtype schema applied to the converted DataFrames
+
+# Necessary imports
+import re
+import numpy as np
+import pandas as pd
+
+from functools import lru_cache
+
+
+# Compact dtype of each converted column, shared by every table
+COMPACT_SCHEMA: dict = {
+    # Opta IDs, repeated on every row of a match, team or player
+    "matchId": "category",
+    "contestantId": "category",
+    "contestantId1": "category",
+    "contestantId2": "category",
+    "playerId": "category",
+    "competitionId": "category",
+    "competitionAreaId": "category",
+    "tournamentCalendarId": "category",
+    "contestantCountryId": "category",
+    # Small integers
+    "eventId": "small_int",
+    "typeId": "small_int",
+    "outcome": "small_int",
+    "periodId": "small_int",
+    "matchMin": "small_int",
+    "matchSec": "small_int",
+    "qualifierId": "small_int",
+    "numberOfPeriods": "small_int",
+    "periodLength": "small_int",
+    "overtimeLength": "small_int",
+    "matchLengthMin": "small_int",
+    "matchLengthSec": "small_int",
+    # Coordinates and measures
+    "eventX": "float32",
+    "eventY": "float32",
+    "avgX": "float32",
+    "avgY": "float32",
+    "numericValue": "float32",
+    # Timestamps and dates
+    "timeStamp": "datetime",
+    "matchDate": "datetime",
+    "tournamentCalendarStartDate": "datetime",
+    "tournamentCalendarEndDate": "datetime",
+}
+
+
+# Snowflake table of each converter table type
+SQL_TABLES: dict = {
+    "competitions": "competitions",
+    "contestants": "contestants",
+    "matches": "matches_info",
+    "match_details": "match_details",
+    "players": "players",
+    "events": "events",
+    "pass_matrix": "pass_matrix",
+    "xgoal_stats": "xgoal",
+}
+
+# Table definitions in the SQL schema
+CREATE_TABLE = re.compile(r"create or replace table (\w+) \((.*?)\n\);", re.DOTALL)
+COLUMN = re.compile(r"^\s+(\w+) (\w+)", re.MULTILINE)
+PRIMARY_KEY = re.compile(r"primary key\(([^)]*)\)")
+FOREIGN_KEY = re.compile(r"foreign key\(([^)]*)\) references (\w+)\(([^)]*)\)")
+
+
+# Read the keys declared in the SQL schema
+@lru_cache(maxsize=None)
+def table_keys(sql_path: str = "scripts/sql/create_db.sql") -> dict:
+    """
+    Read the primary and foreign keys of every table declared in the SQL schema.
+
+    :param str sql_path: The path to the SQL file creating the tables. Default is "scripts/sql/create_db.sql".
+
+    :return: A dict mapping each table to its "primary_key" (a tuple of columns) and
+        "foreign_keys" (a tuple of (columns, referenced table, referenced columns) tuples).
+    """
+    with open(sql_path, encoding="utf-8", mode="r") as f:
+        sql: str = f.read()
+
+    def split_columns(columns: str) -> tuple:
+        return tuple(column.strip() for column in columns.split(","))
+
+    keys: dict = {}
+    for table, body in CREATE_TABLE.findall(sql):
+        primary_key = PRIMARY_KEY.search(body)
+        keys[table] = {
+            "primary_key": split_columns(primary_key.group(1)) if primary_key else (),
+            "foreign_keys": tuple(
+                (split_columns(columns), referenced, split_columns(referenced_columns))
+                for columns, referenced, referenced_columns in FOREIGN_KEY.findall(body)),
+        }
+
+    return keys
+
+
+# Read the columns declared in the SQL schema
+@lru_cache(maxsize=None)
+def table_columns(sql_path: str = "scripts/sql/create_db.sql") -> dict:
+    """
+    Read the columns of every table declared in the SQL schema, in declaration order.
+
+    :param str sql_path: The path to the SQL file creating the tables. Default is "scripts/sql/create_db.sql".
+
+    :return: A dict mapping each table to a dict of its columns and their SQL types (e.g. "varchar", "int", "array").
+    """
+    with open(sql_path, encoding="utf-8", mode="r") as f:
+        sql: str = f.read()
+
+    return {
+        table: {column: sql_type for column, sql_type in COLUMN.findall(body) if column not in ["primary", "foreign"]}
+        for table, body in CREATE_TABLE.findall(sql)}
+
+
+# Order tables by their foreign keys
+def table_dependencies(tables: list, sql_path: str = "scripts/sql/create_db.sql") -> dict:
+    """
+    Find the tables each table references through its foreign keys, among the given tables.
+
+    :param list tables: The tables to load.
+    :param str sql_path: The path to the SQL file creating the tables. Default is "scripts/sql/create_db.sql".
+
+    :return: A dict mapping each table to the set of given tables it must be loaded after.
+    """
+    keys: dict = table_keys(sql_path)
+
+    dependencies: dict = {
+        table: {referenced for _, referenced, _ in keys[table]["foreign_keys"] if referenced in tables and referenced != table}
+        for table in tables}
+
+    # A cycle would leave some tables waiting forever
+    remaining: dict = {table: set(referenced) for table, referenced in dependencies.items()}
+    while remaining:
+        ready: set = {table for table, referenced in remaining.items() if not referenced}
+        if not ready:
+            raise ValueError(f"Invalid schema. The foreign keys of {', '.join(sorted(remaining))} form a cycle.")
+        remaining = {table: referenced - ready for table, referenced in remaining.items() if table not in ready}
+
+    return dependencies
+
+
+# Find the smallest integer dtype for a column
+# Utility function
+def smallest_int_dtype(series: pd.Series) -> str:
+    """
+    A utility function to find the smallest integer dtype holding every value of a column.
+
+    :param pd.Series series: The column, holding integers and possibly missing values.
+
+    :return str: A NumPy integer dtype, or its nullable pandas counterpart when the column has missing values.
+    """
+    values: pd.Series = pd.to_numeric(series, errors="raise").dropna()
+    low: int = int(values.min()) if len(values) else 0
+    high: int = int(values.max()) if len(values) else 0
+
+    for dtype in ["int8", "int16", "int32", "int64"]:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            break
+
+    return dtype.capitalize() if series.isna().any() else dtype
+
+
+# Cast a DataFrame to the compact schema
+def compact_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the columns of a converted DataFrame to the compact schema.
+
+    IDs become categoricals (dictionary-encoded integers), minutes, seconds and other counters
+    become the smallest integer type that fits, coordinates become float32 and timestamps become datetime64.
+    Columns that are not in the schema, or that hold nested lists, are left unchanged.
+
+    :param pd.DataFrame df: The DataFrame returned by the converter.
+
+    :return pd.DataFrame: A new DataFrame with the compact dtypes.
+    """
+    compacted: dict = {}
+    for column in df.columns:
+        series: pd.Series = df[column]
+        kind: str = COMPACT_SCHEMA.get(column)
+
+        # Nested lists cannot be cast
+        if kind is None or (series.dtype == object and series.map(lambda value: isinstance(value, (list, dict))).any()):
+            compacted[column] = series
+        elif kind == "category":
+            compacted[column] = series.astype("category")
+        elif kind == "small_int":
+            compacted[column] = series.astype(smallest_int_dtype(series))
+        elif kind == "float32":
+            compacted[column] = series.astype("float32")
+        elif kind == "datetime":
+            # Opta timestamps are UTC, marked with a trailing Z
+            compacted[column] = pd.to_datetime(
+                series.astype("string").str.replace("Z", "", regex=False), format="ISO8601")
+
+    return pd.DataFrame(compacted, columns=df.columns)
+
+
+# Compare the memory usage of two DataFrames
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare the memory usage of a DataFrame before and after it was cast to the compact schema.
+
+    :param pd.DataFrame before: The DataFrame returned by the converter.
+    :param pd.DataFrame after: The same DataFrame after compact_df.
+
+    :return pd.DataFrame: The dtype and bytes of each column before and after, with a total row.
+    """
+    report: pd.DataFrame = pd.DataFrame({
+        "dtypeBefore": before.dtypes.astype(str),
+        "dtypeAfter": after.dtypes.astype(str),
+        "bytesBefore": before.memory_usage(index=False, deep=True),
+        "bytesAfter": after.memory_usage(index=False, deep=True),
+    })
+    report.loc["total"] = ["", "", report["bytesBefore"].sum(), report["bytesAfter"].sum()]
+    report["ratio"] = report["bytesBefore"] / report["bytesAfter"]
+
+    return report
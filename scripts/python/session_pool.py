@@ -0,0 +1,219 @@
+# This file contains the lazy, pooled provider of Snowpark sessions used by the loader
+
+# Necessary imports
+import os
+import time
+import queue
+import threading
+
+from contextlib import contextmanager
+from typing import Callable, Generator
+
+
+# Connection settings shared by every session
+# Utility function
+def connection_params() -> dict:
+    """
+    A utility function to read the Snowflake connection settings from the environment and the .env file at the root of the repo.
+
+    :return dict: The settings, as accepted by Session.builder.configs.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv(
+        dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env")
+    )
+
+    return {
+        "account": os.environ.get("SNOWFLAKE_ACCOUNT"),
+        "user": os.environ.get("SNOWFLAKE_USER"),
+        "password": os.environ.get("SNOWFLAKE_PASSWORD"),
+        "authenticator": os.environ.get("SNOWFLAKE_AUTHENTICATOR"),
+        "warehouse": "DASHBOARD_WH",
+        "database": "OPTA_DATA",
+        "schema": "DATA",
+    }
+
+
+# Open a Snowpark session
+# Utility function
+def create_snowpark_session() -> any:
+    """
+    A utility function to open a Snowpark session. Snowpark is only imported here, so importing the loader stays offline.
+
+    :return Session: The session.
+    """
+    from snowflake.snowpark import Session
+
+    return Session.builder.configs(connection_params()).create()
+
+
+class sessionProvider:
+    # Constructor
+    def __init__(
+        self,
+        pool_size: int = 1,
+        session_factory: Callable = None,
+        acquire_timeout: float = None
+    ):
+        """
+        Initialise the sessionProvider class.
+
+        Sessions are only opened when they are first needed, then kept open and handed out again,
+        so the connection cost is paid once per pooled session and process instead of at import or on every load.
+
+        :param int pool_size: The maximum number of sessions open at the same time. Default is 1.
+        :param Callable session_factory: The function opening a session. Default is create_snowpark_session.
+        :param float acquire_timeout: The number of seconds to wait for a free session when every session is in use.
+            Default is None (wait as long as needed).
+        """
+        if pool_size < 1:
+            raise ValueError("Invalid pool size. Please provide a positive integer.")
+
+        self.pool_size = pool_size
+        self.session_factory = session_factory or create_snowpark_session
+        self.acquire_timeout = acquire_timeout
+
+        # Idle sessions, most recently used first so the warmest session is reused
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._sessions: list = []
+
+        # Metrics
+        self.connect_seconds: list = []
+        self.wait_seconds: float = 0.0
+        self.acquisitions: int = 0
+
+    # Take a session from the pool
+    def acquire(self) -> any:
+        """
+        Take an idle session, opening a new one while the pool is not full.
+
+        :return Session: The session, to be given back with release.
+        """
+        start: float = time.perf_counter()
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            session = None
+
+        if session is None:
+            with self._lock:
+                can_open: bool = len(self._sessions) < self.pool_size
+                if can_open:
+                    # Reserve the slot before connecting, so concurrent callers do not overshoot the pool size
+                    self._sessions.append(None)
+
+            if can_open:
+                try:
+                    connect_start: float = time.perf_counter()
+                    session = self.session_factory()
+                    self.connect_seconds.append(time.perf_counter() - connect_start)
+                except Exception:
+                    with self._lock:
+                        self._sessions.remove(None)
+                    raise
+
+                with self._lock:
+                    self._sessions[self._sessions.index(None)] = session
+            else:
+                try:
+                    session = self._idle.get(timeout=self.acquire_timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No Snowflake session was released within {self.acquire_timeout} seconds.") from None
+
+        with self._lock:
+            self.wait_seconds += time.perf_counter() - start
+            self.acquisitions += 1
+
+        return session
+
+    # Give a session back to the pool
+    def release(self, session: any):
+        """
+        Give a session back to the pool so it can be reused.
+
+        :param Session session: The session returned by acquire.
+        """
+        with self._lock:
+            # Sessions closed while they were borrowed are not reused
+            if not any(session is pooled for pooled in self._sessions):
+                return
+
+        self._idle.put(session)
+
+    # Borrow a session for a block of code
+    @contextmanager
+    def session(self) -> Generator[any, None, None]:
+        """
+        Borrow a session for the duration of a with block.
+
+        :return: A context manager yielding the session.
+        """
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    # Connection metrics
+    def metrics(self) -> dict:
+        """
+        Get the connection metrics of the pool.
+
+        :return dict: The number of sessions opened, the time spent connecting, the number of
+            acquisitions and the time spent acquiring (connecting or waiting for a free session).
+        """
+        return {
+            "sessions_opened": len(self.connect_seconds),
+            "connect_seconds_total": sum(self.connect_seconds),
+            "connect_seconds_max": max(self.connect_seconds, default=0.0),
+            "acquisitions": self.acquisitions,
+            "acquire_seconds_total": self.wait_seconds,
+        }
+
+    # Close every session
+    def close(self):
+        """
+        Close every open session. The pool can still be used, new sessions are opened on demand.
+        """
+        with self._lock:
+            sessions: list = [session for session in self._sessions if session is not None]
+            self._sessions = [session for session in self._sessions if session is None]
+            self._idle = queue.LifoQueue()
+
+        for session in sessions:
+            session.close()
+
+
+# Provider shared by the loaders of the current process
+_default_provider: sessionProvider = None
+_default_lock = threading.Lock()
+
+
+# Get the shared provider
+def default_provider() -> sessionProvider:
+    """
+    Get the session provider shared by the current process, creating it on first use.
+
+    The pool size is read from the SNOWFLAKE_POOL_SIZE environment variable (default 1).
+    When SNOWFLAKE_LOCAL_DATABASE is set to the path of a SQLite file, sessions are opened on that file
+    with the offline localSession instead of connecting to Snowflake.
+
+    :return sessionProvider: The shared provider.
+    """
+    global _default_provider
+
+    with _default_lock:
+        if _default_provider is None:
+            session_factory: Callable = None
+            if os.environ.get("SNOWFLAKE_LOCAL_DATABASE"):
+                from scripts.python.local_session import local_session_factory
+
+                session_factory = local_session_factory(os.environ["SNOWFLAKE_LOCAL_DATABASE"])
+
+            _default_provider = sessionProvider(
+                pool_size=int(os.environ.get("SNOWFLAKE_POOL_SIZE", "1")), session_factory=session_factory)
+
+    return _default_provider
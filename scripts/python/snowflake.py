@@ -3,35 +3,39 @@
 # Necessary imports
 import pandas as pd
 import os
+import json
+import time
+import tempfile
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from dotenv import load_dotenv
-from snowflake.snowpark import Session
-from scripts.python.convert_json import converter
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from scripts.python.convert_json import converter, extract_folders, FACT_FEEDS
+from scripts.python.catalog import FEED_TYPES
+from scripts.python.manifest import ingestManifest
+from scripts.python.checkpoints import ingestCheckpoints
+from scripts.python.parquet_cache import parquetCache
+from scripts.python.schema import table_keys, table_columns, table_dependencies
+from scripts.python.session_pool import sessionProvider, default_provider
 
-# Load the environment variables
-load_dotenv(
-    dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env")
-)
-
-connection_params = {
-    "account": os.environ.get("SNOWFLAKE_ACCOUNT"),
-    "user": os.environ.get("SNOWFLAKE_USER"),
-    "password": os.environ.get("SNOWFLAKE_PASSWORD"),
-    "authenticator": os.environ.get("SNOWFLAKE_AUTHENTICATOR"),
-    "warehouse": "DASHBOARD_WH",
-    "database": "OPTA_DATA",
-    "schema": "DATA",
-}
-session = Session.builder.configs(connection_params).create()
+# Temporary stage holding the Parquet files of a load
+LOAD_STAGE: str = "OPTA_LOAD_STAGE"
 
 
 class SnowflakeConnector:
     # Constructor
-    def __init__(self):
-        pass
+    def __init__(self, provider: sessionProvider = None):
+        """
+        Initialise the SnowflakeConnector class. No connection is opened until data is injected.
+
+        :param sessionProvider provider: The provider of Snowpark sessions. Default is the provider shared by the process,
+            so the connection is reused across connectors and inject_data calls.
+        """
+        self.provider = provider or default_provider()
 
     # Function to retrieve data
-    def load_data(self, file_type: str, data_folder: str) -> pd.DataFrame:
+    def load_data(self, file_type: str, data_folder: str, use_cache: bool = False, columns: list = None) -> pd.DataFrame:
         """
         This function retrieves the JSON data and converts it to a DataFrame
 
@@ -50,8 +54,18 @@ class SnowflakeConnector:
             - "2022 World Cup Asian Qualifiers"
             - "AFF Cup 2020"
 
+        :param bool use_cache: Whether to read the table from the local Parquet cache,
+            which is rebuilt when a source file changes. Default is False.
+        :param list columns: The columns to read from the cache. Default is every column.
+
         :return pd.DataFrame: The DataFrame containing the data.
         """
+        # Read the typed columns from the cache instead of parsing the JSON files
+        if use_cache:
+            data: pd.DataFrame = parquetCache().read(file_type, [data_folder], columns)
+
+            return data.drop(columns="competition")
+
         # Create a converter object
         conv = converter(data_folder)
 
@@ -60,38 +74,428 @@ class SnowflakeConnector:
 
         return data
 
+    # Function to retrieve several tables at once
+    def load_tables(self, tables: list, data_folder: str, workers: int = 1) -> dict:
+        """
+        This function retrieves the JSON data of several tables, reading each stats file only once
+
+        :param list tables: The tables to convert to DataFrames.
+
+            Options:
+            - "competitions": Competition data.
+            - "contestants": Contestant data.
+            - "matches": Match data.
+            - "match_details": Match details data.
+            - "players": Player data.
+
+        :param str data_folder: The folder where the data is stored.
+
+            Options:
+            - "2022 World Cup Asian Qualifiers"
+            - "AFF Cup 2020"
+
+        :param int workers: The number of processes used to convert the files. Default is 1.
+
+        :return dict: A dict mapping each table to its DataFrame.
+        """
+        # Create a converter object
+        conv = converter(data_folder)
+
+        # Get the data
+        data: dict = conv.extract_tables(tables, workers)
+
+        return data
+
+    # Function to find the files to ingest
+    # Utility function
+    def find_files(self, data_folders: list, manifest: ingestManifest, incremental: bool, facts: bool = True) -> tuple:
+        """
+        A utility function to find the files of every folder to convert and load, forgetting the files that no longer exist.
+
+        :param list data_folders: The data folders.
+        :param ingestManifest manifest: The ingest manifest.
+        :param bool incremental: Whether to only keep the files that are new or have changed since the last run.
+        :param bool facts: Whether the fact tables are loaded, so the files recorded without them are kept too. Default is True.
+
+        :return: A tuple of two dicts keyed by data folder: the stats files feeding the dimension tables and every file to ingest.
+        """
+        files: dict = {}
+        changed: dict = {}
+        for folder in data_folders:
+            conv = converter(folder)
+            folder_files: list = sorted({file for feed in FEED_TYPES for file in conv.feed_files(feed)})
+            manifest.prune(folder, folder_files)
+            changed[folder] = manifest.changed_files(folder, folder_files, facts) if incremental else folder_files
+            files[folder] = [file for file in conv.feed_files("matches") if file in changed[folder]]
+
+        return files, changed
+
     # Function to inject data into Snowflake
-    def inject_data(self):
+    def inject_data(self, workers: int = 1, incremental: bool = True, upload_workers: int = None,
+                    facts: bool = True, batch_matches: int = 8, resume: bool = True):
         """
         This function injects the data into the corresponding tables in Snowflake.
+
+        Every table of every batch is checkpointed once loaded, so a run interrupted by a failure
+        resumes from the last loaded batch when it is started again over the same files.
+
+        :param int workers: The number of processes used to convert the files of every folder. Default is 1.
+        :param bool incremental: Whether to only convert and load the files that are new or have changed
+            since the last run, according to the ingest manifest. Default is True.
+            Set it to False after recreating the tables to load every file again.
+        :param int upload_workers: The number of tables uploaded at the same time. Default is the pool size of the provider.
+        :param bool facts: Whether to also load the players and the fact tables (events, pass_matrix, player_stats, xgoal
+            and contestant_stats) of the new or changed matches. Default is True.
+        :param int batch_matches: The number of matches converted and loaded at a time into the fact tables. Default is 8.
+        :param bool resume: Whether to skip the tables of the batches loaded by an interrupted run. Default is True.
+            Set it to False to load every batch again.
         """
         data_folders: list = [
             "2022 World Cup Asian Qualifiers", "AFF Cup 2020"]
         tables: list = ["competitions", "contestants",
                         "matches_info", "match_details"]
+        file_types: list = [table if table != "matches_info" else "matches" for table in tables]
+
+        # Find the files to ingest in every folder
+        manifest = ingestManifest()
+        checkpoints = ingestCheckpoints()
+        if not resume:
+            checkpoints.clear()
+
+        files, changed = self.find_files(data_folders, manifest, incremental, facts)
+
+        # Rows loaded from each file, recorded in the manifest
+        file_rows: dict = {folder + "/" + file: {} for folder in data_folders for file in changed[folder]}
+        timings: dict = {}
 
         for folder in data_folders:
-            for table in tables:
-                # Load the data
-                data: pd.DataFrame = self.load_data(
-                    table, folder) if table != "matches_info" else self.load_data("matches", folder)
+            if not changed[folder]:
+                print(f"No new or changed files in {folder}.")
+
+        # The dimension tables of every folder are loaded as one batch
+        batch_key: str = checkpoints.batch_key(files)
+        pending: list = [table for table in tables if not checkpoints.is_done("*", table, batch_key)]
+        for table in tables:
+            for file, rows in checkpoints.file_rows("*", table, batch_key).items():
+                file_rows[file][table] = rows
+
+        if pending and any(files.values()):
+            # Extract every folder from a single pass over the stats files
+            pending_types: list = [file_types[tables.index(table)] for table in pending]
+            all_results: dict = extract_folders(data_folders, pending_types, workers, files)
 
-                # Change column names to uppercase
-                data.columns = data.columns.str.upper()
+            # Combine the rows of every folder, keeping one row per primary key
+            all_data: dict = converter(data_folders[0]).build_tables(
+                [result for folder in data_folders for _, result in all_results[folder]], pending_types)
 
-                # Fill NULL values with None
-                data = data.where(pd.notnull(data), "None")
+            def dimension_loaded(table: str):
+                file_type: str = file_types[tables.index(table)]
+                rows: dict = {
+                    folder + "/" + file: result[file_type][1] for folder in data_folders for file, result in all_results[folder]}
+                checkpoints.mark_done("*", table, batch_key, rows)
+                for file, num_rows in rows.items():
+                    file_rows[file][table] = num_rows
 
-                # Write the data to the corresponding table
-                session.write_pandas(
-                    df=data,
-                    table_name=table.upper(),
-                    database="OPTA_DATA",
-                    schema="DATA",
-                    auto_create_table=False
-                )
+            timings.update(self.upload_tables(
+                {table: all_data[file_types[tables.index(table)]] for table in pending}, upload_workers, dimension_loaded))
 
-                # Drop duplicates from the table
-                _ = session.sql(f"create or replace table {table.upper()} as select distinct * from {table.upper()}").collect()
+        # Load the fact tables of the matches with a new or changed file, a batch of matches at a time
+        if facts:
+            for folder in data_folders:
+                conv = converter(folder)
+                matches: dict = {
+                    match_id: feeds for match_id, feeds in conv.match_files().items()
+                    if any(file in changed[folder] for feed_files in feeds.values() for file in feed_files)}
+                match_ids: list = list(matches)
+
+                for start in range(0, len(match_ids), batch_matches):
+                    batch: list = match_ids[start:start + batch_matches]
+                    batch_key: str = checkpoints.batch_key(
+                        {folder: [file for match_id in batch for feed_files in matches[match_id].values() for file in feed_files]})
+
+                    pending: list = [table for table in FACT_FEEDS if not checkpoints.is_done(folder, table, batch_key)]
+                    for table in FACT_FEEDS:
+                        for file, rows in checkpoints.file_rows(folder, table, batch_key).items():
+                            file_rows[file][table] = rows
+                    if not pending:
+                        continue
+
+                    for _, batch_rows, batch_data in conv.iter_fact_batches(pending, len(batch), batch):
+                        def fact_loaded(table: str):
+                            rows: dict = {
+                                folder + "/" + file: counts[table] for file, counts in batch_rows.items() if table in counts}
+                            checkpoints.mark_done(folder, table, batch_key, rows)
+                            for file, num_rows in rows.items():
+                                file_rows[file][table] = num_rows
+
+                        for table, seconds in self.upload_tables(batch_data, upload_workers, fact_loaded).items():
+                            timings[table] = timings.get(table, 0.0) + seconds
+
+        if not any(changed.values()):
+            return
+
+        for table, seconds in timings.items():
+            print(f"Loaded {table} in {seconds:.2f}s.")
+
+        # Record the files once all of their tables are loaded, the checkpoints are no longer needed.
+        # Without the fact tables, the files are recorded as such so the next run loading them picks them up again.
+        for folder in data_folders:
+            for file in changed[folder]:
+                manifest.record(folder, file, file_rows[folder + "/" + file], facts)
+        manifest.save()
+        checkpoints.clear()
 
         print("Data has been successfully injected into Snowflake.")
+
+    # Function to plan an injection without loading anything
+    def plan_data(self, workers: int = 1, incremental: bool = True, facts: bool = True, batch_matches: int = 8,
+                  compare_existing: bool = False) -> pd.DataFrame:
+        """
+        This function converts the files inject_data would load and reports what it would upload, without uploading anything.
+
+        :param int workers: The number of processes used to convert the files of every folder. Default is 1.
+        :param bool incremental: Whether to only plan the files that are new or have changed since the last run. Default is True.
+        :param bool facts: Whether to also plan the players and the fact tables. Default is True.
+        :param int batch_matches: The number of matches per batch of the fact tables. Default is 8.
+        :param bool compare_existing: Whether to read the primary keys already in Snowflake to split the rows into
+            inserts and updates. Default is False, which does not connect and estimates the rows already present as the rows
+            the ingest manifest recorded for the unchanged files (an upper bound, a row held by several files is counted once per file).
+
+        :return pd.DataFrame: One row per table with the rows to load (distinct primary keys across every batch), the rows
+            already present, the rows that would be inserted, the Snappy-compressed Parquet bytes to upload and the number of batches.
+        """
+        data_folders: list = [
+            "2022 World Cup Asian Qualifiers", "AFF Cup 2020"]
+        tables: list = ["competitions", "contestants",
+                        "matches_info", "match_details"]
+        file_types: list = [table if table != "matches_info" else "matches" for table in tables]
+
+        # The manifest is only read, it is not saved
+        manifest = ingestManifest()
+        files, changed = self.find_files(data_folders, manifest, incremental, facts)
+
+        plan: dict = {
+            table: {"rows_to_load": 0, "rows_present": 0, "rows_to_insert": 0, "upload_bytes": 0, "batches": 0}
+            for table in tables + list(FACT_FEEDS)}
+
+        # Rows of the unchanged files were loaded by an earlier run
+        for folder in data_folders:
+            for key, entry in manifest.entries.items():
+                if key.startswith(folder + "/") and key[len(folder) + 1:] not in changed[folder]:
+                    for table, num_rows in entry.get("tables", {}).items():
+                        if table in plan:
+                            plan[table]["rows_present"] += num_rows
+
+        existing: dict = {}
+        if compare_existing:
+            with self.provider.session() as session:
+                for table in plan:
+                    primary_key: list = list(table_keys()[table]["primary_key"])
+                    rows: list = session.sql(f"select {', '.join(primary_key)} from {table}").collect()
+                    existing[table] = {tuple(str(value) for value in row) for row in rows}
+                    plan[table]["rows_present"] = len(existing[table])
+
+        # Primary keys planned so far, a row repeated in several batches (e.g. a player of several matches) is merged once
+        planned: dict = {table: set() for table in plan}
+
+        def add_batch(table: str, data: pd.DataFrame):
+            if data.empty:
+                return
+
+            buffer = pa.BufferOutputStream()
+            pq.write_table(self.parquet_table(table, data), buffer, compression="snappy")
+
+            primary_key: list = list(table_keys()[table]["primary_key"])
+            new_keys: set = set(zip(*(data[column].astype(str) for column in primary_key))) - planned[table]
+            planned[table].update(new_keys)
+
+            plan[table]["rows_to_load"] += len(new_keys)
+            plan[table]["upload_bytes"] += buffer.getvalue().size
+            plan[table]["batches"] += 1
+            if compare_existing:
+                plan[table]["rows_to_insert"] += sum(key not in existing[table] for key in new_keys)
+            else:
+                plan[table]["rows_to_insert"] += len(new_keys)
+
+        # The dimension tables of every folder are loaded as one batch
+        all_results: dict = extract_folders(data_folders, file_types, workers, files)
+        results: list = [result for folder in data_folders for _, result in all_results[folder]]
+        if results:
+            all_data: dict = converter(data_folders[0]).build_tables(results, file_types)
+            for table, file_type in zip(tables, file_types):
+                add_batch(table, all_data[file_type])
+
+        if facts:
+            for folder in data_folders:
+                conv = converter(folder)
+                match_ids: list = [
+                    match_id for match_id, feeds in conv.match_files().items()
+                    if any(file in changed[folder] for feed_files in feeds.values() for file in feed_files)]
+
+                for _, _, batch_data in conv.iter_fact_batches(batch_matches=batch_matches, match_ids=match_ids):
+                    for table, data in batch_data.items():
+                        add_batch(table, data)
+
+        report: pd.DataFrame = pd.DataFrame.from_dict(plan, orient="index")
+        report.index.name = "table"
+
+        print(report.to_string())
+        print(f"Total upload: {report['upload_bytes'].sum() / 1024 ** 2:.2f} MB in {report['batches'].sum()} table batches.")
+
+        return report
+
+    # Function to convert a table to Parquet
+    def parquet_table(self, table: str, data: pd.DataFrame) -> pa.Table:
+        """
+        This function converts the rows of a table to an Arrow table laid out like the Snowflake table.
+
+        Columns holding nested lists or dicts are written as JSON strings and parsed again by the COPY.
+
+        :param str table: The Snowflake table, as declared in scripts/sql/create_db.sql.
+        :param pd.DataFrame data: The rows to load, with the converter column names.
+
+        :return pa.Table: The rows, with the upper-cased Snowflake column names.
+        """
+        columns: dict = table_columns()[table]
+        data = data[list(columns.keys())].copy()
+
+        for column, sql_type in columns.items():
+            if sql_type in ["array", "object", "variant"]:
+                data[column] = data[column].map(lambda value: None if value is None else json.dumps(value))
+
+        # Parquet field names match the upper-cased Snowflake columns
+        data.columns = data.columns.str.upper()
+
+        return pa.Table.from_pandas(data, preserve_index=False)
+
+    # Function to write a table to the load stage
+    def stage_table(self, session: any, table: str, data: pd.DataFrame) -> str:
+        """
+        This function writes the rows of a table as one compressed Parquet file and uploads it to the load stage.
+
+        :param Session session: The Snowpark session.
+        :param str table: The Snowflake table, as declared in scripts/sql/create_db.sql.
+        :param pd.DataFrame data: The rows to load, with the converter column names.
+
+        :return str: The stage location of the file.
+        """
+        table_data: pa.Table = self.parquet_table(table, data)
+
+        stage_location: str = f"@{LOAD_STAGE}/{table.upper()}/"
+        with tempfile.TemporaryDirectory() as directory:
+            file_path: str = os.path.join(directory, table.lower() + ".parquet")
+            pq.write_table(table_data, file_path, compression="snappy")
+
+            session.sql(f"create temporary stage if not exists {LOAD_STAGE} file_format = (type = parquet)").collect()
+            session.file.put(file_path, stage_location, auto_compress=False, overwrite=True)
+
+        return stage_location
+
+    # Function to upsert the staged rows of a table
+    def merge_table(self, session: any, table: str, stage_location: str):
+        """
+        This function copies the staged rows of a table into a temporary table and merges them into the table by primary key.
+
+        Rows whose primary key already exists are updated, the others are inserted, so the cost
+        depends on the number of new rows rather than on the size of the table.
+
+        :param Session session: The Snowpark session.
+        :param str table: The Snowflake table, as declared in scripts/sql/create_db.sql.
+        :param str stage_location: The stage location returned by stage_table.
+        """
+        columns: dict = table_columns()[table]
+        primary_key: list = [column.upper() for column in table_keys()[table]["primary_key"]]
+        names: list = [column.upper() for column in columns.keys()]
+        staging: str = table.upper() + "_STAGING"
+
+        # Cast every Parquet field to the declared type of its column
+        fields: list = []
+        for column, sql_type in columns.items():
+            field: str = f'$1:"{column.upper()}"'
+            if sql_type in ["array", "object", "variant"]:
+                fields.append(f"parse_json({field}::varchar)::{sql_type}")
+            else:
+                fields.append(f"{field}::{sql_type}")
+
+        session.sql(f"create or replace temporary table {staging} like {table.upper()}").collect()
+        session.sql(f"""
+            copy into {staging} ({", ".join(names)})
+            from (select {", ".join(fields)} from {stage_location})
+            file_format = (type = parquet)
+            purge = true
+        """).collect()
+
+        # A single MERGE keyed on the primary key
+        condition: str = " and ".join(f"target.{column} = source.{column}" for column in primary_key)
+        updates: str = ", ".join(f"target.{column} = source.{column}" for column in names if column not in primary_key)
+        session.sql(f"""
+            merge into {table.upper()} as target
+            using {staging} as source
+            on {condition}
+            {f"when matched then update set {updates}" if updates else ""}
+            when not matched then insert ({", ".join(names)}) values ({", ".join("source." + column for column in names)})
+        """).collect()
+
+        session.sql(f"drop table if exists {staging}").collect()
+
+    # Function to load a table in bulk
+    def bulk_load(self, session: any, table: str, data: pd.DataFrame):
+        """
+        This function loads the rows of a table with one Parquet upload, one COPY and one MERGE.
+
+        :param Session session: The Snowpark session.
+        :param str table: The Snowflake table, as declared in scripts/sql/create_db.sql.
+        :param pd.DataFrame data: The rows to load, with the converter column names and one row per primary key.
+        """
+        if data.empty:
+            return
+
+        stage_location: str = self.stage_table(session, table, data)
+        self.merge_table(session, table, stage_location)
+
+    # Function to load several tables concurrently
+    def upload_tables(self, data: dict, workers: int = None, on_loaded: Callable = None) -> dict:
+        """
+        This function loads several tables over a pool of threads, each with its own session from the provider.
+
+        A table is only started once every table it references through a foreign key in scripts/sql/create_db.sql
+        is loaded, so independent tables (e.g. competitions and contestants) are loaded at the same time.
+
+        :param dict data: A dict mapping each Snowflake table to the rows to load.
+        :param int workers: The maximum number of tables loaded at the same time. Default is the pool size of the provider.
+        :param Callable on_loaded: A function called with the name of each table as soon as it is loaded, e.g. to checkpoint it.
+
+        :return dict: A dict mapping each table to its load time in seconds, in the order the loads finished.
+        """
+        workers = workers or self.provider.pool_size
+        if workers < 1:
+            raise ValueError("Invalid number of workers. Please provide a positive integer.")
+
+        dependencies: dict = table_dependencies(list(data.keys()))
+        timings: dict = {}
+
+        def load(table: str) -> float:
+            start: float = time.perf_counter()
+            with self.provider.session() as session:
+                self.bulk_load(session, table, data[table])
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            running: dict = {}
+            waiting: list = list(data.keys())
+
+            while waiting or running:
+                # Start every table whose referenced tables are loaded
+                for table in [table for table in waiting if dependencies[table] <= timings.keys()]:
+                    waiting.remove(table)
+                    running[executor.submit(load, table)] = table
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Stop at the first failure, the tables that depend on it cannot be loaded
+                    table: str = running.pop(future)
+                    timings[table] = future.result()
+                    if on_loaded is not None:
+                        on_loaded(table)
+
+        return timings
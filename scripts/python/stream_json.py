@@ -0,0 +1,141 @@
+# This file contains the incremental JSON reader used to stream large Opta feeds
+#
+# The reader itself (sectionReader) is shared with the dashboard, which is deployed without scripts/, so it lives in
+# app/dashboard/utils/json_sections.py. The utils package imports Streamlit, so the module is loaded from its file.
+
+# Necessary imports
+import os
+import sys
+import importlib.util
+
+from types import ModuleType
+from typing import Generator
+
+
+# Path to the shared reader
+JSON_SECTIONS_PATH: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "app", "dashboard", "utils", "json_sections.py")
+
+
+# Load the shared reader
+# Utility function
+def load_json_sections() -> ModuleType:
+    """
+    A utility function to load app/dashboard/utils/json_sections.py without importing the rest of the dashboard.
+
+    :return ModuleType: The json_sections module.
+    """
+    name: str = "scripts.python._json_sections"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, JSON_SECTIONS_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+
+    return sys.modules[name]
+
+
+sectionReader = load_json_sections().sectionReader
+
+
+class jsonStreamer(sectionReader):
+    # Constructor
+    def __init__(
+        self,
+        file_path: str,
+        array_path: tuple = ("liveData", "event"),
+        chunk_size: int = 65536
+    ):
+        """
+        Initialise the jsonStreamer class.
+
+        The streamer walks down the objects named in array_path and yields the items of the
+        array found at the end of the path one at a time, so the whole document tree is never held in memory.
+        Every value that precedes the array along the way (e.g. matchInfo, liveData.matchDetails)
+        is decoded and kept in the header attribute. Only some sections can be decoded with read_sections (see sectionReader).
+
+        :param str file_path: The path to the JSON file.
+        :param tuple array_path: The keys leading to the array to stream. Default is ("liveData", "event").
+        :param int chunk_size: The number of characters to read from the file at a time. Default is 65536.
+        """
+        if not array_path:
+            raise ValueError("Invalid array path. Please provide at least one key.")
+
+        super().__init__(file_path, chunk_size)
+        self.array_path = tuple(array_path)
+
+        # Values found before the streamed array, filled while streaming
+        self.header: dict = {}
+
+    # Walk down to the array and yield its items
+    def iter_items(self) -> Generator[dict, None, None]:
+        """
+        Stream the items of the array at the end of array_path.
+
+        :return: A generator yielding each item of the array.
+        """
+        self.header = {}
+        self._reset()
+
+        with open(self.file_path, encoding="utf-8", mode="r") as self._file:
+            node: dict = self.header
+
+            # Walk down the objects leading to the array
+            for depth, target in enumerate(self.array_path):
+                self._expect("{")
+
+                while True:
+                    if self._peek() == "}":
+                        raise KeyError(
+                            f"'{'.'.join(self.array_path[:depth + 1])}' not found in {self.file_path}.")
+
+                    key: str = self._decode_value()
+                    self._expect(":")
+
+                    if key == target:
+                        break
+
+                    # Keep the values preceding the array in the header
+                    node[key] = self._decode_value()
+                    if self._peek() == ",":
+                        self._pos += 1
+
+                if depth < len(self.array_path) - 1:
+                    node[key] = {}
+                    node = node[key]
+
+            # Stream the array items
+            self._expect("[")
+            if self._peek() == "]":
+                return
+
+            while True:
+                yield self._decode_value()
+
+                if self._peek() == ",":
+                    self._pos += 1
+                else:
+                    self._expect("]")
+                    return
+
+    # Group the array items into batches
+    def iter_batches(self, batch_size: int = 5000) -> Generator[list, None, None]:
+        """
+        Stream the items of the array in lists of at most batch_size items.
+
+        :param int batch_size: The maximum number of items per batch. Default is 5000.
+
+        :return: A generator yielding lists of items.
+        """
+        if batch_size < 1:
+            raise ValueError("Invalid batch size. Please provide a positive integer.")
+
+        batch: list = []
+        for item in self.iter_items():
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
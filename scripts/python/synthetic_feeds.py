@@ -0,0 +1,576 @@
+# This file contains the generator of synthetic Opta feeds used as a fixture for scaling benchmarks
+#
+# Usage (from the root of the repo):
+#   python -m scripts.python.synthetic_feeds --matches 500 --events-per-match 1700
+
+# Necessary imports
+import os
+import json
+import random
+import argparse
+import datetime as dt
+
+from typing import Generator
+
+
+# Characters of the Opta IDs
+ID_CHARACTERS: str = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+# Positions of a squad, starters first
+STARTING_POSITIONS: list = [
+    ("Goalkeeper", "Centre"), ("Defender", "Right"), ("Defender", "Centre/Right"), ("Defender", "Left/Centre"),
+    ("Defender", "Left"), ("Midfielder", "Right"), ("Midfielder", "Centre/Right"), ("Midfielder", "Left/Centre"),
+    ("Midfielder", "Left"), ("Striker", "Centre/Right"), ("Striker", "Left/Centre"),
+]
+SUBSTITUTE_POSITIONS: list = ["Goalkeeper", "Defender", "Midfielder", "Attacker"]
+
+# Event types drawn for the open-play events, with their weights (from the bundled events feeds)
+EVENT_TYPES: dict = {1: 50, 49: 7, 5: 6, 4: 5, 44: 4, 43: 4, 61: 3, 67: 3, 12: 2, 3: 2, 7: 2, 8: 2, 13: 1, 14: 1, 15: 1, 16: 1}
+# Shot event types (miss, post, saved, goal)
+SHOT_TYPES: list = [13, 14, 15, 16]
+
+# Player stats written to the stats feed, and the team stats written with their halves
+PLAYER_STATS: list = ["minsPlayed", "accuratePass", "totalPass", "touches", "fouls", "wasFouled", "totalTackle"]
+TEAM_STATS: list = ["totalPass", "accuratePass", "touches", "totalScoringAtt", "ontargetScoringAtt", "fkFoulLost", "wonCorners"]
+# Player and team stats written to the xgoal feed
+XGOAL_PLAYER_STATS: list = ["minsPlayed", "touches", "expectedGoals", "expectedAssists"]
+XGOAL_TEAM_STATS: list = ["expectedGoals", "expectedGoalsNonpenalty", "expectedGoalsontarget", "expectedAssists"]
+
+
+class feedGenerator:
+    # Constructor
+    def __init__(
+        self,
+        output_root: str = "synthetic_data/",
+        competition: str = "Synthetic League",
+        num_matches: int = 500,
+        events_per_match: int = 1700,
+        players_per_squad: int = 23,
+        num_teams: int = 20,
+        seed: int = 0
+    ):
+        """
+        Initialise the feedGenerator class.
+
+        The generator writes the four feeds of every match (events, pass_matrix, stats and xgoal_stats)
+        with the same structure as the bundled Opta files, so the converter and the dashboard utilities can
+        read them unchanged. The output only depends on the parameters, so two runs with the same seed
+        produce identical files.
+
+        :param str output_root: The directory to write the data folder to. Default is "synthetic_data/".
+        :param str competition: The name of the data folder and of the competition. Default is "Synthetic League".
+        :param int num_matches: The number of matches. Default is 500.
+        :param int events_per_match: The approximate number of events in each events feed. Default is 1700, as in the bundled feeds.
+        :param int players_per_squad: The number of players in each squad, starters included. Default is 23.
+        :param int num_teams: The number of teams playing each other. Default is 20.
+        :param int seed: The seed of the random generator. Default is 0.
+        """
+        if num_matches < 1 or events_per_match < 1:
+            raise ValueError("Invalid size. Please provide a positive number of matches and events per match.")
+        if players_per_squad < len(STARTING_POSITIONS):
+            raise ValueError(f"Invalid squad size. Please provide at least {len(STARTING_POSITIONS)} players per squad.")
+        if num_teams < 2:
+            raise ValueError("Invalid number of teams. Please provide at least 2 teams.")
+
+        self.output_root = output_root
+        self.competition = competition
+        self.num_matches = num_matches
+        self.events_per_match = events_per_match
+        self.players_per_squad = players_per_squad
+        self.num_teams = num_teams
+        self.seed = seed
+
+        self.rng = random.Random(seed)
+
+        # Unique Opta-like IDs for events and qualifiers
+        self.next_event_id: int = 2000000000
+        self.next_qualifier_id: int = 3000000000
+
+        # Competition, teams and squads are shared by every match
+        self.competition_info: dict = {
+            "id": self.new_id(),
+            "name": competition,
+            "competitionCode": "SYN",
+            "competitionFormat": "Domestic league",
+            "country": {"id": self.new_id(), "name": "Synthetic"},
+        }
+        self.tournament_calendar: dict = {
+            "id": self.new_id(),
+            "startDate": "2021-01-01Z",
+            "endDate": "2021-12-31Z",
+            "name": "2021",
+        }
+        self.teams: list = [self.new_team(number) for number in range(num_teams)]
+
+    # Random Opta ID
+    # Utility function
+    def new_id(self) -> str:
+        """
+        A utility function to draw a random 25-character ID, in the same alphabet as the Opta IDs.
+
+        :return str: The ID.
+        """
+        return "".join(self.rng.choice(ID_CHARACTERS) for _ in range(25))
+
+    # Create a team and its squad
+    def new_team(self, number: int) -> dict:
+        """
+        Create a team with its squad.
+
+        :param int number: The number of the team, used in its name and code.
+
+        :return dict: The team, with its contestant fields and squad.
+        """
+        code: str = f"T{number:02d}"
+        name: str = f"Team {number:02d}"
+
+        squad: list = []
+        for place in range(self.players_per_squad):
+            first_name: str = f"Player{place + 1:02d}"
+            last_name: str = code
+            player: dict = {
+                "playerId": self.new_id(),
+                "firstName": first_name,
+                "lastName": last_name,
+                "matchName": f"{first_name[0]}. {last_name}",
+                "shirtNumber": place + 1,
+            }
+            if place < len(STARTING_POSITIONS):
+                player["position"], player["positionSide"] = STARTING_POSITIONS[place]
+                player["formationPlace"] = str(place + 1)
+            else:
+                player["position"] = "Substitute"
+                player["subPosition"] = SUBSTITUTE_POSITIONS[place % len(SUBSTITUTE_POSITIONS)]
+                player["formationPlace"] = "0"
+            squad.append(player)
+
+        return {
+            "id": self.new_id(),
+            "name": name,
+            "shortName": name,
+            "officialName": name,
+            "code": code,
+            "country": {"id": self.new_id(), "name": "Synthetic"},
+            "squad": squad,
+            "official": {"id": self.new_id(), "firstName": "Coach", "lastName": code, "type": "manager"},
+        }
+
+    # Next unique event or qualifier ID
+    # Utility function
+    def take_id(self, kind: str) -> int:
+        """
+        A utility function to get the next unique numeric ID.
+
+        :param str kind: "event" or "qualifier".
+
+        :return int: The ID.
+        """
+        if kind == "event":
+            self.next_event_id += 1
+            return self.next_event_id
+
+        self.next_qualifier_id += 1
+        return self.next_qualifier_id
+
+    # Fields shared by the four feeds of a match
+    def match_info(self, number: int, home: dict, away: dict) -> dict:
+        """
+        Build the matchInfo section of a match.
+
+        :param int number: The number of the match.
+        :param dict home: The home team.
+        :param dict away: The away team.
+
+        :return dict: The matchInfo section.
+        """
+        kick_off: dt.datetime = dt.datetime(2021, 1, 1, 12, 0) + dt.timedelta(days=number // 10, hours=number % 10)
+
+        contestants: list = []
+        for team, position in [(home, "home"), (away, "away")]:
+            contestants.append({
+                "id": team["id"],
+                "name": team["name"],
+                "shortName": team["shortName"],
+                "officialName": team["officialName"],
+                "code": team["code"],
+                "position": position,
+                "country": team["country"],
+            })
+
+        return {
+            "id": self.new_id(),
+            "coverageLevel": "13",
+            "date": kick_off.strftime("%Y-%m-%dZ"),
+            "time": kick_off.strftime("%H:%M:%SZ"),
+            "numberOfPeriods": 2,
+            "periodLength": 45,
+            "overtimeLength": 15,
+            "lastUpdated": (kick_off + dt.timedelta(hours=18)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "description": f"{home['name']} vs {away['name']}",
+            "sport": {"id": "289u5typ3vp4ifwh5thalohmq", "name": "Soccer"},
+            "ruleset": {"id": "79plas4983031idr6vw83nuel", "name": "Men"},
+            "competition": self.competition_info,
+            "tournamentCalendar": self.tournament_calendar,
+            "contestant": contestants,
+            "venue": {"id": self.new_id(), "neutral": "no", "longName": f"{home['name']} Stadium", "shortName": f"{home['name']} Stadium"},
+        }
+
+    # Events of a match
+    def match_events(self, match_info: dict, home: dict, away: dict, kick_off: dt.datetime) -> list:
+        """
+        Build the events of a match: team set-ups, period starts and ends and the open-play events in time order.
+
+        :param dict match_info: The matchInfo section.
+        :param dict home: The home team.
+        :param dict away: The away team.
+        :param datetime kick_off: The kick-off time.
+
+        :return: A list of events.
+        """
+        sequence: dict = {home["id"]: 0, away["id"]: 0}
+
+        def event(team: dict, type_id: int, period_id: int, seconds: int, player: dict = None,
+                  x: float = 0.0, y: float = 0.0, outcome: int = 1, qualifiers: list = None) -> dict:
+            sequence[team["id"]] += 1
+            item: dict = {
+                "id": self.take_id("event"),
+                "eventId": sequence[team["id"]],
+                "typeId": type_id,
+                "periodId": period_id,
+                "timeMin": seconds // 60,
+                "timeSec": seconds % 60,
+                "contestantId": team["id"],
+            }
+            if player is not None:
+                item["playerId"] = player["playerId"]
+                item["playerName"] = player["matchName"]
+            item.update({
+                "outcome": outcome,
+                "x": x,
+                "y": y,
+                "timeStamp": (kick_off + dt.timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "lastModified": match_info["lastUpdated"],
+                "qualifier": [
+                    {"id": self.take_id("qualifier"), "qualifierId": qualifier_id, **({"value": value} if value is not None else {})}
+                    for qualifier_id, value in (qualifiers or [])],
+            })
+            return item
+
+        events: list = []
+        # Team set-ups
+        for team in [home, away]:
+            starters: list = team["squad"][:len(STARTING_POSITIONS)]
+            events.append(event(team, 34, 16, 0, qualifiers=[
+                (30, ", ".join(player["playerId"] for player in team["squad"])),
+                (130, "2"),
+                (44, ", ".join("1" if player["position"] == "Goalkeeper" else "2" for player in starters)),
+            ]))
+
+        # Open-play events, spread over two halves of 45 minutes plus stoppage time
+        half_lengths: list = [45 * 60 + self.rng.randint(0, 240), 45 * 60 + self.rng.randint(0, 360)]
+        open_play: int = max(0, self.events_per_match - 8)
+        type_ids: list = list(EVENT_TYPES.keys())
+        weights: list = list(EVENT_TYPES.values())
+
+        for period_id, length in enumerate(half_lengths, start=1):
+            offset: int = 0 if period_id == 1 else 45 * 60
+            for team in [home, away]:
+                events.append(event(team, 32, period_id, offset, qualifiers=[
+                    (127, "Left to Right" if (team is home) == (period_id == 1) else "Right to Left")]))
+
+            period_events: int = open_play // 2 + (open_play % 2 if period_id == 2 else 0)
+            for seconds in sorted(self.rng.randint(offset, offset + length) for _ in range(period_events)):
+                team: dict = home if self.rng.random() < 0.5 else away
+                player: dict = self.rng.choice(team["squad"][:len(STARTING_POSITIONS)])
+                type_id: int = self.rng.choices(type_ids, weights)[0]
+                x: float = round(self.rng.uniform(0, 100), 1)
+                y: float = round(self.rng.uniform(0, 100), 1)
+
+                qualifiers: list = [(56, self.rng.choice(["Back", "Center", "Left", "Right"]))]
+                if type_id == 1:
+                    qualifiers += [(140, str(round(self.rng.uniform(0, 100), 1))), (141, str(round(self.rng.uniform(0, 100), 1))),
+                                   (212, str(round(self.rng.uniform(2, 40), 1))), (213, str(round(self.rng.uniform(0, 6.28), 1)))]
+                elif type_id in SHOT_TYPES:
+                    x = round(self.rng.uniform(70, 100), 1)
+                    qualifiers += [(102, str(round(self.rng.uniform(45, 55), 1))), (103, str(round(self.rng.uniform(0, 40), 1)))]
+
+                events.append(event(team, type_id, period_id, seconds, player, x, y, int(self.rng.random() < 0.8), qualifiers))
+
+            for team in [home, away]:
+                events.append(event(team, 30, period_id, offset + length, qualifiers=[(209, None)]))
+
+        return events
+
+    # Match details shared by the four feeds of a match
+    def match_details(self, match_info: dict, events: list, home: dict, kick_off: dt.datetime) -> dict:
+        """
+        Build the matchDetails section of a match from its events.
+
+        :param dict match_info: The matchInfo section.
+        :param list events: The events of the match.
+        :param dict home: The home team.
+        :param datetime kick_off: The kick-off time.
+
+        :return dict: The matchDetails section.
+        """
+        goals: list = [event for event in events if event["typeId"] == 16]
+        home_goals: int = sum(event["contestantId"] == home["id"] for event in goals)
+        away_goals: int = len(goals) - home_goals
+        first_half: list = [event for event in goals if event["periodId"] == 1]
+        home_ht: int = sum(event["contestantId"] == home["id"] for event in first_half)
+
+        ends: list = [event for event in events if event["typeId"] == 30]
+        periods: list = []
+        for period_id in [1, 2]:
+            end: dict = [event for event in ends if event["periodId"] == period_id][0]
+            start_seconds: int = 0 if period_id == 1 else 45 * 60
+            length: int = end["timeMin"] * 60 + end["timeSec"] - start_seconds
+            periods.append({
+                "id": period_id,
+                "start": (kick_off + dt.timedelta(seconds=start_seconds)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "end": (kick_off + dt.timedelta(seconds=start_seconds + length)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "lengthMin": length // 60,
+                "lengthSec": length % 60,
+            })
+
+        total_seconds: int = sum(period["lengthMin"] * 60 + period["lengthSec"] for period in periods)
+        return {
+            "periodId": 14,
+            "matchStatus": "Played",
+            "winner": "home" if home_goals > away_goals else "away" if away_goals > home_goals else "draw",
+            "matchLengthMin": total_seconds // 60,
+            "matchLengthSec": total_seconds % 60,
+            "period": periods,
+            "scores": {
+                "ht": {"home": home_ht, "away": len(first_half) - home_ht},
+                "ft": {"home": home_goals, "away": away_goals},
+                "total": {"home": home_goals, "away": away_goals},
+            },
+        }
+
+    # Lineup entry of a player, with the fields shared by every feed
+    # Utility function
+    def player_entry(self, player: dict, fields: list) -> dict:
+        """
+        A utility function to copy the fields of a player used by a feed.
+
+        :param dict player: The player of the squad.
+        :param list fields: The fields to copy, when the player has them.
+
+        :return dict: The lineup entry.
+        """
+        return {field: player[field] for field in fields if field in player}
+
+    # Stat list of a player or team
+    # Utility function
+    def stat_list(self, stat_types: list, halves: bool = False) -> list:
+        """
+        A utility function to draw a list of stats.
+
+        :param list stat_types: The stat types to draw.
+        :param bool halves: Whether to add the first and second half values, as in the team stats. Default is False.
+
+        :return: A list of stats.
+        """
+        stats: list = []
+        for stat_type in stat_types:
+            if stat_type.startswith("expected"):
+                first, second = round(self.rng.uniform(0, 1), 4), round(self.rng.uniform(0, 1), 4)
+                value = round(first + second, 4)
+            elif stat_type == "minsPlayed":
+                first, second, value = 45, 45, 90
+            else:
+                first, second = self.rng.randint(0, 40), self.rng.randint(0, 40)
+                value = first + second
+
+            stat: dict = {"fh": str(first), "sh": str(second)} if halves else {}
+            stat.update({"type": stat_type, "value": str(value)})
+            stats.append(stat)
+
+        return stats
+
+    # Write the four feeds of a match
+    def write_match(self, number: int, folder_path: str) -> list:
+        """
+        Build and write the events, pass_matrix, stats and xgoal_stats feeds of a match.
+
+        :param int number: The number of the match.
+        :param str folder_path: The data folder to write to.
+
+        :return: The names of the files written.
+        """
+        # Every team plays every other team in turn
+        home_number: int = number % self.num_teams
+        away_number: int = (home_number + 1 + (number // self.num_teams) % (self.num_teams - 1)) % self.num_teams
+        home, away = self.teams[home_number], self.teams[away_number]
+
+        match_info: dict = self.match_info(number, home, away)
+        kick_off: dt.datetime = dt.datetime.strptime(match_info["date"] + match_info["time"], "%Y-%m-%dZ%H:%M:%SZ")
+        events: list = self.match_events(match_info, home, away, kick_off)
+        match_details: dict = self.match_details(match_info, events, home, kick_off)
+        shots: list = [event for event in events if event["typeId"] in SHOT_TYPES]
+
+        # Stats feed
+        stats_lineup: list = []
+        pass_lineup: list = []
+        xgoal_lineup: list = []
+        for team in [home, away]:
+            squad: list = team["squad"]
+            stats_lineup.append({
+                "contestantId": team["id"],
+                "formationUsed": "442",
+                "player": [dict(self.player_entry(player, [
+                    "playerId", "firstName", "lastName", "matchName", "shirtNumber", "position", "positionSide", "subPosition", "formationPlace"]),
+                    stat=self.stat_list(PLAYER_STATS)) for player in squad],
+                "teamOfficial": team["official"],
+                "stat": self.stat_list(TEAM_STATS, halves=True),
+                "kit": {"id": "1", "colour1": "#FFFFFF", "type": "home" if team is home else "away"},
+            })
+
+            starters: list = squad[:len(STARTING_POSITIONS)]
+            pass_players: list = []
+            for player in starters:
+                entry: dict = self.player_entry(player, [
+                    "playerId", "firstName", "lastName", "matchName", "shirtNumber", "position", "positionSide"])
+                entry.update({
+                    "crossLost": self.rng.randint(0, 3),
+                    "crossSuccess": self.rng.randint(0, 3),
+                    "passLost": self.rng.randint(0, 20),
+                    "passSuccess": self.rng.randint(5, 60),
+                    "x": round(self.rng.uniform(5, 95), 2),
+                    "y": round(self.rng.uniform(5, 95), 2),
+                    "playerPass": [dict(self.player_entry(receiver, ["firstName", "lastName", "matchName", "playerId"]),
+                                        value=self.rng.randint(1, 12))
+                                   for receiver in starters if receiver is not player],
+                })
+                pass_players.append(entry)
+            pass_lineup.append({"contestantId": team["id"], "player": pass_players, "teamOfficial": team["official"]})
+
+            xgoal_lineup.append({
+                "player": [dict(self.player_entry(player, [
+                    "playerId", "firstName", "lastName", "matchName", "shirtNumber", "position", "positionSide"]),
+                    stat=self.stat_list(XGOAL_PLAYER_STATS)) for player in starters],
+                "stat": self.stat_list(XGOAL_TEAM_STATS, halves=True),
+                "contestantId": team["id"],
+                "teamOfficial": team["official"],
+            })
+
+        # Shots with their xG (321) and, when on target, xGOT (322)
+        xgoal_events: list = []
+        for shot in shots:
+            xgoal_shot: dict = {key: value for key, value in shot.items() if key != "qualifier"}
+            xgoal_shot["qualifier"] = list(shot["qualifier"]) + [
+                {"id": self.take_id("qualifier"), "qualifierId": 321, "value": str(round(self.rng.uniform(0.01, 0.8), 4))}]
+            if shot["typeId"] in [15, 16]:
+                xgoal_shot["qualifier"].append(
+                    {"id": self.take_id("qualifier"), "qualifierId": 322, "value": str(round(self.rng.uniform(0.01, 0.95), 4))})
+            xgoal_events.append(xgoal_shot)
+
+        goals: list = [{
+            "contestantId": shot["contestantId"],
+            "periodId": shot["periodId"],
+            "timeMin": shot["timeMin"] + 1,
+            "timeMinSec": f"{shot['timeMin']}:{shot['timeSec']:02d}",
+            "lastUpdated": match_info["lastUpdated"],
+            "timestamp": shot["timeStamp"],
+            "type": "G",
+            "scorerId": shot["playerId"],
+            "scorerName": shot["playerName"],
+            "optaEventId": str(shot["id"]),
+        } for shot in shots if shot["typeId"] == 16]
+
+        substitutes: list = []
+        for team in [home, away]:
+            for place in range(min(3, self.players_per_squad - len(STARTING_POSITIONS))):
+                player_on: dict = team["squad"][len(STARTING_POSITIONS) + place]
+                player_off: dict = team["squad"][len(STARTING_POSITIONS) - 1 - place]
+                substitutes.append({
+                    "contestantId": team["id"],
+                    "periodId": 2,
+                    "timeMin": 60 + 10 * place,
+                    "timeMinSec": f"{59 + 10 * place}:00",
+                    "lastUpdated": match_info["lastUpdated"],
+                    "timestamp": (kick_off + dt.timedelta(minutes=60 + 10 * place)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "playerOnId": player_on["playerId"],
+                    "playerOnName": player_on["matchName"],
+                    "playerOffId": player_off["playerId"],
+                    "playerOffName": player_off["matchName"],
+                    "subReason": "Tactical",
+                })
+
+        stats_live: dict = {"matchDetails": match_details}
+        if goals:
+            stats_live["goal"] = goals
+        stats_live.update({
+            "substitute": substitutes,
+            "lineUp": stats_lineup,
+            "matchDetailsExtra": {"matchOfficial": [{"id": self.new_id(), "type": "Main", "firstName": "Referee", "lastName": "Synthetic"}]},
+        })
+
+        feeds: dict = {
+            "events": {"matchDetails": match_details, "event": events},
+            "pass_matrix": {"matchDetails": match_details, "lineUp": pass_lineup},
+            "stats": stats_live,
+            "xgoal_stats": {"matchDetails": match_details, "lineUp": xgoal_lineup, "event": xgoal_events},
+        }
+
+        files: list = []
+        for feed, live_data in feeds.items():
+            file_name: str = f"{number:05d}_{home['code']}_{away['code']}_{feed}.json"
+            with open(os.path.join(folder_path, file_name), encoding="utf-8", mode="w") as f:
+                json.dump({"matchInfo": match_info, "liveData": live_data}, f, ensure_ascii=False)
+            files.append(file_name)
+
+        return files
+
+    # Write every match
+    def iter_matches(self) -> Generator[list, None, None]:
+        """
+        Write the feeds of every match, one match at a time.
+
+        :return: A generator yielding the names of the files written for each match.
+        """
+        folder_path: str = os.path.join(self.output_root, self.competition)
+        os.makedirs(folder_path, exist_ok=True)
+
+        for number in range(self.num_matches):
+            yield self.write_match(number, folder_path)
+
+    # Write the data folder
+    def generate(self) -> str:
+        """
+        Write the feeds of every match into <output_root>/<competition>/.
+
+        :return str: The path to the data folder.
+        """
+        for _ in self.iter_matches():
+            pass
+
+        return os.path.join(self.output_root, self.competition)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Opta feeds for scaling benchmarks.")
+    parser.add_argument("--output-root", default="synthetic_data/",
+                        help="The directory to write the data folder to. Default is 'synthetic_data/'.")
+    parser.add_argument("--competition", default="Synthetic League",
+                        help="The name of the data folder. Default is 'Synthetic League'.")
+    parser.add_argument("--matches", type=int, default=500,
+                        help="The number of matches. Default is 500.")
+    parser.add_argument("--events-per-match", type=int, default=1700,
+                        help="The approximate number of events per match. Default is 1700.")
+    parser.add_argument("--players-per-squad", type=int, default=23,
+                        help="The number of players per squad. Default is 23.")
+    parser.add_argument("--teams", type=int, default=20,
+                        help="The number of teams. Default is 20.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="The seed of the random generator. Default is 0.")
+    args = parser.parse_args()
+
+    generator = feedGenerator(args.output_root, args.competition, args.matches, args.events_per_match,
+                              args.players_per_squad, args.teams, args.seed)
+    print(f"Wrote {args.matches} matches to {generator.generate()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -92,7 +92,7 @@ create or replace table events (
     eventY float not null,
     timeStamp timestamp_ntz not null,
     qualifiers array not null,
-    primary key(eventId),
+    primary key(matchId, contestantId, eventId),
     foreign key(contestantId) references contestants(contestantId),
     foreign key(matchId) references matches_info(matchId),
     foreign key(playerId) references players(playerId)
@@ -0,0 +1,68 @@
+# This file contains the fixtures shared by the tests
+
+# Necessary imports
+import os
+import sys
+import types
+import pytest
+import importlib
+
+# Root of the repo, so the tests import the scripts as when run from it
+REPO_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Dashboard modules that do not need Streamlit, in the order utils/__init__.py imports them
+DASHBOARD_MODULES: list = ["json_cache", "json_sections", "match_catalog", "event_store", "event_index"]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch) -> str:
+    """
+    Run the test from a temporary copy of the repo layout, sharing the data and the scripts of the repo,
+    so the ingest manifest and checkpoints (.ingest/) are written to the temporary directory.
+
+    :return str: The temporary directory.
+    """
+    os.makedirs(tmp_path / "app" / "dashboard")
+    os.symlink(os.path.join(REPO_ROOT, "app", "dashboard", "data"), tmp_path / "app" / "dashboard" / "data")
+    os.symlink(os.path.join(REPO_ROOT, "scripts"), tmp_path / "scripts")
+    monkeypatch.chdir(tmp_path)
+
+    return str(tmp_path)
+
+
+@pytest.fixture
+def local_provider(workdir):
+    """
+    A session provider backed by a SQLite database of the temporary directory.
+
+    :return sessionProvider: The provider.
+    """
+    from scripts.python.session_pool import sessionProvider
+    from scripts.python.local_session import local_session_factory
+
+    return sessionProvider(session_factory=local_session_factory(os.path.join(workdir, "local.db")))
+
+
+@pytest.fixture(scope="session")
+def dashboard_utils() -> types.ModuleType:
+    """
+    The utils package of the dashboard, with the modules that do not need Streamlit.
+
+    The modules import each other with "from utils import ...", so the package is built as utils/__init__.py
+    builds it, without running the __init__ itself.
+
+    :return types.ModuleType: The utils package.
+    """
+    package = types.ModuleType("utils")
+    package.__path__ = [os.path.join(REPO_ROOT, "app", "dashboard", "utils")]
+    sys.modules["utils"] = package
+
+    for name in DASHBOARD_MODULES:
+        module = importlib.import_module("utils." + name)
+        for key, value in vars(module).items():
+            if not key.startswith("_"):
+                setattr(package, key, value)
+
+    return package
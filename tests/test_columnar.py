@@ -0,0 +1,44 @@
+# This file contains the tests of the column buffers dropping repeated primary keys
+
+# Necessary imports
+from scripts.python.columnar import columnBuilder
+from scripts.python.convert_json import converter
+
+EVENT_KEY: list = ["matchId", "contestantId", "eventId"]
+
+
+def test_rows_are_deduplicated_on_the_whole_key():
+    builder = columnBuilder(["matchId", "contestantId", "eventId", "typeId"], key_columns=EVENT_KEY)
+    builder.extend_rows([
+        {"matchId": "m1", "contestantId": "home", "eventId": 1, "typeId": 1},
+        # Opta numbers the events of each team separately, so this is another event
+        {"matchId": "m1", "contestantId": "away", "eventId": 1, "typeId": 16},
+        # Repeated event, the first occurrence is kept
+        {"matchId": "m1", "contestantId": "home", "eventId": 1, "typeId": 5},
+        {"matchId": "m2", "contestantId": "home", "eventId": 1, "typeId": 1},
+    ])
+
+    df = builder.to_df()
+    assert list(zip(df["contestantId"], df["eventId"], df["typeId"])) == [("home", 1, 1), ("away", 1, 16), ("home", 1, 1)]
+    assert list(df["matchId"]) == ["m1", "m1", "m2"]
+    assert builder.num_duplicates == 1
+
+
+def test_keys_are_shared_across_builders():
+    seen_keys: set = set()
+    first = columnBuilder(["matchId", "contestantId", "eventId"], key_columns=EVENT_KEY, seen_keys=seen_keys)
+    second = columnBuilder(["matchId", "contestantId", "eventId"], key_columns=EVENT_KEY, seen_keys=seen_keys)
+
+    first.append_file({"matchId": "m1", "contestantId": "home", "eventId": [1, 2]}, 2)
+    second.append_file({"matchId": "m1", "contestantId": ["home", "away"], "eventId": [2, 2]}, 2)
+
+    assert len(first.to_df()) == 2
+    assert second.to_df().to_dict("list") == {"matchId": ["m1"], "contestantId": ["away"], "eventId": [2]}
+
+
+def test_events_keep_every_team_event(workdir):
+    df = converter("AFF Cup 2020").json_to_df("events")
+
+    assert not df.duplicated(EVENT_KEY).any()
+    # Keyed on (matchId, eventId) alone, the events of one of the teams would be dropped
+    assert df.duplicated(["matchId", "eventId"]).any()
@@ -0,0 +1,47 @@
+# This file contains the tests of the conversion of the JSON files
+
+# Necessary imports
+import pytest
+import pandas as pd
+
+from scripts.python.convert_json import converter
+
+
+def test_json_to_df_rejects_the_stats_feed(workdir):
+    with pytest.raises(ValueError, match="Invalid file type"):
+        converter("AFF Cup 2020").json_to_df("stats")
+
+
+def test_json_to_df_converts_every_file_type(workdir):
+    conv = converter("AFF Cup 2020")
+    for file_type in ["pass_matrix", "xgoal_stats", "competitions", "contestants", "matches", "match_details", "players"]:
+        df = conv.json_to_df(file_type)
+        assert list(df.columns) == conv.mapping(file_type, which_way="left")
+        assert len(df) > 0
+
+
+def test_json_to_df_events_matches_the_streamed_batches(workdir):
+    conv = converter("AFF Cup 2020")
+    df = conv.json_to_df("events")
+
+    pd.testing.assert_frame_equal(df, pd.concat(list(conv.iter_events()), ignore_index=True))
+    pd.testing.assert_frame_equal(df, conv.json_to_df("events", workers=2))
+
+
+def test_qualifiers_join_their_event(workdir):
+    conv = converter("AFF Cup 2020")
+    tables = conv.event_tables()
+    events, qualifiers = tables["events"], tables["qualifiers"]
+    key = ["matchId", "contestantId", "eventId"]
+
+    # Every qualifier belongs to exactly one event
+    joined = qualifiers.merge(events[key], on=key, how="left", indicator=True, validate="many_to_one")
+    assert (joined["_merge"] == "both").all()
+
+    # The pivoted values are the ones of the event's own qualifier list
+    expected = {
+        (event["matchId"], event["contestantId"], event["eventId"]): qualifier["value"]
+        for _, event in conv.json_to_df("events").iterrows()
+        for qualifier in event["qualifiers"] or [] if qualifier["qualifierId"] == 140}
+    pivoted = conv.pivot_qualifiers(qualifiers, [140], numeric=False)
+    assert pivoted[140].dropna().to_dict() == expected
@@ -0,0 +1,37 @@
+# This file contains the tests of the event index of the dashboard
+
+# Necessary imports
+import json
+
+
+# Utility function
+def write_events(directory, jsonFile: str, events: list):
+    with open(directory / jsonFile, "w", encoding="utf-8") as f:
+        json.dump({"matchInfo": {"id": jsonFile}, "liveData": {"event": events}}, f)
+
+
+def test_find_orders_by_file_then_event(dashboard_utils, tmp_path):
+    directory = tmp_path / "Competition"
+    directory.mkdir()
+    write_events(directory, "B_events.json", [
+        {"eventId": 1, "typeId": 16, "playerId": "p1"},
+        {"eventId": 2, "typeId": 1, "playerId": "p2"},
+        {"eventId": 3, "typeId": 1, "playerId": "p1"},
+        {"eventId": 4, "typeId": 16, "playerId": "p1"},
+    ])
+    write_events(directory, "A_events.json", [
+        {"eventId": 1, "typeId": 1, "playerId": "p1"},
+        {"eventId": 2, "typeId": 13, "playerId": "p1"},
+        {"eventId": 3, "typeId": 16, "playerId": "p1"},
+    ])
+
+    # The matches come in the order of the files given, not in alphabetical order
+    index = dashboard_utils.eventIndex(str(directory) + "/", ["B_events.json", "A_events.json"]).load()
+    found = index.find("p1", [16, 1])
+
+    assert [store.jsonFile for store, _ in found] == ["B_events.json", "A_events.json"]
+    # The rows of both types are merged in event order
+    assert [list(store.events["eventId"][rows]) for store, rows in found] == [[1, 3, 4], [1, 3]]
+
+    assert index.find("p2", [16]) == []
+    assert index.find("unknown", [1]) == []
@@ -0,0 +1,71 @@
+# This file contains the tests of the injection of the data into the tables
+
+# Necessary imports
+import os
+import pytest
+
+from scripts.python.snowflake import SnowflakeConnector
+from scripts.python.convert_json import converter
+
+
+# Utility function
+def count_rows(provider, tables: list) -> dict:
+    with provider.session() as session:
+        return {table: session.sql(f"select count(*) from {table}").collect()[0][0] for table in tables}
+
+
+def test_facts_loaded_after_dimension_only_run(local_provider):
+    # A run without the fact tables must not mark the files as fully ingested
+    connector = SnowflakeConnector(local_provider)
+    connector.inject_data(facts=False)
+    assert count_rows(local_provider, ["players", "events", "matches_info"]) == {
+        "players": 0, "events": 0, "matches_info": 16}
+
+    connector.inject_data()
+    assert count_rows(local_provider, ["players", "events", "pass_matrix", "player_stats", "matches_info"]) == {
+        "players": 308, "events": 26718, "pass_matrix": 502, "player_stats": 726, "matches_info": 16}
+
+
+def test_plan_counts_the_rows_loaded(local_provider):
+    # A row repeated in several batches, e.g. a player of several matches, is planned once
+    connector = SnowflakeConnector(local_provider)
+    plan = connector.plan_data()
+
+    connector.inject_data()
+    loaded = count_rows(local_provider, list(plan.index))
+    assert plan["rows_to_load"].to_dict() == loaded
+    assert loaded["players"] == 308
+
+
+def test_interrupted_run_resumes_from_the_checkpoints(local_provider, monkeypatch):
+    connector = SnowflakeConnector(local_provider)
+    bulk_load = connector.bulk_load
+    loads = []
+    failures = []
+
+    # Fail once, while loading the events of the second batch
+    def failing_load(session, table, data):
+        if table == "events" and loads.count("events") == 1 and not failures:
+            failures.append(table)
+            raise RuntimeError("Connection lost.")
+        bulk_load(session, table, data)
+        loads.append(table)
+
+    monkeypatch.setattr(connector, "bulk_load", failing_load)
+    with pytest.raises(RuntimeError):
+        connector.inject_data(batch_matches=4)
+    assert os.path.exists(".ingest/checkpoints.json")
+    assert not os.path.exists(".ingest/manifest.json")
+
+    # The dimension tables and the first batch are not loaded again
+    first_run = list(loads)
+    loads.clear()
+    connector.inject_data(batch_matches=4)
+    assert "matches_info" in first_run and "matches_info" not in loads
+    # Every batch of events is loaded exactly once over the two runs
+    batches = sum(-(-len(converter(folder).match_files()) // 4) for folder in ["2022 World Cup Asian Qualifiers", "AFF Cup 2020"])
+    assert first_run.count("events") + loads.count("events") == batches
+
+    assert not os.path.exists(".ingest/checkpoints.json")
+    assert count_rows(local_provider, ["players", "events", "pass_matrix", "player_stats", "matches_info"]) == {
+        "players": 308, "events": 26718, "pass_matrix": 502, "player_stats": 726, "matches_info": 16}
@@ -0,0 +1,44 @@
+# This file contains the tests of the JSON cache of the dashboard
+
+# Necessary imports
+import json
+import time
+import pytest
+import threading
+
+
+def test_concurrent_sessions_parse_a_file_once(dashboard_utils, tmp_path):
+    path = tmp_path / "match.json"
+    path.write_text(json.dumps({"matchInfo": {"id": "m1"}}), encoding="utf-8")
+    calls = []
+
+    def loader(file_path: str) -> dict:
+        calls.append(file_path)
+        time.sleep(0.05)
+        return dashboard_utils.load_json_file(file_path)
+
+    cache = dashboard_utils.jsonCache()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(str(path), loader))) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"matchInfo": {"id": "m1"}}] * 16
+    assert cache._loading == {}
+
+
+def test_failed_parse_is_not_cached(dashboard_utils, tmp_path):
+    path = tmp_path / "match.json"
+    path.write_text("{", encoding="utf-8")
+
+    cache = dashboard_utils.jsonCache()
+    with pytest.raises(ValueError):
+        cache.get(str(path))
+    assert cache._loading == {}
+
+    # The file is parsed again once fixed
+    path.write_text("{}", encoding="utf-8")
+    assert cache.get(str(path)) == {}
@@ -0,0 +1,73 @@
+# This file contains the tests of the reader decoding only some sections of a JSON file
+
+# Necessary imports
+import os
+import glob
+import json
+import pytest
+
+from scripts.python.stream_json import jsonStreamer
+
+# Data folders bundled with the dashboard
+DATA_ROOT: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "dashboard", "data")
+
+# Documents with values that straddle the chunks: escaped quotes, brackets in strings, long numbers, nested sections
+DOCUMENTS: list = [
+    {"matchInfo": {"id": "m1", "description": "A \"quoted\" {not} [an] object"},
+     "liveData": {"matchDetails": {"scores": {"total": {"home": 3, "away": 1}}}, "event": [{"x": 12345.6789}] * 20}},
+    {"liveData": {"event": [{"qualifier": [{"value": "}]\\\\"}]}], "lineUp": [], "matchDetails": {"periodId": 14}},
+     "matchInfo": {"id": "m2", "contestant": [{"id": "c1"}, {"id": "c2"}]}},
+    {"matchInfo": {"id": "m3"}, "liveData": 1234567890123},
+    {},
+]
+
+SECTIONS: list = [
+    ["matchInfo", "liveData.matchDetails"],
+    ["liveData.lineUp", "missing", "liveData.missing"],
+    ["matchInfo.contestant", "matchInfo.id"],
+]
+
+
+# Utility function
+def expected_sections(document: dict, sections: list) -> dict:
+    expected: dict = {}
+    for section in sections:
+        *parents, key = section.split(".")
+        node = document
+        for parent in parents:
+            node = node.get(parent) if isinstance(node, dict) else None
+        if isinstance(node, dict) and key in node:
+            target = expected
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[key] = node[key]
+
+    return expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 65536])
+def test_readers_match_json_load(dashboard_utils, tmp_path, chunk_size):
+    for number, document in enumerate(DOCUMENTS):
+        path = tmp_path / f"{number}.json"
+        path.write_text(json.dumps(document, indent=number), encoding="utf-8")
+
+        for sections in SECTIONS:
+            expected = expected_sections(document, sections)
+            assert dashboard_utils.read_json_sections(str(path), sections, chunk_size) == expected
+            assert jsonStreamer(str(path), chunk_size=chunk_size).read_sections(sections) == expected
+
+            # Every key of the walked objects is collected when reading does not stop early
+            streamer = jsonStreamer(str(path), chunk_size=chunk_size)
+            assert streamer.read_sections(sections, stop_early=False) == expected
+            assert streamer.keys[""] == list(document)
+
+
+def test_readers_match_on_the_bundled_files(dashboard_utils):
+    for path in sorted(glob.glob(os.path.join(DATA_ROOT, "*", "*.json")))[:8]:
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+
+        sections = ["matchInfo", "liveData.matchDetails"]
+        expected = expected_sections(document, sections)
+        assert dashboard_utils.read_json_sections(path, sections) == expected
+        assert jsonStreamer(path).read_sections(sections) == expected
@@ -0,0 +1,71 @@
+# This file contains the tests of the ingest manifest
+
+# Necessary imports
+import os
+
+from scripts.python.manifest import ingestManifest
+
+
+# Utility function
+def new_manifest(tmp_path) -> ingestManifest:
+    return ingestManifest(str(tmp_path / ".ingest" / "manifest.json"), str(tmp_path / "data"))
+
+
+def test_changed_files(tmp_path):
+    folder = tmp_path / "data" / "Competition"
+    folder.mkdir(parents=True)
+    for name in ["a_stats.json", "b_stats.json"]:
+        (folder / name).write_text('{"id": 1}', encoding="utf-8")
+
+    manifest = new_manifest(tmp_path)
+    assert manifest.changed_files("Competition", ["a_stats.json", "b_stats.json"]) == ["a_stats.json", "b_stats.json"]
+
+    manifest.record("Competition", "a_stats.json", {"matches_info": 1})
+    manifest.record("Competition", "b_stats.json", {"matches_info": 1})
+    manifest.save()
+
+    # The manifest is read back by the next run
+    manifest = new_manifest(tmp_path)
+    assert manifest.changed_files("Competition", ["a_stats.json", "b_stats.json"]) == []
+    assert manifest.entries["Competition/a_stats.json"]["tables"] == {"matches_info": 1}
+
+    # Touched with the same contents: not changed, and the new modification time is remembered
+    os.utime(folder / "a_stats.json", ns=(1, 1))
+    assert not manifest.has_changed("Competition", "a_stats.json")
+    assert manifest.entries["Competition/a_stats.json"]["mtime_ns"] == 1
+
+    # Same size, other contents
+    (folder / "a_stats.json").write_text('{"id": 2}', encoding="utf-8")
+    os.utime(folder / "a_stats.json", ns=(2, 2))
+    assert manifest.has_changed("Competition", "a_stats.json")
+
+    # Other size
+    (folder / "b_stats.json").write_text('{"id": 10}', encoding="utf-8")
+    assert manifest.has_changed("Competition", "b_stats.json")
+
+
+def test_files_recorded_without_facts(tmp_path):
+    folder = tmp_path / "data" / "Competition"
+    folder.mkdir(parents=True)
+    (folder / "a_stats.json").write_text("{}", encoding="utf-8")
+
+    manifest = new_manifest(tmp_path)
+    manifest.record("Competition", "a_stats.json", {"matches_info": 1}, facts=False)
+
+    assert manifest.changed_files("Competition", ["a_stats.json"]) == []
+    assert manifest.changed_files("Competition", ["a_stats.json"], facts=True) == ["a_stats.json"]
+
+
+def test_prune(tmp_path):
+    folder = tmp_path / "data" / "Competition"
+    folder.mkdir(parents=True)
+    for name in ["a_stats.json", "b_stats.json"]:
+        (folder / name).write_text("{}", encoding="utf-8")
+
+    manifest = new_manifest(tmp_path)
+    for name in ["a_stats.json", "b_stats.json"]:
+        manifest.record("Competition", name, {})
+    manifest.entries["Other/a_stats.json"] = manifest.entries["Competition/a_stats.json"]
+
+    manifest.prune("Competition", ["b_stats.json"])
+    assert sorted(manifest.entries) == ["Competition/b_stats.json", "Other/a_stats.json"]